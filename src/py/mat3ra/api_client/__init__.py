@@ -1,18 +1,79 @@
+import importlib
+from typing import TYPE_CHECKING
+
 try:
     from ._version import version as __version__
 except ModuleNotFoundError:
     __version__ = None
 
-from .client import APIClient
 from .constants import ACCESS_TOKEN_ENV_VAR, CLIENT_ID, SCOPE, build_oidc_base_url
-from .models import Account, APIEnv, AuthContext, AuthEnv
-from .endpoints.bank_materials import BankMaterialEndpoints
-from .endpoints.bank_workflows import BankWorkflowEndpoints
-from .endpoints.jobs import JobEndpoints
-from .endpoints.login import LoginEndpoint
-from .endpoints.logout import LogoutEndpoint
-from .endpoints.materials import MaterialEndpoints
-from .endpoints.metaproperties import MetaPropertiesEndpoints
-from .endpoints.projects import ProjectEndpoints
-from .endpoints.properties import PropertiesEndpoints
-from .endpoints.workflows import WorkflowEndpoints
+
+# Imported on first access (PEP 562) to keep `import mat3ra.api_client` cheap.
+_LAZY_IMPORTS = {
+    "AsyncAPIClient": ".async_client",
+    "APIClient": ".client",
+    "Account": ".models",
+    "APIEnv": ".models",
+    "AuthContext": ".models",
+    "AuthEnv": ".models",
+    "BankMaterialEndpoints": ".endpoints.bank_materials",
+    "BankWorkflowEndpoints": ".endpoints.bank_workflows",
+    "JobEndpoints": ".endpoints.jobs",
+    "LoginEndpoint": ".endpoints.login",
+    "LogoutEndpoint": ".endpoints.logout",
+    "MaterialEndpoints": ".endpoints.materials",
+    "MetaPropertiesEndpoints": ".endpoints.metaproperties",
+    "ProjectEndpoints": ".endpoints.projects",
+    "PropertiesEndpoints": ".endpoints.properties",
+    "WorkflowEndpoints": ".endpoints.workflows",
+}
+
+__all__ = [
+    "ACCESS_TOKEN_ENV_VAR",
+    "CLIENT_ID",
+    "SCOPE",
+    "build_oidc_base_url",
+    "AsyncAPIClient",
+    "APIClient",
+    "Account",
+    "APIEnv",
+    "AuthContext",
+    "AuthEnv",
+    "BankMaterialEndpoints",
+    "BankWorkflowEndpoints",
+    "JobEndpoints",
+    "LoginEndpoint",
+    "LogoutEndpoint",
+    "MaterialEndpoints",
+    "MetaPropertiesEndpoints",
+    "ProjectEndpoints",
+    "PropertiesEndpoints",
+    "WorkflowEndpoints",
+]
+
+if TYPE_CHECKING:
+    from .async_client import AsyncAPIClient
+    from .client import APIClient
+    from .endpoints.bank_materials import BankMaterialEndpoints
+    from .endpoints.bank_workflows import BankWorkflowEndpoints
+    from .endpoints.jobs import JobEndpoints
+    from .endpoints.login import LoginEndpoint
+    from .endpoints.logout import LogoutEndpoint
+    from .endpoints.materials import MaterialEndpoints
+    from .endpoints.metaproperties import MetaPropertiesEndpoints
+    from .endpoints.projects import ProjectEndpoints
+    from .endpoints.properties import PropertiesEndpoints
+    from .endpoints.workflows import WorkflowEndpoints
+    from .models import Account, APIEnv, AuthContext, AuthEnv
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any, Tuple, Union
+
+from .client import APIClient, _LazyEndpoint
+from .utils.http import BaseConnection
+from .utils.http_async import DEFAULT_MAX_CONCURRENCY, create_async_http_client
+
+
+class AsyncAPIClient(APIClient):
+    """
+    API client with awaitable endpoints sharing one non-blocking HTTP client.
+
+    At most `max_concurrency` requests are in flight at any time across all endpoints. The client is bound to the
+    event loop it is first used in and should be closed with `aclose()` or used as an async context manager.
+    Its `transport`, if set, is an `httpx.AsyncBaseTransport`, e.g. one returned by
+    `mat3ra.api_client.testing.create_async_transport`.
+    """
+
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+
+    materials = _LazyEndpoint(".endpoints.aio.materials", "AsyncMaterialEndpoints")
+    workflows = _LazyEndpoint(".endpoints.aio.workflows", "AsyncWorkflowEndpoints")
+    jobs = _LazyEndpoint(".endpoints.aio.jobs", "AsyncJobEndpoints")
+    projects = _LazyEndpoint(".endpoints.aio.projects", "AsyncProjectEndpoints")
+    properties = _LazyEndpoint(".endpoints.aio.properties", "AsyncPropertiesEndpoints")
+    metaproperties = _LazyEndpoint(".endpoints.aio.metaproperties", "AsyncMetaPropertiesEndpoints")
+    bank_materials = _LazyEndpoint(".endpoints.aio.bank_materials", "AsyncBankMaterialEndpoints")
+    bank_workflows = _LazyEndpoint(".endpoints.aio.bank_workflows", "AsyncBankWorkflowEndpoints")
+    clusters = _LazyEndpoint(".endpoints.aio.clusters", "AsyncClustersEndpoint")
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes keep-alive connections shared by all endpoints."""
+        await self._http_client.aclose()
+        self.close()
+
+    @property
+    def _profile_connection(self) -> BaseConnection:
+        # the user profile is fetched synchronously, so an asynchronous transport cannot be used for it
+        return BaseConnection(pool=self._pool, retry_policy=self.retry_policy, timeout=self.request_timeout)
+
+    def _init_endpoints(self, timeout_seconds: Union[float, Tuple[float, float]]) -> None:
+        self._http_client = create_async_http_client(
+            max_connections=self.pool_maxsize,
+            keepalive_expiry=self.pool_idle_timeout_seconds,
+            timeout=timeout_seconds,
+            transport=self.transport,
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._endpoint_args = (self.host, self.port, self.auth.account_id or "", self.auth.auth_token or "")
+        self._endpoint_kwargs: dict[str, Any] = {
+            "version": self.version,
+            "secure": self.secure,
+            "timeout": timeout_seconds,
+            "auth": self.auth,
+            "http_client": self._http_client,
+            "semaphore": self._semaphore,
+            "retry_policy": self.retry_policy,
+            "cache": self.response_cache,
+            "json_backend": self.json_backend,
+            "compress_min_size": self.compress_min_size,
+        }
@@ -1,38 +1,136 @@
+import importlib
 import os
 import re
-from typing import Any, List, Optional, Tuple
+import threading
+import time
+from typing import Any, List, Literal, Optional, Tuple, Union
 
-import requests
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from .constants import ACCESS_TOKEN_ENV_VAR, _build_base_url
-from .endpoints.bank_materials import BankMaterialEndpoints
-from .endpoints.bank_workflows import BankWorkflowEndpoints
-from .endpoints.clusters import ClustersEndpoint
-from .endpoints.jobs import JobEndpoints
-from .endpoints.materials import MaterialEndpoints
-from .endpoints.metaproperties import MetaPropertiesEndpoints
-from .endpoints.projects import ProjectEndpoints
-from .endpoints.properties import PropertiesEndpoints
-from .endpoints.workflows import WorkflowEndpoints
 from .models import Account, APIEnv, AuthContext, AuthEnv
+from .utils.http import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, BaseConnection, RetryPolicy, SessionPool
+
+# upper bound of the /users/me request timeout, which is otherwise the client timeout
+PROFILE_TIMEOUT_SECONDS = 30
+# default of `APIClient.authenticate(retry_policy=...)` standing for a new default policy, as None disables retries
+_DEFAULT_RETRY_POLICY: Any = object()
+
+
+class _LazyEndpoint:
+    """
+    Endpoint attribute of a client, created on first access and reused afterwards. The endpoint module is imported
+    on first access too, so that importing and creating clients does not import every endpoint.
+    """
+
+    def __init__(self, module: str, class_name: str) -> None:
+        self.module = module
+        self.class_name = class_name
+
+    @property
+    def endpoint_class(self) -> type:
+        return getattr(importlib.import_module(self.module, __package__), self.class_name)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, client: Optional["APIClient"], owner: type) -> Any:
+        if client is None:
+            return self
+        endpoint = client.__dict__.get(self.name)
+        if endpoint is None:
+            client._reset_after_fork()
+            with client._endpoint_lock:
+                if self.name not in client.__dict__:
+                    client.__dict__[self.name] = self.endpoint_class(*client._endpoint_args, **client._endpoint_kwargs)
+                endpoint = client.__dict__[self.name]
+        return endpoint
+
+    def __set__(self, client: "APIClient", endpoint: Any) -> None:
+        client.__dict__[self.name] = endpoint
 
 
 class APIClient(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow", validate_assignment=True)
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, extra="allow", validate_assignment=True, ignored_types=(_LazyEndpoint,)
+    )
 
     host: str
     port: int
     version: str
     secure: bool
     auth: AuthContext
-    timeout_seconds: int = 60
+    timeout_seconds: float = 60
+    connect_timeout_seconds: Optional[float] = None
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    pool_idle_timeout_seconds: Optional[float] = None
+    retry_policy: Optional[RetryPolicy] = Field(default_factory=RetryPolicy)
+    response_cache_size: Optional[int] = None
+    cache_dir: Optional[str] = None
+    profile_ttl_seconds: Optional[float] = None
+    json_backend: Literal["json", "orjson"] = "json"
+    compress_min_size: Optional[int] = None
+    # sends requests in place of the HTTP session, e.g. `mat3ra.api_client.testing.FakeTransport`
+    transport: Optional[Any] = None
+
+    materials = _LazyEndpoint(".endpoints.materials", "MaterialEndpoints")
+    workflows = _LazyEndpoint(".endpoints.workflows", "WorkflowEndpoints")
+    jobs = _LazyEndpoint(".endpoints.jobs", "JobEndpoints")
+    projects = _LazyEndpoint(".endpoints.projects", "ProjectEndpoints")
+    properties = _LazyEndpoint(".endpoints.properties", "PropertiesEndpoints")
+    metaproperties = _LazyEndpoint(".endpoints.metaproperties", "MetaPropertiesEndpoints")
+    bank_materials = _LazyEndpoint(".endpoints.bank_materials", "BankMaterialEndpoints")
+    bank_workflows = _LazyEndpoint(".endpoints.bank_workflows", "BankWorkflowEndpoints")
+    clusters = _LazyEndpoint(".endpoints.clusters", "ClustersEndpoint")
 
     def model_post_init(self, __context: Any) -> None:
         self.my_account = Account(client=self)
         self.account = self.my_account
         self._my_organization: Optional[Account] = None
-        self._init_endpoints(self.timeout_seconds)
+        self._profile: Optional[dict] = None
+        self._profile_fetched_at = 0.0
+        self._profile_lock = threading.Lock()
+        self._endpoint_lock = threading.Lock()
+        self._pid = os.getpid()
+        self._pool = SessionPool(self.pool_connections, self.pool_maxsize, self.pool_idle_timeout_seconds)
+        self.response_cache = None
+        if self.response_cache_size:
+            from .utils.cache import ResponseCache
+
+            self.response_cache = ResponseCache(self.response_cache_size)
+        self.disk_cache = None
+        if self.cache_dir:
+            from .utils.disk_cache import DiskCache
+
+            self.disk_cache = DiskCache(self.cache_dir)
+        self._init_endpoints(self.request_timeout)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # pydantic would store assigned endpoints as extra fields, which attribute lookups never reach
+        if isinstance(getattr(type(self), name, None), _LazyEndpoint):
+            getattr(type(self), name).__set__(self, value)
+            return
+        super(APIClient, self).__setattr__(name, value)
+
+    def __getstate__(self) -> dict:
+        # connections, caches and endpoints are not pickled, they are created again from the configuration
+        return {name: getattr(self, name) for name in type(self).model_fields}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes keep-alive connections shared by all endpoints and the on-disk cache."""
+        self._pool.close()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
 
     @property
     def my_organization(self) -> Optional[Account]:
@@ -40,6 +138,13 @@ class APIClient(BaseModel):
             self._my_organization = self.get_default_organization()
         return self._my_organization
 
+    @property
+    def request_timeout(self) -> Union[float, Tuple[float, float]]:
+        """Per-request timeout: a (connect, read) tuple if a connect timeout is set, otherwise a single value."""
+        if self.connect_timeout_seconds is None:
+            return self.timeout_seconds
+        return self.connect_timeout_seconds, self.timeout_seconds
+
     @classmethod
     def env(cls) -> APIEnv:
         return APIEnv.from_env()
@@ -48,19 +153,22 @@ class APIClient(BaseModel):
     def auth_env(cls) -> AuthEnv:
         return AuthEnv.from_env()
 
-    def _init_endpoints(self, timeout_seconds: int) -> None:
-        base_args = (self.host, self.port, self.auth.account_id or "", self.auth.auth_token or "")
-        base_kwargs = {"version": self.version, "secure": self.secure, "timeout": timeout_seconds, "auth": self.auth}
-
-        self.materials = MaterialEndpoints(*base_args, **base_kwargs)
-        self.workflows = WorkflowEndpoints(*base_args, **base_kwargs)
-        self.jobs = JobEndpoints(*base_args, **base_kwargs)
-        self.projects = ProjectEndpoints(*base_args, **base_kwargs)
-        self.properties = PropertiesEndpoints(*base_args, **base_kwargs)
-        self.metaproperties = MetaPropertiesEndpoints(*base_args, **base_kwargs)
-        self.bank_materials = BankMaterialEndpoints(*base_args, **base_kwargs)
-        self.bank_workflows = BankWorkflowEndpoints(*base_args, **base_kwargs)
-        self.clusters = ClustersEndpoint(*base_args, **base_kwargs)
+    def _init_endpoints(self, timeout_seconds: Union[float, Tuple[float, float]]) -> None:
+        """Prepares endpoint options. Endpoints are created on first access."""
+        self._endpoint_args = (self.host, self.port, self.auth.account_id or "", self.auth.auth_token or "")
+        self._endpoint_kwargs = {
+            "version": self.version,
+            "secure": self.secure,
+            "timeout": timeout_seconds,
+            "auth": self.auth,
+            "pool": self._pool,
+            "retry_policy": self.retry_policy,
+            "cache": self.response_cache,
+            "disk_cache": self.disk_cache,
+            "json_backend": self.json_backend,
+            "compress_min_size": self.compress_min_size,
+            "transport": self.transport,
+        }
 
     @staticmethod
     def _resolve_config(
@@ -111,7 +219,19 @@ class APIClient(BaseModel):
             access_token: Optional[str] = None,
             account_id: Optional[str] = None,
             auth_token: Optional[str] = None,
-            timeout_seconds: int = 60,
+            timeout_seconds: float = 60,
+            connect_timeout_seconds: Optional[float] = None,
+            pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+            pool_idle_timeout_seconds: Optional[float] = None,
+            retry_policy: Optional[RetryPolicy] = _DEFAULT_RETRY_POLICY,
+            response_cache_size: Optional[int] = None,
+            cache_dir: Optional[str] = None,
+            profile_ttl_seconds: Optional[float] = None,
+            json_backend: Literal["json", "orjson"] = "json",
+            compress_min_size: Optional[int] = None,
+            transport: Optional[Any] = None,
+            **kwargs: Any,
     ) -> "APIClient":
         host_value, port_value, version_value, secure_value = cls._resolve_config(
             host, port, version, secure, cls.env()
@@ -125,17 +245,65 @@ class APIClient(BaseModel):
             secure=secure_value,
             auth=auth,
             timeout_seconds=timeout_seconds,
+            connect_timeout_seconds=connect_timeout_seconds,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_idle_timeout_seconds=pool_idle_timeout_seconds,
+            retry_policy=RetryPolicy() if retry_policy is _DEFAULT_RETRY_POLICY else retry_policy,
+            response_cache_size=response_cache_size,
+            cache_dir=cache_dir,
+            profile_ttl_seconds=profile_ttl_seconds,
+            json_backend=json_backend,
+            compress_min_size=compress_min_size,
+            transport=transport,
+            **kwargs,
         )
 
+    def _is_profile_fresh(self) -> bool:
+        if self._profile is None:
+            return False
+        if self.profile_ttl_seconds is None:
+            return True
+        return time.monotonic() - self._profile_fetched_at < self.profile_ttl_seconds
+
+    @property
+    def _profile_connection(self) -> BaseConnection:
+        read_timeout = min(self.timeout_seconds, PROFILE_TIMEOUT_SECONDS)
+        timeout = read_timeout if self.connect_timeout_seconds is None else (self.connect_timeout_seconds, read_timeout)
+        return BaseConnection(pool=self._pool, retry_policy=self.retry_policy, timeout=timeout,
+                              transport=self.transport)
+
+    def _reset_after_fork(self) -> None:
+        if self._pid != os.getpid():
+            # locks may have been held by other threads of the parent process when it forked
+            self._profile_lock = threading.Lock()
+            self._endpoint_lock = threading.Lock()
+            self._pid = os.getpid()
+
     def _fetch_data(self) -> dict:
-        access_token = self.auth.access_token or os.environ.get(ACCESS_TOKEN_ENV_VAR)
-        if not access_token:
-            raise ValueError("Access token is required to fetch user data")
-
-        url = _build_base_url(self.host, self.port, self.secure, "/api/v1/users/me")
-        response = requests.get(url, headers={"Authorization": f"Bearer {access_token}"}, timeout=30)
-        response.raise_for_status()
-        return response.json()["data"]
+        """Returns the user profile from /users/me, fetched once and reused until it expires or is refreshed."""
+        self._reset_after_fork()
+        with self._profile_lock:
+            if not self._is_profile_fresh():
+                access_token = self.auth.access_token or os.environ.get(ACCESS_TOKEN_ENV_VAR)
+                if not access_token:
+                    raise ValueError("Access token is required to fetch user data")
+
+                url = _build_base_url(self.host, self.port, self.secure, "/api/v1/users/me")
+                response = self._profile_connection.request(
+                    "GET", url, headers={"Authorization": f"Bearer {access_token}"}
+                )
+                self._profile = response.json()["data"]
+                self._profile_fetched_at = time.monotonic()
+            return self._profile
+
+    def refresh(self) -> dict:
+        """Fetches the user profile again, e.g. after accounts or organizations changed, and returns it."""
+        self._reset_after_fork()
+        with self._profile_lock:
+            self._profile = None
+            self._my_organization = None
+        return self._fetch_data()
 
     def _fetch_user_accounts(self) -> List[dict]:
         return self._fetch_data().get("accounts", [])
@@ -1,6 +1,12 @@
+import hashlib
 import json  # noqa: F401
 
 from ..utils.http import Connection
+from ..utils.json_backends import DEFAULT_JSON_BACKEND, get_json_loads
+from ..utils.streaming import DEFAULT_STREAM_CHUNK_SIZE, JSENDStreamParser, iter_jsend_data
+
+HTTP_STATUS_NOT_MODIFIED = 304
+CREDENTIAL_HEADERS = ("Authorization", "X-Account-Id", "X-Auth-Token")
 
 
 class BaseEndpoint(object):
@@ -12,14 +18,25 @@ class BaseEndpoint(object):
         port (int): API port number.
         version (str): API version. Defaults to 2018-10-1.
         secure (bool): whether to use secure http protocol (https vs http). Defaults to True.
+        kwargs (dict): a dictionary of HTTP session options.
+            cache (ResponseCache): cache of GET responses. Responses are cached only if `cache_ttl` is set.
+            disk_cache (DiskCache): persistent cache of GET responses, revalidated on every use.
+            json_backend (str): library decoding response bodies, either "json" or "orjson". Defaults to "json".
 
     Attributes:
         conn (httplib.Connection): Connection instance.
+        cache_ttl (float): time to live of cached GET responses in seconds. Responses are not cached if not set.
     """
 
+    connection_class = Connection
+    cache_ttl = None
+
     def __init__(self, host, port, version="2018-10-1", secure=True, **kwargs):
         self._auth = kwargs.get("auth")
-        self.conn = Connection(host, port, version=version, secure=secure, **kwargs)
+        self.cache = kwargs.get("cache")
+        self.disk_cache = kwargs.get("disk_cache")
+        self.json_loads = get_json_loads(kwargs.get("json_backend", DEFAULT_JSON_BACKEND))
+        self.conn = self.connection_class(host, port, version=version, secure=secure, **kwargs)
 
     def _get_bearer_headers(self):
         access_token = getattr(self._auth, "access_token", None)
@@ -27,19 +44,15 @@ class BaseEndpoint(object):
             return {"Authorization": f"Bearer {access_token}"}
         return {}
 
-    def request(self, method, endpoint_path, params=None, data=None, headers=None):
+    def _build_request_headers(self, headers=None):
         """
-        Sends an HTTP request with given params, headers and data to the given endpoint.
+        Merges bearer authorization into the given headers, dropping legacy token headers when it is used.
 
         Args:
-            method (str): HTTP method to use.
-            endpoint_path (str): endpoint path.
             headers (dict): headers to send.
-            data (dict): the body to attach to the request.
-            params (dict): URL parameters to append to the URL.
 
         Returns:
-            json: response
+            dict
         """
         request_headers = dict(headers or {})
         bearer_headers = self._get_bearer_headers()
@@ -47,12 +60,203 @@ class BaseEndpoint(object):
             request_headers.update(bearer_headers)
             request_headers.pop("X-Account-Id", None)
             request_headers.pop("X-Auth-Token", None)
+        return request_headers
+
+    @staticmethod
+    def _unwrap_response(response):
+        """
+        Extracts data from a JSEND-formatted response.
+
+        Args:
+            response (dict): JSEND response.
+
+        Returns:
+            json: response data.
+        """
+        if response["status"] != "success":
+            raise BaseException(response["data"]["message"])
+        return response["data"]
+
+    def _get_cached(self, method, endpoint_path, params=None):
+        """
+        Looks up a cached response. Only GET responses are cached.
+
+        Args:
+            method (str): HTTP method to use.
+            endpoint_path (str): endpoint path.
+            params (dict): URL parameters to append to the URL.
+
+        Returns:
+            tuple: (found, data).
+        """
+        if self.cache is None or not self.cache_ttl or method.upper() != "GET":
+            return False, None
+        return self.cache.get(self.cache.make_key(method, endpoint_path, params))
+
+    def _set_cached(self, method, endpoint_path, params, data):
+        if self.cache is not None and self.cache_ttl and method.upper() == "GET":
+            self.cache.set(self.cache.make_key(method, endpoint_path, params), data, self.cache_ttl)
+
+    def _get_stored_key(self, endpoint_path, params, headers):
+        """
+        Returns the key of a response stored on disk. Keys are scoped by the server and a hash of the credentials the
+        request is sent with, so that clients of different users never share stored responses.
+
+        Args:
+            endpoint_path (str): endpoint path.
+            params (dict): URL parameters to append to the URL.
+            headers (dict): headers the request is sent with.
+
+        Returns:
+            str, or None if the request carries no credentials.
+        """
+        credentials = [headers.get(name) for name in CREDENTIAL_HEADERS]
+        if not any(credentials):
+            return None
+        identity = hashlib.sha256(json.dumps(credentials).encode()).hexdigest()
+        return self.disk_cache.make_key((self.conn.preamble, identity), endpoint_path, params)
+
+    def _get_stored(self, method, endpoint_path, params, headers):
+        """
+        Looks up a response stored on disk. Only GET responses of requests with credentials are stored.
+
+        Args:
+            method (str): HTTP method to use.
+            endpoint_path (str): endpoint path.
+            params (dict): URL parameters to append to the URL.
+            headers (dict): headers the request is sent with.
+
+        Returns:
+            tuple: (etag, data), or None if not stored.
+        """
+        if self.disk_cache is None or method.upper() != "GET":
+            return None
+        key = self._get_stored_key(endpoint_path, params, headers)
+        return None if key is None else self.disk_cache.get(key)
+
+    def _set_stored(self, method, endpoint_path, params, headers, data, etag=None):
+        if self.disk_cache is None or method.upper() != "GET":
+            return
+        key = self._get_stored_key(endpoint_path, params, headers)
+        if key is not None:
+            self.disk_cache.set(key, endpoint_path.split("/")[0], data, etag)
+
+    def _is_stored_fresh(self, endpoint_path, params, data, headers=None, timeout=None):
+        """
+        Revalidates a stored response that has no ETag. Stored responses are never considered fresh by default.
+
+        Args:
+            endpoint_path (str): endpoint path.
+            params (dict): URL parameters of the stored request.
+            data (json): stored response data.
+            headers (dict): headers to send.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+
+        Returns:
+            bool
+        """
+        return False
+
+    def _invalidate_collection(self, endpoint_path):
+        """
+        Drops cached and stored responses of the collection a request changed. Called once the request returned or
+        failed, as responses cached while it was sent may predate the change.
+
+        Args:
+            endpoint_path (str): endpoint path of the request.
+        """
+        collection = endpoint_path.split("/")[0]
+        if self.cache is not None:
+            self.cache.invalidate(collection)
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate(collection)
+
+    def invalidate_cache(self):
+        """
+        Drops all cached and stored responses of the client.
+        """
+        if self.cache is not None:
+            self.cache.invalidate()
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate()
+
+    def request(self, method, endpoint_path, params=None, data=None, headers=None, timeout=None, use_cache=True,
+                deadline=None):
+        """
+        Sends an HTTP request with given params, headers and data to the given endpoint.
+
+        Args:
+            method (str): HTTP method to use.
+            endpoint_path (str): endpoint path.
+            headers (dict): headers to send.
+            data (dict): the body to attach to the request.
+            params (dict): URL parameters to append to the URL.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple. Defaults to the
+                connection timeout.
+            use_cache (bool): whether to look up and store the response in the caches.
+            deadline (Deadline): overall time budget of the request, including retries.
+
+        Returns:
+            json: response
+        """
+        request_headers = self._build_request_headers(headers)
+        if method.upper() != "GET" or not use_cache:
+            try:
+                with self.conn:
+                    response = self.conn.request(method, endpoint_path, params, data, request_headers or None, timeout,
+                                                 deadline=deadline)
+                    return self._unwrap_response(self.json_loads(response.content))
+            finally:
+                if method.upper() != "GET":
+                    self._invalidate_collection(endpoint_path)
+        found, cached = self._get_cached(method, endpoint_path, params)
+        if found:
+            return cached
+        stored = self._get_stored(method, endpoint_path, params, request_headers)
+        if stored and not stored[0] and self._is_stored_fresh(endpoint_path, params, stored[1], headers, timeout):
+            self._set_cached(method, endpoint_path, params, stored[1])
+            return stored[1]
+        if stored and stored[0]:
+            request_headers["If-None-Match"] = stored[0]
+        with self.conn:
+            response = self.conn.request(method, endpoint_path, params, data, request_headers or None, timeout,
+                                         deadline=deadline)
+            if stored and response.status_code == HTTP_STATUS_NOT_MODIFIED:
+                result = stored[1]
+            else:
+                result = self._unwrap_response(self.json_loads(response.content))
+                self._set_stored(method, endpoint_path, params, request_headers, result, response.headers.get("ETag"))
+        self._set_cached(method, endpoint_path, params, result)
+        return result
+
+    def request_stream(self, method, endpoint_path, params=None, headers=None, timeout=None,
+                       chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+        """
+        Sends an HTTP request and yields elements of the `data` array of the response as they are received, without
+        buffering the whole response. Responses are not cached.
+
+        Args:
+            method (str): HTTP method to use.
+            endpoint_path (str): endpoint path.
+            params (dict): URL parameters to append to the URL.
+            headers (dict): headers to send.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple. Defaults to the
+                connection timeout.
+            chunk_size (int): number of bytes read from the socket at once.
+
+        Yields:
+            json: element of the response data.
+        """
+        request_headers = self._build_request_headers(headers)
+        parser = JSENDStreamParser()
         with self.conn:
-            self.conn.request(method, endpoint_path, params, data, request_headers or None)
-            response = self.conn.json()
-            if response["status"] != "success":
-                raise BaseException(response["data"]["message"])
-            return response["data"]
+            response = self.conn.request(method, endpoint_path, params, None, request_headers or None, timeout, True)
+            try:
+                yield from iter_jsend_data(response.iter_content(chunk_size), parser)
+            finally:
+                response.close()
+        if parser.envelope.get("status") != "success":
+            self._unwrap_response(parser.envelope)
 
     def get_headers(self, account_id, auth_token, content_type="application/json"):
         return {"X-Account-Id": account_id, "X-Auth-Token": auth_token, "Content-Type": content_type}
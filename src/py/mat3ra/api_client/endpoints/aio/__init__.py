@@ -0,0 +1,81 @@
+from .. import BaseEndpoint
+from ...utils.http_async import AsyncConnection
+from ...utils.streaming import DEFAULT_STREAM_CHUNK_SIZE, JSENDStreamParser
+
+
+class AsyncBaseEndpoint(BaseEndpoint):
+    """
+    Base class for asynchronous Exabyte RESTful API endpoints.
+
+    Args:
+        host (str): API hostname.
+        port (int): API port number.
+        version (str): API version. Defaults to 2018-10-1.
+        secure (bool): whether to use secure http protocol (https vs http). Defaults to True.
+
+    Attributes:
+        conn (AsyncConnection): AsyncConnection instance.
+    """
+
+    connection_class = AsyncConnection
+
+    async def request(self, method, endpoint_path, params=None, data=None, headers=None, timeout=None):
+        """
+        Sends an HTTP request with given params, headers and data to the given endpoint.
+
+        Args:
+            method (str): HTTP method to use.
+            endpoint_path (str): endpoint path.
+            headers (dict): headers to send.
+            data (dict): the body to attach to the request.
+            params (dict): URL parameters to append to the URL.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple. Defaults to the client
+                timeout.
+
+        Returns:
+            json: response
+        """
+        found, cached = self._get_cached(method, endpoint_path, params)
+        if found:
+            return cached
+        request_headers = self._build_request_headers(headers)
+        try:
+            response = await self.conn.request(method, endpoint_path, params, data, request_headers or None, timeout)
+        finally:
+            if method.upper() != "GET":
+                self._invalidate_collection(endpoint_path)
+        result = self._unwrap_response(self.json_loads(response.content))
+        self._set_cached(method, endpoint_path, params, result)
+        return result
+
+    async def request_stream(self, method, endpoint_path, params=None, headers=None, timeout=None,
+                             chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+        """
+        Sends an HTTP request and yields elements of the `data` array of the response as they are received, without
+        buffering the whole response. Responses are not cached.
+
+        Args:
+            method (str): HTTP method to use.
+            endpoint_path (str): endpoint path.
+            params (dict): URL parameters to append to the URL.
+            headers (dict): headers to send.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple. Defaults to the client
+                timeout.
+            chunk_size (int): number of bytes read from the socket at once.
+
+        Yields:
+            json: element of the response data.
+        """
+        request_headers = self._build_request_headers(headers)
+        parser = JSENDStreamParser()
+        response = await self.conn.request(method, endpoint_path, params, None, request_headers or None, timeout, True)
+        try:
+            async for chunk in response.aiter_bytes(chunk_size):
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+        finally:
+            await response.aclose()
+        if parser.envelope.get("status") != "success":
+            self._unwrap_response(parser.envelope)
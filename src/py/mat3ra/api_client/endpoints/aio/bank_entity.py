@@ -0,0 +1,39 @@
+from ..enums import DEFAULT_API_VERSION, REFERENCE_DATA_CACHE_TTL, SECURE
+from .entity import AsyncEntityEndpoint
+
+
+class AsyncBankEntityEndpoints(AsyncEntityEndpoint):
+    """
+    Asynchronous bank entity endpoints. Mirrors `BankEntityEndpoints`.
+
+    Attributes:
+        name (str): endpoint name.
+    """
+
+    cache_ttl = REFERENCE_DATA_CACHE_TTL
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncBankEntityEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
+
+    async def delete(self, id_):
+        raise NotImplementedError
+
+    async def update(self, id_, modifier):
+        raise NotImplementedError
+
+    async def create(self, config):
+        raise NotImplementedError
+
+    async def copy(self, id_, account_id=None):
+        """
+        Copies a bank entity with given ID into the account.
+
+        Args:
+            id_ (str): bank entity ID.
+            account_id (str): ID of account to copy the bank entity into.
+
+        Returns:
+             dict: new entity.
+        """
+        params = {"accountId": account_id}
+        return await self.request("POST", "/".join((self.name, id_, "copy")), params=params, headers=self.headers)
@@ -0,0 +1,15 @@
+from ..enums import DEFAULT_API_VERSION, SECURE
+from .bank_entity import AsyncBankEntityEndpoints
+
+
+class AsyncBankMaterialEndpoints(AsyncBankEntityEndpoints):
+    """
+    Asynchronous bank material endpoints. Mirrors `BankMaterialEndpoints`.
+
+    Attributes:
+        name (str): endpoint name.
+    """
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncBankMaterialEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
+        self.name = "bank-materials"
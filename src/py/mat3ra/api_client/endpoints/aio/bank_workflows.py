@@ -0,0 +1,15 @@
+from ..enums import DEFAULT_API_VERSION, SECURE
+from .bank_entity import AsyncBankEntityEndpoints
+
+
+class AsyncBankWorkflowEndpoints(AsyncBankEntityEndpoints):
+    """
+    Asynchronous bank workflow endpoints. Mirrors `BankWorkflowEndpoints`.
+
+    Attributes:
+        name (str): endpoint name.
+    """
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncBankWorkflowEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
+        self.name = "bank-workflows"
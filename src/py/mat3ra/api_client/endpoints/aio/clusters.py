@@ -0,0 +1,26 @@
+from . import AsyncBaseEndpoint
+from ..enums import DEFAULT_API_VERSION, REFERENCE_DATA_CACHE_TTL, SECURE
+
+
+class AsyncClustersEndpoint(AsyncBaseEndpoint):
+    """
+    Asynchronous clusters endpoints. Mirrors `ClustersEndpoint`.
+
+    Attributes:
+        headers (dict): default HTTP headers.
+    """
+
+    cache_ttl = REFERENCE_DATA_CACHE_TTL
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncClustersEndpoint, self).__init__(host, port, version, secure, **kwargs)
+        self.headers = self.get_headers(account_id, auth_token)
+
+    async def list(self):
+        """
+        Returns a list of available clusters with their queues.
+
+        Returns:
+            list[Dict]: Cluster information, including queues.
+        """
+        return await self.request("GET", "other/clusters", headers=self.headers)
@@ -0,0 +1,137 @@
+import json
+
+from . import AsyncBaseEndpoint
+from ..entity import EntityEndpoint
+from ..enums import DEFAULT_API_VERSION, SECURE
+from ...utils.streaming import DEFAULT_STREAM_CHUNK_SIZE
+
+
+class AsyncEntityEndpoint(AsyncBaseEndpoint):
+    """
+    Asynchronous Exabyte Entity endpoint. Mirrors `EntityEndpoint` with awaitable methods.
+
+    Args:
+        host (str): API hostname.
+        port (int): API port number.
+        account_id (str): account ID.
+        auth_token (str): authentication token.
+        version (str): API version.
+        secure (bool): whether to use secure http protocol (https vs http).
+        kwargs (dict): a dictionary of HTTP session options.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+
+    Attributes:
+        name (str): endpoint name.
+        headers (dict): default HTTP headers.
+        projections (dict): named projection presets accepted by `list`.
+    """
+
+    projections = EntityEndpoint.projections
+    resolve_projection = EntityEndpoint.resolve_projection
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncEntityEndpoint, self).__init__(host, port, version, secure, **kwargs)
+        self.name = None
+        self.headers = self.get_headers(account_id, auth_token)
+
+    async def list(self, query=None, projection=None, timeout=None):
+        """
+        Returns a list of entities.
+
+        Args:
+            query (dict): Mongo query. Defaults to {}.
+            projection (dict|str): Mongo projection or preset name. Defaults to {}.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+
+        Returns:
+            list[dict]
+        """
+        projection = self.resolve_projection(projection)
+        params = {"query": json.dumps(query or {}), "projection": json.dumps(projection)}
+        return await self.request("GET", self.name, params=params, headers=self.headers, timeout=timeout)
+
+    def stream_list(self, query=None, projection=None, chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+        """
+        Lazily iterates over entities of a single list request, parsing them as they are received.
+
+        Args:
+            query (dict): Mongo query. Defaults to {}.
+            projection (dict|str): Mongo projection or preset name. Defaults to {}.
+            chunk_size (int): number of bytes read from the socket at once.
+
+        Returns:
+            AsyncIterator[dict]: entities.
+        """
+        projection = self.resolve_projection(projection)
+        params = {"query": json.dumps(query or {}), "projection": json.dumps(projection)}
+        return self.request_stream("GET", self.name, params=params, headers=self.headers, chunk_size=chunk_size)
+
+    async def get(self, id_, timeout=None):
+        """
+        Returns a entity with given ID.
+
+        Args:
+            id_ (str): entity ID.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+
+        Returns:
+             dict: entity.
+        """
+        return await self.request("GET", "/".join((self.name, id_)), headers=self.headers, timeout=timeout)
+
+    async def delete(self, id_, timeout=None):
+        """
+        Deletes a given entity.
+
+        Args:
+            id_ (str): entity ID.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+        """
+        return await self.request("DELETE", "/".join((self.name, id_)), headers=self.headers, timeout=timeout)
+
+    async def update(self, id_, modifier, parameters=None, timeout=None):
+        """
+        Updates a entity with given ID.
+
+        Args:
+            id_ (str): entity ID.
+            modifier (dict): a dictionary of key-values to update entity with.
+            parameters (dict): additional request parameters.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+
+        Returns:
+             dict: updated entity.
+        """
+        return await self.request("PATCH", "/".join((self.name, id_)), data=json.dumps(modifier),
+                                  headers=self.headers, params=parameters, timeout=timeout)
+
+    async def create(self, config, owner_id=None, timeout=None):
+        """
+        Creates a new entity.
+
+        Args:
+            config (dict): entity config.
+            owner_id (str): owner ID. Entity is created under user's default account if not specified.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+
+        Returns:
+             dict: new entity.
+        """
+        if owner_id:
+            config["owner"] = {"_id": owner_id}
+        return await self.request("PUT", "/".join((self.name, "create")), data=json.dumps(config),
+                                  headers=self.headers, timeout=timeout)
+
+    async def copy(self, id_, timeout=None):
+        """
+        Copies a entity with given ID.
+
+        Args:
+            id_ (str): entity ID.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+
+        Returns:
+             dict: new entity.
+        """
+        return await self.request("POST", "/".join((self.name, id_, "copy")), headers=self.headers,
+                                  timeout=timeout)
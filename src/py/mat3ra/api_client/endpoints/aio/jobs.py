@@ -0,0 +1,153 @@
+import asyncio
+import json
+import time
+
+from ..enums import (
+    DEFAULT_API_VERSION,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_BACKOFF,
+    DEFAULT_POLL_INTERVAL,
+    JOB_TERMINAL_STATUSES,
+    SECURE,
+)
+from ..jobs import JobEndpoints
+from ...utils.concurrency import chunked
+from .entity import AsyncEntityEndpoint
+from .mixins import AsyncEntitySetEndpointsMixin
+
+
+class AsyncJobEndpoints(AsyncEntitySetEndpointsMixin, AsyncEntityEndpoint):
+    """
+    Asynchronous job endpoints. Mirrors `JobEndpoints`.
+
+    Attributes:
+        name (str): endpoint name.
+    """
+
+    projections = JobEndpoints.projections
+    build_config = JobEndpoints.build_config
+    build_compute_config = JobEndpoints.build_compute_config
+    _update_statuses = staticmethod(JobEndpoints._update_statuses)
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncJobEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
+        self.name = "jobs"
+
+    async def submit(self, id_):
+        """
+        Submits a given job.
+
+        Args:
+            id_ (str): job ID.
+        """
+        await self.request("POST", "/".join((self.name, id_, "submit")), headers=self.headers)
+
+    async def purge(self, id_):
+        """
+        Purges a given job.
+
+        Args:
+            id_ (str): job ID.
+        """
+        await self.request("POST", "/".join((self.name, id_, "submit")), headers=self.headers)
+
+    async def terminate(self, id_):
+        """
+        Terminates a given job.
+
+        Args:
+            id_ (str): job ID.
+        """
+        await self.request("POST", "/".join((self.name, id_, "submit")), headers=self.headers)
+
+    async def create_by_ids(self, materials, workflow_id, project_id, prefix, owner_id=None, compute=None):
+        """
+        Creates jobs from the given materials concurrently.
+
+        Args:
+            materials (list[dict]): list of materials.
+            workflow_id (str): workflow ID.
+            project_id (str): project ID.
+            prefix (str): job prefix.
+            owner_id (str, optional): owner ID.
+            compute (dict, optional): compute configuration.
+
+        Returns:
+            list: List of created jobs in the order of materials.
+        """
+        configs = [
+            self.build_config([material["_id"]], workflow_id, project_id, owner_id,
+                              " ".join((prefix, material["formula"])), compute)
+            for material in materials
+        ]
+        return list(await asyncio.gather(*(self.create(config) for config in configs)))
+
+    async def watch(self, ids, poll_interval=DEFAULT_POLL_INTERVAL, max_poll_interval=DEFAULT_MAX_POLL_INTERVAL,
+                    backoff=DEFAULT_POLL_BACKOFF, timeout=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Watches given jobs until all of them reach a terminal status. See `JobEndpoints.watch`.
+
+        Yields:
+            dict: status change event {"_id": str, "status": str, "previousStatus": str}.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        statuses = dict.fromkeys(ids)
+        pending = list(statuses)
+        interval = poll_interval
+        while True:
+            pages = await asyncio.gather(
+                *(self.list({"_id": {"$in": chunk}}, "status") for chunk in chunked(pending, chunk_size))
+            )
+            events = self._update_statuses(statuses, pending, [job for page in pages for job in page])
+            for event in events:
+                yield event
+            pending = [id_ for id_ in pending if statuses[id_] not in JOB_TERMINAL_STATUSES]
+            if not pending:
+                return
+            interval = poll_interval if events else min(interval * backoff, max_poll_interval)
+            wait = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Jobs did not finish within {timeout} seconds: {pending}")
+                wait = min(interval, remaining)
+            await asyncio.sleep(wait)
+
+    async def get_presigned_urls(self, id_, files):
+        """
+        Returns presigned URLS to upload given job files.
+
+        Args:
+            id_ (str): job ID.
+            files (list): list of paths relative to the job working directory.
+
+        Returns:
+            list: [{"file": "", "URL": ""}]
+        """
+        data = json.dumps({"files": files})
+        path_ = "/".join((self.name, id_, "presigned-urls"))
+        response = await self.request("POST", path_, data=data, headers=self.headers)
+        return response["presignedURLs"]
+
+    async def list_files(self, id_):
+        """
+        Returns a list of job files.
+
+        Args:
+            id_ (str): job ID.
+
+        Returns:
+            list: [{ "key" : str, "size" : int, "bucket" : str, "region" : str,
+                     "provider" : str, "lastModified" : int, "name" : str, "signedURL" : str }]
+        """
+        return await self.request("GET", "/".join(("jobs", id_, "files")), headers=self.headers)
+
+    async def insert_output_files(self, id_, data):
+        """
+        Inserts job output files.
+
+        Args:
+            id_ (str): job ID.
+        """
+        await self.request("POST", "/".join(("jobs", id_, "output-files")), data=data, headers=self.headers)
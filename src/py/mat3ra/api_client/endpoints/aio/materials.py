@@ -0,0 +1,64 @@
+import json
+
+from ..enums import DEFAULT_API_VERSION, SECURE
+from ..materials import MaterialEndpoints
+from ...utils.materials import get_materialsproject_url
+from .entity import AsyncEntityEndpoint
+from .mixins import AsyncDefaultableEntityEndpointsMixin, AsyncEntitySetEndpointsMixin
+
+
+class AsyncMaterialEndpoints(AsyncEntitySetEndpointsMixin, AsyncDefaultableEntityEndpointsMixin, AsyncEntityEndpoint):
+    """
+    Asynchronous material endpoints. Mirrors `MaterialEndpoints`.
+
+    Attributes:
+        name (str): endpoint name.
+    """
+
+    projections = MaterialEndpoints.projections
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncMaterialEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
+        self.name = "materials"
+
+    async def import_from_file(self, name, content, owner_id=None, format="poscar", tags=()):
+        """
+        Imports a material from the given file.
+
+        Args:
+            name (str): material name.
+            content (str): material as string.
+            format (str): material format, either cif or poscar.
+            owner_id (str): owner ID. Material is created under user's default account by default.
+            tags (tuple[str]) a list of tags that should be assigned to the material.
+
+        Returns:
+            dict
+        """
+        data = {"name": name, "content": content, "format": format, "owner._id": owner_id, "tags": tags}
+        return await self.request("POST", "/".join((self.name, "import")), headers=self.headers,
+                                  data=json.dumps(data))
+
+    async def import_from_materialsproject(self, api_key, material_ids, owner_id=None, tags=None):
+        """
+        Imports a given material from materialsproject
+
+        Args:
+            api_key (str): materialsproject API key.
+            material_ids (list): a list of materialsproject IDs.
+            owner_id (str): material owner Id.
+            tags (list): material tags,
+
+        Returns:
+            list[dict]: list of imported materials
+        """
+        materials = []
+        tags = list(tags or [])
+        for material_id in material_ids:
+            response = await self.conn.client.get(get_materialsproject_url(material_id), params={"API_KEY": api_key})
+            response.raise_for_status()
+            material = response.json()["response"][0]
+            tags.extend(material.get("tags", []))
+            materials.append(await self.import_from_file(material["material_id"], material["cif"], owner_id, "cif",
+                                                         tags))
+        return materials
@@ -0,0 +1,27 @@
+from ..enums import DEFAULT_API_VERSION, REFERENCE_DATA_CACHE_TTL, SECURE
+from .properties import AsyncBasePropertiesEndpoints
+
+
+class AsyncMetaPropertiesEndpoints(AsyncBasePropertiesEndpoints):
+    """
+    Asynchronous metaproperties endpoints. Mirrors `MetaPropertiesEndpoints`.
+
+    Attributes:
+        name (str): endpoint name.
+    """
+
+    cache_ttl = REFERENCE_DATA_CACHE_TTL
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncMetaPropertiesEndpoints, self).__init__(host, port, account_id, auth_token, version, secure,
+                                                           **kwargs)
+        self.name = "metaproperties"
+
+    async def delete(self, id_):
+        raise NotImplementedError
+
+    async def update(self, id_, modifier):
+        raise NotImplementedError
+
+    async def create(self, config):
+        raise NotImplementedError
@@ -0,0 +1,47 @@
+import json
+
+
+class AsyncDefaultableEntityEndpointsMixin(object):
+    """
+    Asynchronous defaultable entity endpoints.
+    """
+
+    async def set_default(self, id_):
+        """
+        Sets a entity with given ID as default.
+
+        Args:
+            id_ (str): entity ID.
+        """
+        await self.request("POST", "/".join((self.name, id_, "set-default")), headers=self.headers)
+
+
+class AsyncEntitySetEndpointsMixin(object):
+    """
+    Asynchronous entity set endpoints mixin.
+    """
+
+    async def create_set(self, config):
+        """
+        Creates a new entity set.
+
+        Args:
+            config (dict): entity set config.
+
+        Returns:
+             dict: new entity set.
+        """
+        path_ = "/".join((self.name, "create-set"))
+        return await self.request("PUT", path_, data=json.dumps(config), headers=self.headers)
+
+    async def move_to_set(self, _id, old_set_id, new_set_id):
+        """
+        Moves a entity with given ID to a new set.
+
+        Args:
+            _id (str): entity ID.
+            old_set_id (str): old entity set ID.
+            new_set_id (str): new entity set ID.
+        """
+        params = {"oldSetId": old_set_id, "newSetId": new_set_id}
+        await self.request("POST", "/".join((self.name, _id, "move-to-set")), params=params, headers=self.headers)
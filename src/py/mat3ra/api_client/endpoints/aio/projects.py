@@ -0,0 +1,25 @@
+from ..enums import DEFAULT_API_VERSION, SECURE
+from .entity import AsyncEntityEndpoint
+from .mixins import AsyncDefaultableEntityEndpointsMixin
+
+
+class AsyncProjectEndpoints(AsyncDefaultableEntityEndpointsMixin, AsyncEntityEndpoint):
+    """
+    Asynchronous project endpoints. Mirrors `ProjectEndpoints`.
+
+    Attributes:
+        name (str): endpoint name.
+    """
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncProjectEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
+        self.name = "projects"
+
+    async def delete(self, id_):
+        raise NotImplementedError
+
+    async def update(self, id_, modifier):
+        raise NotImplementedError
+
+    async def create(self, config):
+        raise NotImplementedError
@@ -0,0 +1,69 @@
+from ..enums import DEFAULT_API_VERSION, SECURE
+from ..properties import BasePropertiesEndpoints, PropertiesEndpoints
+from .entity import AsyncEntityEndpoint
+
+
+class AsyncBasePropertiesEndpoints(AsyncEntityEndpoint):
+    projections = BasePropertiesEndpoints.projections
+    build_property_selector = BasePropertiesEndpoints.build_property_selector
+
+    async def get_property(self, job_id, unit_flowchart_id, property_name):
+        selector = self.build_property_selector(job_id, unit_flowchart_id, property_name)
+        return (await self.list(query=selector, projection={"limit": 1}))[0]
+
+    async def get_band_gap_by_type(self, job_id, unit_flowchart_id, type):
+        band_gaps = (await self.get_property(job_id, unit_flowchart_id, "band_gaps"))["data"]
+        return next((v for v in band_gaps["values"] if v["type"] == type), None)["value"]
+
+    async def get_indirect_band_gap(self, job_id, unit_flowchart_id):
+        return await self.get_band_gap_by_type(job_id, unit_flowchart_id, "indirect")
+
+    async def get_direct_band_gap(self, job_id, unit_flowchart_id):
+        return await self.get_band_gap_by_type(job_id, unit_flowchart_id, "direct")
+
+
+class AsyncPropertiesEndpoints(AsyncBasePropertiesEndpoints):
+    """
+    Asynchronous properties endpoints. Mirrors `PropertiesEndpoints`.
+
+    Attributes:
+        name (str): endpoint name.
+    """
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncPropertiesEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
+        self.name = "properties"
+
+    async def delete(self, id_):
+        raise NotImplementedError
+
+    async def update(self, id_, modifier):
+        raise NotImplementedError
+
+    async def list_for_job(self, job_id):
+        """
+        List properties for a job grouped by unit. Property values are not fetched.
+
+        Args:
+            job_id (str): Job ID.
+
+        Returns:
+            list[dict]: List of {"unit_id": str, "properties": [str, ...]}.
+        """
+        properties = await self.list(query={"source.info.jobId": job_id}, projection="summary")
+        return PropertiesEndpoints.group_by_unit(properties)
+
+    async def get_for_job(self, job_id, property_name=None, unit_id=None):
+        """
+        Get property data for a job, optionally filtered by property name and/or unit.
+
+        Args:
+            job_id (str): Job ID.
+            property_name (str, optional): Property name (e.g., "band_gaps", "total_energy").
+            unit_id (str, optional): Unit flowchart ID (e.g., "pw-nscf").
+
+        Returns:
+            list[dict]: List of property data dicts.
+        """
+        query = PropertiesEndpoints.build_job_query(job_id, property_name, unit_id)
+        return [prop["data"] for prop in await self.list(query=query, projection="data")]
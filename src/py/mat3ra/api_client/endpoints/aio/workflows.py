@@ -0,0 +1,16 @@
+from ..enums import DEFAULT_API_VERSION, SECURE
+from .entity import AsyncEntityEndpoint
+from .mixins import AsyncDefaultableEntityEndpointsMixin
+
+
+class AsyncWorkflowEndpoints(AsyncDefaultableEntityEndpointsMixin, AsyncEntityEndpoint):
+    """
+    Asynchronous workflow endpoints. Mirrors `WorkflowEndpoints`.
+
+    Attributes:
+        name (str): endpoint name.
+    """
+
+    def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
+        super(AsyncWorkflowEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
+        self.name = "workflows"
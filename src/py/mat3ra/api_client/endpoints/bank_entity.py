@@ -1,5 +1,5 @@
 from .entity import EntityEndpoint
-from .enums import DEFAULT_API_VERSION, SECURE
+from .enums import DEFAULT_API_VERSION, REFERENCE_DATA_CACHE_TTL, SECURE
 
 
 class BankEntityEndpoints(EntityEndpoint):
@@ -14,12 +14,14 @@ class BankEntityEndpoints(EntityEndpoint):
         version (str): API version.
         secure (bool): whether to use secure http protocol (https vs http).
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
     Attributes:
         name (str): endpoint name.
     """
 
+    cache_ttl = REFERENCE_DATA_CACHE_TTL
+
     def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
         super(BankEntityEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
 
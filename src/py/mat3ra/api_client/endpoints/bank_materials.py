@@ -14,7 +14,7 @@ class BankMaterialEndpoints(BankEntityEndpoints):
         version (str): API version.
         secure (bool): whether to use secure http protocol (https vs http).
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
     Attributes:
         name (str): endpoint name.
@@ -14,7 +14,7 @@ class ChargeEndpoints(EntityEndpoint):
         version (str): API version.
         secure (bool): whether to use secure http protocol (https vs http).
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
     Attributes:
         name (str): endpoint name.
@@ -36,5 +36,16 @@ class ChargeEndpoints(EntityEndpoint):
     def create(self, config):
         raise NotImplementedError
 
-    def get_by_job(self, job):
-        return next(iter(self.list(query={"jid": job["compute"]["cluster"]["jid"]})), None)
+    def get_by_job(self, job, projection=None):
+        """
+        Returns the charge of a given job.
+
+        Args:
+            job (dict): job with compute configuration.
+            projection (dict|str): Mongo projection or preset name. Defaults to {}.
+
+        Returns:
+            dict: charge, or None if not found.
+        """
+        options = dict(self.resolve_projection(projection), limit=1)
+        return next(iter(self.list(query={"jid": job["compute"]["cluster"]["jid"]}, projection=options)), None)
@@ -1,5 +1,5 @@
 from . import BaseEndpoint
-from .enums import DEFAULT_API_VERSION, SECURE
+from .enums import DEFAULT_API_VERSION, REFERENCE_DATA_CACHE_TTL, SECURE
 
 
 class ClustersEndpoint(BaseEndpoint):
@@ -14,13 +14,15 @@ class ClustersEndpoint(BaseEndpoint):
         version (str): API version.
         secure (bool): whether to use secure http protocol (https vs http).
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
     Attributes:
         name (str): endpoint name.
         headers (dict): default HTTP headers.
     """
 
+    cache_ttl = REFERENCE_DATA_CACHE_TTL
+
     def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
         super(ClustersEndpoint, self).__init__(host, port, version, secure, **kwargs)
         self.headers = self.get_headers(account_id, auth_token)
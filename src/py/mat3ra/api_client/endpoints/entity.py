@@ -1,7 +1,12 @@
+import copy
 import json
 
 from . import BaseEndpoint
-from .enums import DEFAULT_API_VERSION, SECURE
+from .enums import DEFAULT_API_VERSION, DEFAULT_CHUNK_SIZE, DEFAULT_PAGE_SIZE, SECURE
+from ..utils.concurrency import DEFAULT_WORKERS, chunked, map_concurrently
+from ..utils.streaming import DEFAULT_STREAM_CHUNK_SIZE
+
+REVALIDATION_PROJECTION = {"fields": {"_id": 1, "updatedAt": 1}}
 
 
 class EntityEndpoint(BaseEndpoint):
@@ -16,54 +21,204 @@ class EntityEndpoint(BaseEndpoint):
         version (str): API version.
         secure (bool): whether to use secure http protocol (https vs http).
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
     Attributes:
         name (str): endpoint name.
         headers (dict): default HTTP headers.
+        projections (dict): named projection presets accepted by `list`, `iter_list` and `get_many`.
     """
 
+    projections = {
+        "ids": {"fields": {"_id": 1}},
+        "summary": {"fields": {"_id": 1, "name": 1, "createdAt": 1, "updatedAt": 1}},
+    }
+
     def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
         super(EntityEndpoint, self).__init__(host, port, version, secure, **kwargs)
         self.name = None
         self.headers = self.get_headers(account_id, auth_token)
 
-    def list(self, query=None, projection=None):
+    def _is_stored_fresh(self, endpoint_path, params, data, headers=None, timeout=None):
+        """
+        Revalidates stored entities by comparing their `updatedAt` timestamps with the server ones. Only entity IDs
+        and timestamps are fetched, with the stored query and paging options.
+
+        Args:
+            endpoint_path (str): endpoint path.
+            params (dict): URL parameters of the stored request.
+            data (json): stored entity or list of entities.
+            headers (dict): headers to send.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+
+        Returns:
+            bool
+        """
+        if endpoint_path == self.name:
+            entities, query = data, json.loads(params["query"])
+            options = {key: value for key, value in json.loads(params["projection"]).items() if key != "fields"}
+        elif endpoint_path.rsplit("/", 1)[0] == self.name and not params:
+            entities, query, options = [data], {"_id": endpoint_path.rsplit("/", 1)[1]}, {}
+        else:
+            return False
+        if not all(isinstance(entity, dict) and {"_id", "updatedAt"} <= entity.keys() for entity in entities):
+            return False
+        params = {"query": json.dumps(query), "projection": json.dumps(dict(options, **REVALIDATION_PROJECTION))}
+        current = self.request("GET", self.name, params=params, headers=headers, timeout=timeout, use_cache=False)
+        return [(e["_id"], e.get("updatedAt")) for e in current] == [(e["_id"], e["updatedAt"]) for e in entities]
+
+    def resolve_projection(self, projection=None):
+        """
+        Returns the given projection, looking up preset names in `projections`.
+
+        Args:
+            projection (dict|str): Mongo projection or preset name, e.g. "ids". Defaults to {}.
+
+        Returns:
+            dict
+        """
+        if not isinstance(projection, str):
+            return projection or {}
+        if projection not in self.projections:
+            raise ValueError(f"Unknown projection preset '{projection}', expected one of {sorted(self.projections)}")
+        return copy.deepcopy(self.projections[projection])
+
+    def list(self, query=None, projection=None, timeout=None):
         """
         Returns a list of entities.
 
         Args:
             query (dict): Mongo query. Defaults to {}.
-            projection (dict): Mongo projection. Defaults to {}.
+            projection (dict|str): Mongo projection or preset name. Defaults to {}.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
         Returns:
             list[dict]
         """
-        params = {"query": json.dumps(query or {}), "projection": json.dumps(projection or {})}
-        return self.request("GET", self.name, params=params, headers=self.headers)
+        projection = self.resolve_projection(projection)
+        params = {"query": json.dumps(query or {}), "projection": json.dumps(projection)}
+        return self.request("GET", self.name, params=params, headers=self.headers, timeout=timeout)
+
+    def iter_list(self, query=None, projection=None, page_size=DEFAULT_PAGE_SIZE, sort=None, timeout=None):
+        """
+        Lazily iterates over entities, fetching them page by page.
+
+        Pages are walked with a cursor on `_id` by default. If `sort` is given, pages are walked with skip/limit
+        instead, which is consistent only while the matching entities do not change.
+
+        Args:
+            query (dict): Mongo query. Defaults to {}.
+            projection (dict|str): Mongo projection or preset name. Defaults to {}.
+            page_size (int): number of entities fetched per request.
+            sort (dict): Mongo sort specification, e.g. {"createdAt": -1}. Defaults to ascending `_id`.
+            timeout (float|tuple): timeout of each page request in seconds, or a (connect, read) tuple.
+
+        Yields:
+            dict: entity.
+        """
+        query = query or {}
+        options = dict(self.resolve_projection(projection), limit=page_size, sort=sort or {"_id": 1})
+        last_id, skip = None, 0
+        while True:
+            if sort:
+                page = self.list(query, dict(options, skip=skip), timeout)
+            else:
+                page_query = query if last_id is None else {"$and": [query, {"_id": {"$gt": last_id}}]}
+                page = self.list(page_query, options, timeout)
+            yield from page
+            if len(page) < page_size:
+                return
+            last_id, skip = page[-1]["_id"], skip + len(page)
 
-    def get(self, id_):
+    def stream_list(self, query=None, projection=None, timeout=None, chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+        """
+        Lazily iterates over entities of a single list request, parsing them as they are received. Memory use is
+        bounded by the size of the largest entity rather than the size of the response.
+
+        Args:
+            query (dict): Mongo query. Defaults to {}.
+            projection (dict|str): Mongo projection or preset name. Defaults to {}.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+            chunk_size (int): number of bytes read from the socket at once.
+
+        Yields:
+            dict: entity.
+        """
+        projection = self.resolve_projection(projection)
+        params = {"query": json.dumps(query or {}), "projection": json.dumps(projection)}
+        return self.request_stream("GET", self.name, params=params, headers=self.headers, timeout=timeout,
+                                   chunk_size=chunk_size)
+
+    def count(self, query=None, page_size=DEFAULT_PAGE_SIZE, timeout=None):
+        """
+        Returns the number of entities matching the query.
+
+        The API has no count request, so IDs of all matching entities are fetched, one page at a time. This costs one
+        request per `page_size` entities, which is cheap next to listing entities but not free for large collections.
+
+        Args:
+            query (dict): Mongo query. Defaults to {}.
+            page_size (int): number of IDs fetched per request.
+            timeout (float|tuple): timeout of each page request in seconds, or a (connect, read) tuple.
+
+        Returns:
+            int
+        """
+        return sum(1 for _ in self.iter_list(query, "ids", page_size, timeout=timeout))
+
+    def get(self, id_, timeout=None):
         """
         Returns a entity with given ID.
 
         Args:
             id_ (str): entity ID.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
         Returns:
              dict: entity.
         """
-        return self.request("GET", "/".join((self.name, id_)), headers=self.headers)
+        return self.request("GET", "/".join((self.name, id_)), headers=self.headers, timeout=timeout)
+
+    def get_many(self, ids, projection=None, chunk_size=DEFAULT_CHUNK_SIZE, workers=DEFAULT_WORKERS,
+                 raise_missing=False, timeout=None):
+        """
+        Returns entities with given IDs, fetched with one `$in` list query per chunk of IDs.
+
+        Args:
+            ids (list[str]): entity IDs.
+            projection (dict|str): Mongo projection or preset name. Defaults to {}.
+            chunk_size (int): maximum number of IDs per request.
+            workers (int): maximum number of chunks fetched concurrently.
+            raise_missing (bool): whether to raise if some entities are not found.
+            timeout (float|tuple): timeout of each chunk request in seconds, or a (connect, read) tuple.
+
+        Returns:
+            list[dict]: entities in the order of IDs, None for IDs that were not found.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+
+        def fetch(chunk):
+            return self.list({"_id": {"$in": chunk}}, projection, timeout)
+
+        entities = {}
+        for page in map_concurrently(fetch, chunked(unique_ids, chunk_size), workers):
+            entities.update((entity["_id"], entity) for entity in page)
+        missing = [id_ for id_ in unique_ids if id_ not in entities]
+        if missing and raise_missing:
+            raise ValueError(f"Entities not found: {missing}")
+        return [entities.get(id_) for id_ in ids]
 
-    def delete(self, id_):
+    def delete(self, id_, timeout=None):
         """
         Deletes a given entity.
 
         Args:
             id_ (str): entity ID.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
         """
-        return self.request("DELETE", "/".join((self.name, id_)), headers=self.headers)
+        return self.request("DELETE", "/".join((self.name, id_)), headers=self.headers, timeout=timeout)
 
-    def update(self, id_, modifier, parameters=None):
+    def update(self, id_, modifier, parameters=None, timeout=None):
         """
         Updates a entity with given ID.
 
@@ -71,36 +226,41 @@ class EntityEndpoint(BaseEndpoint):
             id_ (str): entity ID.
             modifier (dict): a dictionary of key-values to update entity with.
             parameters (dict): additional request parameters.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
         Returns:
              dict: updated entity.
         """
         return self.request("PATCH", "/".join((self.name, id_)), data=json.dumps(modifier), headers=self.headers,
-                            params=parameters)
+                            params=parameters, timeout=timeout)
 
-    def create(self, config, owner_id=None):
+    def create(self, config, owner_id=None, timeout=None, deadline=None):
         """
         Creates a new entity.
 
         Args:
             config (dict): entity config.
             owner_id (str): owner ID. Entity is created under user's default account if not specified.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+            deadline (Deadline): overall time budget of the request, including retries.
 
         Returns:
              dict: new entity.
         """
         if owner_id:
             config["owner"] = {"_id": owner_id}
-        return self.request("PUT", "/".join((self.name, "create")), data=json.dumps(config), headers=self.headers)
+        return self.request("PUT", "/".join((self.name, "create")), data=json.dumps(config), headers=self.headers,
+                            timeout=timeout, deadline=deadline)
 
-    def copy(self, id_):
+    def copy(self, id_, timeout=None):
         """
         Copies a entity with given ID.
 
         Args:
             id_ (str): entity ID.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
         Returns:
              dict: new entity.
         """
-        return self.request("POST", "/".join((self.name, id_, "copy")), headers=self.headers)
+        return self.request("POST", "/".join((self.name, id_, "copy")), headers=self.headers, timeout=timeout)
@@ -3,3 +3,10 @@ DEFAULT_API_VERSION = "2018-10-01"
 MATERIALSPROJECT_HOST = "https://legacy.materialsproject.org"
 MATERIALSPROJECT_PORT = 443
 MATERIALSPROJECT_VERSION = "v2"
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_CHUNK_SIZE = 100
+JOB_TERMINAL_STATUSES = ("finished", "error", "terminated", "timeout")
+DEFAULT_POLL_INTERVAL = 5
+DEFAULT_MAX_POLL_INTERVAL = 60
+DEFAULT_POLL_BACKOFF = 1.5
+REFERENCE_DATA_CACHE_TTL = 600
@@ -1,8 +1,32 @@
+import fnmatch
 import json
+import os
+import time
+from collections import Counter
 
 from .entity import EntityEndpoint
-from .enums import DEFAULT_API_VERSION, SECURE
+from .enums import (
+    DEFAULT_API_VERSION,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_BACKOFF,
+    DEFAULT_POLL_INTERVAL,
+    JOB_TERMINAL_STATUSES,
+    SECURE,
+)
 from .mixins.set import EntitySetEndpointsMixin
+from ..utils.concurrency import DEFAULT_WORKERS, Checkpoint, chunked, map_concurrently, run_batch
+from ..utils.files import (
+    DEFAULT_TRANSFER_CHUNK_SIZE,
+    DEFAULT_UPLOAD_RETRIES,
+    MANIFEST_FILENAME,
+    download_file,
+    resolve_local_path,
+    upload_file,
+)
+from ..utils.http import Deadline
+
+JOB_STATUS_PROJECTION = {"fields": {"_id": 1, "status": 1}}
 
 
 class JobEndpoints(EntitySetEndpointsMixin, EntityEndpoint):
@@ -17,12 +41,18 @@ class JobEndpoints(EntitySetEndpointsMixin, EntityEndpoint):
         version (str): API version.
         secure (bool): whether to use secure http protocol (https vs http).
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
     Attributes:
         name (str): endpoint name.
     """
 
+    projections = dict(
+        EntityEndpoint.projections,
+        status=JOB_STATUS_PROJECTION,
+        summary={"fields": {"_id": 1, "name": 1, "status": 1, "_project": 1, "createdAt": 1, "updatedAt": 1}},
+    )
+
     def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
         super(JobEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
         self.name = "jobs"
@@ -111,7 +141,7 @@ class JobEndpoints(EntitySetEndpointsMixin, EntityEndpoint):
             "arguments": {},
         }
 
-    def create_by_ids(self, materials, workflow_id, project_id, prefix, owner_id=None, compute=None):
+    def create_by_ids(self, materials, workflow_id, project_id, prefix, owner_id=None, compute=None, deadline=None):
         """
         Creates jobs from the given materials
 
@@ -122,17 +152,160 @@ class JobEndpoints(EntitySetEndpointsMixin, EntityEndpoint):
             prefix (str): job prefix.
             owner_id (str, optional): owner ID.
             compute (dict, optional): compute configuration.
+            deadline (float, optional): seconds after which TimeoutError is raised. The deadline bounds the timeout
+                of every attempt and the waits between retries. A timeout bounds each socket read, so a response
+                still arriving when the deadline passes may take longer to receive.
 
         Returns:
             list: List of created jobs.
         """
+        deadline = Deadline(deadline) if deadline is not None else None
         jobs = []
         for material in materials:
             job_name = " ".join((prefix, material["formula"]))
             job_config = self.build_config([material["_id"]], workflow_id, project_id, owner_id, job_name, compute)
-            jobs.append(self.create(job_config))
+            jobs.append(self.create(job_config, deadline=deadline))
         return jobs
 
+    def create_many(self, materials, workflow_id, project_id, prefix, owner_id=None, compute=None,
+                    workers=DEFAULT_WORKERS, checkpoint=None):
+        """
+        Creates jobs from the given materials concurrently.
+
+        A failure to create one job does not stop the others. If a checkpoint file is given, IDs of created jobs are
+        recorded in it as they are created, and materials already recorded are skipped, so that re-running an
+        interrupted batch only creates the missing jobs.
+
+        Args:
+            materials (list[dict]): list of materials.
+            workflow_id (str): workflow ID.
+            project_id (str): project ID.
+            prefix (str): job prefix.
+            owner_id (str, optional): owner ID.
+            compute (dict, optional): compute configuration.
+            workers (int): maximum number of jobs created concurrently.
+            checkpoint (str, optional): path to a JSON lines file mapping material IDs to created job IDs.
+
+        Returns:
+            BatchResult: created jobs and errors by material ID. Jobs restored from the checkpoint only contain `_id`.
+
+        Raises:
+            ValueError: if materials contain the same ID more than once, as only one job would be created for them.
+        """
+        duplicates = sorted(id_ for id_, count in Counter(material["_id"] for material in materials).items()
+                            if count > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate material IDs: {', '.join(duplicates)}")
+        checkpoint = Checkpoint(checkpoint) if checkpoint else None
+        pending = [material for material in materials if not (checkpoint and material["_id"] in checkpoint)]
+
+        def create(material):
+            job_name = " ".join((prefix, material["formula"]))
+            return self.create(self.build_config([material["_id"]], workflow_id, project_id, owner_id, job_name,
+                                                 compute))
+
+        def save(material_id, job):
+            if checkpoint:
+                checkpoint.save(material_id, job["_id"])
+
+        batch = run_batch(create, pending, key=lambda material: material["_id"], workers=workers, on_success=save)
+        if checkpoint:
+            for material in materials:
+                if material["_id"] not in batch.results and material["_id"] in checkpoint:
+                    batch.results[material["_id"]] = {"_id": checkpoint.data[material["_id"]]}
+        return batch
+
+    def submit_many(self, ids, workers=DEFAULT_WORKERS):
+        """
+        Submits given jobs concurrently. A failure to submit one job does not stop the others.
+
+        Args:
+            ids (list[str]): job IDs.
+            workers (int): maximum number of jobs submitted concurrently.
+
+        Returns:
+            BatchResult: errors by job ID. Results are None for submitted jobs.
+        """
+        return run_batch(self.submit, ids, key=lambda id_: id_, workers=workers)
+
+    def watch(self, ids, poll_interval=DEFAULT_POLL_INTERVAL, max_poll_interval=DEFAULT_MAX_POLL_INTERVAL,
+              backoff=DEFAULT_POLL_BACKOFF, timeout=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Watches given jobs until all of them reach a terminal status.
+
+        Statuses of all unfinished jobs are fetched with one `$in` list query per chunk of IDs. The polling interval
+        grows by `backoff` after each poll without changes, up to `max_poll_interval`, and is reset on any change.
+
+        Args:
+            ids (list[str]): job IDs.
+            poll_interval (float): initial polling interval in seconds.
+            max_poll_interval (float): maximum polling interval in seconds.
+            backoff (float): polling interval multiplier applied when no status changed.
+            timeout (float): seconds after which TimeoutError is raised if jobs are still pending. Statuses are polled
+                once more when the timeout expires. Waits forever if not set.
+            chunk_size (int): maximum number of job IDs per request.
+
+        Yields:
+            dict: status change event {"_id": str, "status": str, "previousStatus": str}. The first event of each job
+                has previousStatus set to None.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        statuses = dict.fromkeys(ids)
+        pending = list(statuses)
+        interval = poll_interval
+        while True:
+            pages = map_concurrently(self._list_statuses, chunked(pending, chunk_size))
+            events = self._update_statuses(statuses, pending, [job for page in pages for job in page])
+            yield from events
+            pending = [id_ for id_ in pending if statuses[id_] not in JOB_TERMINAL_STATUSES]
+            if not pending:
+                return
+            interval = poll_interval if events else min(interval * backoff, max_poll_interval)
+            wait = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Jobs did not finish within {timeout} seconds: {pending}")
+                wait = min(interval, remaining)
+            time.sleep(wait)
+
+    def _list_statuses(self, ids):
+        """
+        Returns current statuses of given jobs. Statuses change while jobs run, so responses are never cached.
+
+        Args:
+            ids (list[str]): job IDs.
+
+        Returns:
+            list[dict]: [{"_id": str, "status": str}]
+        """
+        params = {"query": json.dumps({"_id": {"$in": ids}}), "projection": json.dumps(JOB_STATUS_PROJECTION)}
+        return self.request("GET", self.name, params=params, headers=self.headers, use_cache=False)
+
+    @staticmethod
+    def _update_statuses(statuses, pending, jobs):
+        """
+        Records new job statuses and returns status change events.
+
+        Args:
+            statuses (dict): last known statuses by job ID, updated in place.
+            pending (list[str]): IDs of polled jobs.
+            jobs (list[dict]): polled jobs.
+
+        Returns:
+            list[dict]
+        """
+        found = {job["_id"]: job["status"] for job in jobs}
+        missing = [id_ for id_ in pending if id_ not in found]
+        if missing:
+            raise ValueError(f"Jobs not found: {missing}")
+        events = []
+        for id_ in pending:
+            if found[id_] != statuses[id_]:
+                events.append({"_id": id_, "status": found[id_], "previousStatus": statuses[id_]})
+                statuses[id_] = found[id_]
+        return events
+
     def get_presigned_urls(self, id_, files):
         """
         Returns presigned URLS to upload given job files.
@@ -150,7 +323,7 @@ class JobEndpoints(EntitySetEndpointsMixin, EntityEndpoint):
 
     def list_files(self, id_):
         """
-        Returns a list of job files.
+        Returns a list of job files. Responses are never cached, as signed URLs expire.
 
         Args:
             id_ (str): job ID.
@@ -159,9 +332,93 @@ class JobEndpoints(EntitySetEndpointsMixin, EntityEndpoint):
             list: [{ "key" : str, "size" : int, "bucket" : str, "region" : str,
                      "provider" : str, "lastModified" : int, "name" : str, "signedURL" : str }]
         """
-        response = self.request("GET", "/".join(("jobs", id_, "files")), headers=self.headers)
+        response = self.request("GET", "/".join(("jobs", id_, "files")), headers=self.headers, use_cache=False)
         return response
 
+    def download_files(self, id_, dest, patterns=None, workers=DEFAULT_WORKERS,
+                       chunk_size=DEFAULT_TRANSFER_CHUNK_SIZE):
+        """
+        Downloads job files from their signed URLs into a local directory.
+
+        Files are streamed to disk concurrently. Size and modification time of downloaded files are recorded in a
+        manifest inside `dest`, and files that did not change since are skipped. Interrupted downloads are resumed
+        only if the remote file did not change since they started.
+
+        Args:
+            id_ (str): job ID.
+            dest (str): local directory to download files into.
+            patterns (list[str]): glob patterns matched against file names. All files are downloaded if not set.
+            workers (int): maximum number of files downloaded concurrently.
+            chunk_size (int): number of bytes read and written at once.
+
+        Returns:
+            BatchResult: local paths and errors by file name.
+        """
+        files = [file for file in self.list_files(id_)
+                 if not patterns or any(fnmatch.fnmatch(file["name"], pattern) for pattern in patterns)]
+        os.makedirs(dest, exist_ok=True)
+        manifest = Checkpoint(os.path.join(dest, MANIFEST_FILENAME))
+        paths = {file["name"]: resolve_local_path(dest, file["name"]) for file in files}
+
+        def describe(file):
+            return {"size": file["size"], "lastModified": file["lastModified"]}
+
+        def is_current(file):
+            path = paths[file["name"]]
+            return (manifest.data.get(file["name"]) == describe(file) and os.path.exists(path)
+                    and os.path.getsize(path) == file["size"])
+
+        def download(file):
+            started = dict(describe(file), complete=False)
+            resume = manifest.data.get(file["name"]) == started
+            if not resume:
+                manifest.save(file["name"], started)
+            download_file(self.conn.session, file["signedURL"], paths[file["name"]], file["size"], chunk_size,
+                          self.conn.timeout, resume)
+            manifest.save(file["name"], describe(file))
+            return paths[file["name"]]
+
+        current = {file["name"] for file in files if is_current(file)}
+        pending = [file for file in files if file["name"] not in current]
+        batch = run_batch(download, pending, key=lambda file: file["name"], workers=workers)
+        batch.results.update((name, paths[name]) for name in current)
+        return batch
+
+    def upload_files(self, id_, paths, root=None, workers=DEFAULT_WORKERS, batch_size=DEFAULT_CHUNK_SIZE,
+                     retries=DEFAULT_UPLOAD_RETRIES, register=True):
+        """
+        Uploads local files into the job working directory.
+
+        Upload URLs are requested in batches and files are streamed from disk concurrently, each retried on failure.
+        Uploaded files are then registered with `insert_output_files`.
+
+        Args:
+            id_ (str): job ID.
+            paths (list[str]): local file paths.
+            root (str): local directory that remote paths are relative to. Defaults to the deepest directory containing
+                all files, e.g. remote paths of a/INCAR and b/INCAR are a/INCAR and b/INCAR.
+            workers (int): maximum number of files uploaded concurrently.
+            batch_size (int): maximum number of files per presigned URLs request.
+            retries (int): number of times a failed upload is retried.
+            register (bool): whether to register uploaded files as job output files.
+
+        Returns:
+            BatchResult: local paths and errors by remote file name.
+        """
+        root = root or os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths] or [os.curdir])
+        names = {os.path.relpath(path, root): path for path in paths}
+        urls = {}
+        for batch_names in chunked(list(names), batch_size):
+            urls.update((item["file"], item["URL"]) for item in self.get_presigned_urls(id_, batch_names))
+
+        def upload(name):
+            return upload_file(self.conn.session, urls[name], names[name], retries, self.conn.timeout)
+
+        batch = run_batch(upload, list(names), key=lambda name: name, workers=workers)
+        if register and batch.results:
+            self.insert_output_files(id_, json.dumps({"files": list(batch.results)}))
+        return batch
+
     def insert_output_files(self, id_, data):
         """
         Inserts job output files.
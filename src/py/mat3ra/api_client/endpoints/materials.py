@@ -19,12 +19,18 @@ class MaterialEndpoints(EntitySetEndpointsMixin, DefaultableEntityEndpointsMixin
         version (str): API version.
         secure (bool): whether to use secure http protocol (https vs http).
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
     Attributes:
         name (str): endpoint name.
     """
 
+    projections = dict(
+        EntityEndpoint.projections,
+        summary={"fields": {"_id": 1, "name": 1, "formula": 1, "createdAt": 1, "updatedAt": 1}},
+        flat={"fields": {"_id": 1, "name": 1, "tags": 1, "basis.coordinates": 1, "lattice": 1}},
+    )
+
     def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
         super(MaterialEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
         self.name = "materials"
@@ -60,6 +66,7 @@ class MaterialEndpoints(EntitySetEndpointsMixin, DefaultableEntityEndpointsMixin
             list[dict]: list of imported materials
         """
         materials = []
+        tags = list(tags)
         conn = BaseConnection()
         with conn:
             for material_id in material_ids:
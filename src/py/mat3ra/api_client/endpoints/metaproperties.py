@@ -1,4 +1,4 @@
-from .enums import DEFAULT_API_VERSION, SECURE
+from .enums import DEFAULT_API_VERSION, REFERENCE_DATA_CACHE_TTL, SECURE
 from .properties import BasePropertiesEndpoints
 
 
@@ -14,7 +14,7 @@ class MetaPropertiesEndpoints(BasePropertiesEndpoints):
         version (str): API version.
         secure (bool): whether to use secure http protocol (https vs http).
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
     Attributes:
         name (str): endpoint name.
@@ -23,6 +23,8 @@ class MetaPropertiesEndpoints(BasePropertiesEndpoints):
         headers (dict): default HTTP headers.
     """
 
+    cache_ttl = REFERENCE_DATA_CACHE_TTL
+
     def __init__(self, host, port, account_id, auth_token, version=DEFAULT_API_VERSION, secure=SECURE, **kwargs):
         super(MetaPropertiesEndpoints, self).__init__(host, port, account_id, auth_token, version, secure, **kwargs)
         self.name = "metaproperties"
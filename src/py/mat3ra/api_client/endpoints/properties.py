@@ -1,14 +1,24 @@
 from .entity import EntityEndpoint
-from .enums import DEFAULT_API_VERSION, SECURE
+from .enums import DEFAULT_API_VERSION, DEFAULT_CHUNK_SIZE, SECURE
+from ..utils.concurrency import DEFAULT_WORKERS, chunked, map_concurrently
+from ..utils.frames import build_property_columns
 
 
 class BasePropertiesEndpoints(EntityEndpoint):
+    projections = dict(
+        EntityEndpoint.projections,
+        summary={"fields": {"_id": 1, "data.name": 1, "source.info": 1}},
+        data={"fields": {"data": 1}},
+        scalars={"fields": {"_id": 1, "source.info.jobId": 1, "data.name": 1, "data.value": 1, "data.values": 1}},
+        band_gaps={"fields": {"_id": 1, "source.info.jobId": 1, "data.values.type": 1, "data.values.value": 1}},
+    )
+
     def build_property_selector(self, job_id, unit_flowchart_id, property_name):
         return {"source.info.jobId": job_id, "source.info.unitId": unit_flowchart_id, "data.name": property_name}
 
     def get_property(self, job_id, unit_flowchart_id, property_name):
         selector = self.build_property_selector(job_id, unit_flowchart_id, property_name)
-        return self.list(query=selector)[0]
+        return self.list(query=selector, projection={"limit": 1})[0]
 
     def get_band_gap_by_type(self, job_id, unit_flowchart_id, type):
         band_gaps = self.get_property(job_id, unit_flowchart_id, "band_gaps")["data"]
@@ -33,7 +43,7 @@ class PropertiesEndpoints(BasePropertiesEndpoints):
         version (str): API version.
         secure (bool): whether to use secure http protocol (https vs http).
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
     Attributes:
         name (str): endpoint name.
@@ -54,7 +64,7 @@ class PropertiesEndpoints(BasePropertiesEndpoints):
 
     def list_for_job(self, job_id):
         """
-        List properties for a job grouped by unit.
+        List properties for a job grouped by unit. Property values are not fetched.
 
         Args:
             job_id (str): Job ID.
@@ -62,14 +72,7 @@ class PropertiesEndpoints(BasePropertiesEndpoints):
         Returns:
             list[dict]: List of {"unit_id": str, "properties": [str, ...]}.
         """
-        properties = self.list(query={"source.info.jobId": job_id})
-        units = {}
-        for prop in properties:
-            unit_id = prop["source"]["info"]["unitId"]
-            if unit_id not in units:
-                units[unit_id] = []
-            units[unit_id].append(prop["data"]["name"])
-        return [{"unit_id": unit_id, "properties": names} for unit_id, names in units.items()]
+        return self.group_by_unit(self.list(query={"source.info.jobId": job_id}, projection="summary"))
 
     def get_for_job(self, job_id, property_name=None, unit_id=None):
         """
@@ -83,9 +86,116 @@ class PropertiesEndpoints(BasePropertiesEndpoints):
         Returns:
             list[dict]: List of property data dicts.
         """
+        query = self.build_job_query(job_id, property_name, unit_id)
+        return [prop["data"] for prop in self.list(query=query, projection="data")]
+
+    def list_for_jobs(self, job_ids, property_names=None, unit_id=None, projection=None,
+                      chunk_size=DEFAULT_CHUNK_SIZE, workers=DEFAULT_WORKERS):
+        """
+        Returns properties of many jobs, fetched with one `$in` list query per chunk of job IDs.
+
+        Args:
+            job_ids (list[str]): job IDs.
+            property_names (list[str], optional): property names, e.g. ["band_gaps", "total_energy"].
+            unit_id (str, optional): Unit flowchart ID.
+            projection (dict|str): Mongo projection or preset name. Defaults to {}.
+            chunk_size (int): maximum number of job IDs per request.
+            workers (int): maximum number of chunks fetched concurrently.
+
+        Returns:
+            list[dict]: properties.
+        """
+
+        def fetch(chunk):
+            query = self.build_job_query({"$in": chunk}, None, unit_id)
+            if property_names:
+                query["data.name"] = {"$in": list(property_names)}
+            return self.list(query, projection)
+
+        pages = map_concurrently(fetch, chunked(list(dict.fromkeys(job_ids)), chunk_size), workers)
+        return [prop for page in pages for prop in page]
+
+    def to_frame(self, job_ids, property_names, unit_id=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 workers=DEFAULT_WORKERS):
+        """
+        Returns scalar properties of many jobs as columns, one row per job, e.g. to screen thousands of jobs.
+        Properties holding typed values, such as band gaps, give one column per type, e.g. "band_gaps.direct".
+        Requires numpy. Pass the result to `pandas.DataFrame` to get a data frame.
+
+        Args:
+            job_ids (list[str]): job IDs, in row order.
+            property_names (list[str]): property names, e.g. ["band_gaps", "total_energy", "pressure"].
+            unit_id (str, optional): Unit flowchart ID. The first value found across units is kept if not set.
+            chunk_size (int): maximum number of job IDs per request.
+            workers (int): maximum number of chunks fetched concurrently.
+
+        Returns:
+            dict: column name to numpy array, starting with the "job_id" column. Missing values are NaN.
+        """
+        properties = self.list_for_jobs(job_ids, property_names, unit_id, "scalars", chunk_size, workers)
+        return build_property_columns(job_ids, properties)
+
+    def get_band_gaps(self, job_ids, unit_id, types=("direct", "indirect"), chunk_size=DEFAULT_CHUNK_SIZE,
+                      workers=DEFAULT_WORKERS, raise_missing=False):
+        """
+        Returns band gaps of many jobs, fetched with one `$in` list query per chunk of job IDs.
+
+        Args:
+            job_ids (list[str]): job IDs.
+            unit_id (str): Unit flowchart ID, e.g. "pw-nscf".
+            types (tuple[str]): band gap types.
+            chunk_size (int): maximum number of job IDs per request.
+            workers (int): maximum number of chunks fetched concurrently.
+            raise_missing (bool): whether to raise if some jobs have no band gaps property.
+
+        Returns:
+            dict: job ID to {type: value}, with None for types not computed. Jobs without band gaps map to None.
+        """
+        properties = self.list_for_jobs(job_ids, ["band_gaps"], unit_id, "band_gaps", chunk_size, workers)
+        band_gaps = dict.fromkeys(job_ids)
+        for prop in properties:
+            values = {value["type"]: value["value"] for value in prop["data"].get("values", [])}
+            band_gaps[prop["source"]["info"]["jobId"]] = {type_: values.get(type_) for type_ in types}
+        missing = [job_id for job_id, gaps in band_gaps.items() if gaps is None]
+        if missing and raise_missing:
+            raise ValueError(f"Band gaps not found for jobs: {missing}")
+        return band_gaps
+
+    @staticmethod
+    def build_job_query(job_id, property_name=None, unit_id=None):
+        """
+        Returns a query selecting job properties, optionally filtered by property name and/or unit.
+
+        Args:
+            job_id (str|dict): Job ID, or a query on it, e.g. {"$in": [...]}.
+            property_name (str, optional): Property name.
+            unit_id (str, optional): Unit flowchart ID.
+
+        Returns:
+            dict
+        """
         query = {"source.info.jobId": job_id}
         if property_name:
             query["data.name"] = property_name
         if unit_id:
             query["source.info.unitId"] = unit_id
-        return [prop["data"] for prop in self.list(query=query)]
+        return query
+
+    @staticmethod
+    def group_by_unit(properties):
+        """
+        Groups property names by unit.
+
+        Args:
+            properties (list[dict]): list of properties.
+
+        Returns:
+            list[dict]: List of {"unit_id": str, "properties": [str, ...]}.
+        """
+        units = {}
+        for prop in properties:
+            unit_id = prop["source"]["info"]["unitId"]
+            if unit_id not in units:
+                units[unit_id] = []
+            units[unit_id].append(prop["data"]["name"])
+        return [{"unit_id": unit_id, "properties": names} for unit_id, names in units.items()]
@@ -0,0 +1,25 @@
+from .fake_api import (
+    FakeConnectionError,
+    FakeMat3raAPI,
+    FakeMat3raServer,
+    FakeResponse,
+    FakeTransport,
+    create_async_transport,
+    make_material,
+    make_property,
+)
+from .query import apply_options, match_query, project
+
+__all__ = [
+    "FakeConnectionError",
+    "FakeMat3raAPI",
+    "FakeMat3raServer",
+    "FakeResponse",
+    "FakeTransport",
+    "apply_options",
+    "create_async_transport",
+    "make_material",
+    "make_property",
+    "match_query",
+    "project",
+]
@@ -0,0 +1,637 @@
+import asyncio
+import contextlib
+import datetime
+import gzip
+import hashlib
+import http
+import itertools
+import json
+import random
+import socket
+import threading
+import time
+import urllib.parse
+from collections import Counter, namedtuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..endpoints.enums import JOB_TERMINAL_STATUSES
+from ..utils.http import Transport
+from .query import apply_options, get_path_values, match_query
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+COLLECTIONS = ("materials", "workflows", "jobs", "projects", "properties", "metaproperties", "charges",
+               "bank-materials", "bank-workflows")
+BANK_COLLECTION_PREFIX = "bank-"
+DEFAULT_ACCOUNT_ID = "fake-account-id"
+DEFAULT_AUTH_TOKEN = "fake-auth-token"
+DEFAULT_ERROR_STATUS = 503
+JOB_SUBMITTED_STATUS = "submitted"
+JOB_ACTIVE_STATUS = "active"
+JOB_FINISHED_STATUS = "finished"
+PROPERTY_UNIT_IDS = ("pw-scf", "pw-nscf", "pw-relax")
+# fields looked up in hash indexes, besides `_id`, when queried by value or with $in
+INDEXED_FIELDS = {"properties": "source.info.jobId"}
+
+FakeResponse = namedtuple("FakeResponse", ("status", "headers", "body"))
+
+
+class FakeConnectionError(Exception):
+    """
+    Raised by the fake API to drop a connection without answering.
+    """
+
+
+class _APIError(Exception):
+    def __init__(self, status, message):
+        super(_APIError, self).__init__(message)
+        self.status = status
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
+def _get_lookup_values(condition):
+    """Returns the values a query condition selects by equality, or None if it cannot be answered from an index."""
+    if isinstance(condition, str):
+        return [condition]
+    if isinstance(condition, dict) and condition.keys() == {"$in"}:
+        return [value for value in condition["$in"] if isinstance(value, str)]
+    return None
+
+
+def _decode_body(body, headers):
+    """Decodes a request body sent as a dict, JSON text or form-encoded text, gzip-compressed or not."""
+    if body is None or isinstance(body, dict):
+        return body or {}
+    if isinstance(body, str):
+        body = body.encode()
+    if headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    if not body:
+        return {}
+    try:
+        return json.loads(body)
+    except ValueError:
+        return {key: values[0] for key, values in urllib.parse.parse_qs(body.decode()).items()}
+
+
+class FakeMat3raAPI(object):
+    """
+    In-memory stand-in of the Mat3ra REST API implementing the JSEND contract of the client endpoints: entity
+    collections with Mongo-style queries and projection options, job submission, bank entity copies and `users/me`.
+    It is served in-process by `FakeTransport` and `create_async_transport`, or over HTTP by `FakeMat3raServer`.
+
+    Failures are injected into answers, and latency into `serve` and `serve_async`, which the transports and the
+    server call, so that the same instance can be exercised through every client path. The instance is thread-safe.
+
+    Args:
+        latency (float|tuple): seconds each request takes, or a (min, max) range to draw from uniformly.
+        error_rate (float): fraction of requests answered with `error_status`.
+        error_status (int): HTTP status of injected errors.
+        job_duration (float): seconds after submission at which jobs finish.
+        access_token (str): bearer token requests must carry. Any credentials are accepted if not set.
+        account_id (str): ID of the default account returned by `users/me`.
+        seed (int): seed of the random numbers used to draw latencies and errors.
+
+    Attributes:
+        request_count (int): number of requests received.
+        requests (Counter): number of requests received per (method, route), e.g. ("GET", "materials/:id").
+        max_in_flight (int): largest number of requests served at once.
+    """
+
+    def __init__(self, latency=0, error_rate=0, error_status=DEFAULT_ERROR_STATUS, job_duration=0, access_token=None,
+                 account_id=DEFAULT_ACCOUNT_ID, seed=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.job_duration = job_duration
+        self.access_token = access_token
+        self.account_id = account_id
+        self.collections = {name: {} for name in COLLECTIONS}
+        self._indexes = {name: {} for name in INDEXED_FIELDS}
+        self.request_count = 0
+        self.requests = Counter()
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._failures = []
+        self._submitted_at = {}
+        self._ids = itertools.count(1)
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+
+    def insert(self, collection, documents):
+        """
+        Stores documents, adding `_id`, `createdAt` and `updatedAt` fields if missing.
+
+        Args:
+            collection (str): collection name, e.g. "materials".
+            documents (list[dict]): documents to store.
+
+        Returns:
+            list[dict]: stored documents.
+        """
+        with self._lock:
+            return [self._insert(collection, document) for document in documents]
+
+    def populate(self, materials=0, jobs=0, properties_per_job=0, atoms=2, payload_size=0):
+        """
+        Stores generated materials, finished jobs and properties of these jobs.
+
+        Args:
+            materials (int): number of materials.
+            jobs (int): number of jobs.
+            properties_per_job (int): number of properties per job, cycling through total energy, band gaps and
+                pressure.
+            atoms (int): number of atoms of each material.
+            payload_size (int): length of the description added to every document, to grow response sizes.
+
+        Returns:
+            dict: collection name to stored documents.
+        """
+        description = "x" * payload_size
+        stored = {"materials": self.insert("materials", [
+            make_material(index, atoms, description) for index in range(materials)
+        ])}
+        stored["jobs"] = self.insert("jobs", [
+            {"name": f"job {index}", "status": JOB_FINISHED_STATUS, "description": description}
+            for index in range(jobs)
+        ])
+        stored["properties"] = self.insert("properties", [
+            make_property(job["_id"], index, description)
+            for job in stored["jobs"] for index in range(properties_per_job)
+        ])
+        return stored
+
+    def fail_next(self, count=1, status=DEFAULT_ERROR_STATUS):
+        """
+        Makes the next requests fail, whatever the error rate.
+
+        Args:
+            count (int): number of requests to fail.
+            status (int): HTTP status to answer with. Connections are dropped without answering if None.
+        """
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def get_delay(self):
+        """
+        Returns the number of seconds the next request should take.
+
+        Returns:
+            float
+        """
+        if isinstance(self.latency, (tuple, list)):
+            with self._lock:
+                return self._random.uniform(*self.latency)
+        return self.latency
+
+    def serve(self, method, url, params=None, body=None, headers=None):
+        """
+        Answers a request after the configured latency, blocking the calling thread.
+
+        Returns:
+            FakeResponse
+        """
+        with self._track_in_flight():
+            delay = self.get_delay()
+            if delay:
+                time.sleep(delay)
+            return self.handle(method, url, params, body, headers)
+
+    async def serve_async(self, method, url, params=None, body=None, headers=None):
+        """
+        Answers a request after the configured latency, without blocking the event loop.
+
+        Returns:
+            FakeResponse
+        """
+        with self._track_in_flight():
+            delay = self.get_delay()
+            if delay:
+                await asyncio.sleep(delay)
+            return self.handle(method, url, params, body, headers)
+
+    def handle(self, method, url, params=None, body=None, headers=None):
+        """
+        Answers a request right away.
+
+        Args:
+            method (str): HTTP method.
+            url (str): request URL or path, e.g. "/api/2018-10-01/materials". Its query string is merged into `params`.
+            params (dict): URL parameters.
+            body (dict|str|bytes): request body.
+            headers (dict): request headers.
+
+        Returns:
+            FakeResponse
+
+        Raises:
+            FakeConnectionError: if the connection should be dropped.
+        """
+        method = method.upper()
+        headers = CaseInsensitiveDict(headers or {})
+        split_url = urllib.parse.urlsplit(url)
+        params = dict(urllib.parse.parse_qsl(split_url.query), **(params or {}))
+        path = split_url.path.strip("/").split("/", 2)[2:]
+        with self._lock:
+            self.request_count += 1
+            status = self._next_failure()
+            if status is None:
+                raise FakeConnectionError(f"{method} {url}")
+            if status:
+                return self._respond(status, {"status": "error", "data": {"message": "Injected failure"}})
+            try:
+                self._authorize(headers)
+                route, data = self._route(method, path[0] if path else "", params, _decode_body(body, headers))
+            except _APIError as error:
+                return self._respond(error.status, {"status": "error", "data": {"message": str(error)}})
+            self.requests[(method, route)] += 1
+        response = self._respond(http.HTTPStatus.OK, {"status": "success", "data": data})
+        if method == "GET":
+            etag = '"{}"'.format(hashlib.sha1(response.body).hexdigest())
+            if headers.get("If-None-Match") == etag:
+                return FakeResponse(http.HTTPStatus.NOT_MODIFIED, {"ETag": etag}, b"")
+            response.headers["ETag"] = etag
+        return response
+
+    @contextlib.contextmanager
+    def _track_in_flight(self):
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _next_failure(self):
+        """Returns the status of an injected failure, None to drop the connection or 0 to answer normally."""
+        if self._failures:
+            return self._failures.pop(0)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self.error_status
+        return 0
+
+    @staticmethod
+    def _respond(status, content):
+        body = json.dumps(content).encode()
+        return FakeResponse(int(status), {"Content-Type": "application/json", "Content-Length": str(len(body))}, body)
+
+    def _authorize(self, headers):
+        if self.access_token is None:
+            return
+        if headers.get("Authorization") != f"Bearer {self.access_token}":
+            raise _APIError(http.HTTPStatus.UNAUTHORIZED, "Unauthorized")
+
+    def _route(self, method, path, params, body):
+        """Dispatches a request on its path relative to the API version, returning the route name and data."""
+        segments = path.split("/")
+        if path == "users/me" and method == "GET":
+            return path, self._get_profile()
+        if path == "login" and method == "POST":
+            return path, {"X-Account-Id": self.account_id, "X-Auth-Token": DEFAULT_AUTH_TOKEN}
+        if path == "logout" and method == "POST":
+            return path, {}
+        if segments[0] not in self.collections:
+            raise _APIError(http.HTTPStatus.NOT_FOUND, f"Unknown endpoint {path}")
+        name = segments[0]
+        if len(segments) == 1 and method == "GET":
+            return name, self._list(name, json.loads(params.get("query") or "{}"),
+                                    json.loads(params.get("projection") or "{}"))
+        if len(segments) == 2 and segments[1] in ("create", "create-set") and method == "PUT":
+            return f"{name}/{segments[1]}", self._insert(name, body)
+        if len(segments) == 2 and segments[1] == "import" and method == "POST":
+            document = {"name": body.get("name"), "tags": list(body.get("tags") or ()), "format": body.get("format")}
+            return f"{name}/import", self._insert(name, document)
+        if len(segments) == 2:
+            id_ = segments[1]
+            if method == "GET":
+                return f"{name}/:id", self._get(name, id_)
+            if method == "PATCH":
+                return f"{name}/:id", self._update(name, id_, body)
+            if method == "DELETE":
+                return f"{name}/:id", self._delete(name, id_)
+        if len(segments) == 3 and method == "POST":
+            id_, action = segments[1:]
+            if action == "copy":
+                return f"{name}/:id/copy", self._copy(name, id_)
+            if action == "submit" and name == "jobs":
+                return f"{name}/:id/submit", self._submit(id_)
+            if action in ("set-default", "move-to-set"):
+                self._get(name, id_)
+                return f"{name}/:id/{action}", None
+        raise _APIError(http.HTTPStatus.NOT_FOUND, f"Unknown endpoint {method} {path}")
+
+    def _get_profile(self):
+        account = {"entity": {"_id": self.account_id, "name": "Fake User", "type": "personal"}, "isDefault": True}
+        return {"user": {"entity": {"defaultAccountId": self.account_id}}, "accounts": [account]}
+
+    def _insert(self, collection, document):
+        now = _now()
+        document = dict(document, createdAt=document.get("createdAt", now), updatedAt=document.get("updatedAt", now))
+        # IDs grow with insertion order, as Mongo ObjectIds do, so that cursor pagination on `_id` works
+        document.setdefault("_id", f"{next(self._ids):024x}")
+        self.collections[collection][document["_id"]] = document
+        self._index(collection, document)
+        return document
+
+    def _index(self, collection, document, remove=False):
+        if collection not in INDEXED_FIELDS:
+            return
+        index = self._indexes[collection]
+        for value in get_path_values(document, INDEXED_FIELDS[collection]):
+            if not isinstance(value, str):
+                continue
+            if remove:
+                index[value].discard(document["_id"])
+            else:
+                index.setdefault(value, set()).add(document["_id"])
+
+    def _find_candidates(self, collection, query):
+        """Returns documents that may match a query, looked up in indexes when possible and ordered by `_id`."""
+        documents = self.collections[collection]
+        ids = _get_lookup_values(query.get("_id"))
+        if ids is None and collection in INDEXED_FIELDS:
+            values = _get_lookup_values(query.get(INDEXED_FIELDS[collection]))
+            if values is not None:
+                index = self._indexes[collection]
+                ids = [id_ for value in values for id_ in index.get(value, ())]
+        if ids is None:
+            return documents.values()
+        return sorted((documents[id_] for id_ in set(ids) if id_ in documents), key=lambda document: document["_id"])
+
+    def _get(self, collection, id_):
+        self._advance_jobs(collection)
+        if id_ not in self.collections[collection]:
+            raise _APIError(http.HTTPStatus.NOT_FOUND, f"{collection} {id_} not found")
+        return self.collections[collection][id_]
+
+    def _list(self, collection, query, options):
+        self._advance_jobs(collection)
+        documents = (document for document in self._find_candidates(collection, query) if match_query(document, query))
+        return apply_options(documents, options)
+
+    def _update(self, collection, id_, modifier):
+        document = self._get(collection, id_)
+        self._index(collection, document, remove=True)
+        document.update(modifier.get("$set", modifier), updatedAt=_now())
+        self._index(collection, document)
+        return document
+
+    def _delete(self, collection, id_):
+        self._index(collection, self._get(collection, id_), remove=True)
+        del self.collections[collection][id_]
+        return None
+
+    def _copy(self, collection, id_):
+        document = {key: value for key, value in self._get(collection, id_).items() if key not in ("_id", "createdAt")}
+        document.pop("updatedAt", None)
+        if collection.startswith(BANK_COLLECTION_PREFIX):
+            # bank entities are copied into the account collection of the same kind
+            collection = collection[len(BANK_COLLECTION_PREFIX):]
+        return self._insert(collection, document)
+
+    def _submit(self, id_):
+        job = self._get("jobs", id_)
+        job.update(status=JOB_SUBMITTED_STATUS, updatedAt=_now())
+        self._submitted_at[id_] = time.monotonic()
+        return None
+
+    def _advance_jobs(self, collection):
+        """Moves submitted jobs to the active status, then to the finished one once `job_duration` has elapsed."""
+        if collection != "jobs":
+            return
+        now = time.monotonic()
+        for id_, submitted_at in list(self._submitted_at.items()):
+            job = self.collections["jobs"].get(id_)
+            status = JOB_FINISHED_STATUS if now - submitted_at >= self.job_duration else JOB_ACTIVE_STATUS
+            if job is None or job["status"] in JOB_TERMINAL_STATUSES:
+                del self._submitted_at[id_]
+            elif job["status"] != status:
+                job.update(status=status, updatedAt=_now())
+
+
+def make_material(index, atoms=2, description=""):
+    """
+    Returns a cubic silicon-like material config with the given number of atoms.
+
+    Args:
+        index (int): material number, used in its name.
+        atoms (int): number of atoms.
+        description (str): material description.
+
+    Returns:
+        dict
+    """
+    return {
+        "name": f"Si {index}",
+        "formula": f"Si{atoms}",
+        "tags": ["fake"],
+        "description": description,
+        "lattice": {"a": 5.468, "b": 5.468, "c": 5.468, "alpha": 90.0, "beta": 90.0, "gamma": 90.0, "type": "CUB",
+                    "units": {"length": "angstrom", "angle": "degree"}},
+        "basis": {
+            "elements": [{"id": i, "value": "Si"} for i in range(atoms)],
+            "coordinates": [{"id": i, "value": [i / atoms] * 3} for i in range(atoms)],
+            "units": "crystal",
+        },
+    }
+
+
+def make_property(job_id, index, description=""):
+    """
+    Returns a property of a job, cycling through total energy, band gaps and pressure with `index`, computed by the
+    units in `PROPERTY_UNIT_IDS`.
+
+    Args:
+        job_id (str): job ID.
+        index (int): property number.
+        description (str): property description.
+
+    Returns:
+        dict
+    """
+    kind = index % len(PROPERTY_UNIT_IDS)
+    source = {"type": "exabyte", "info": {"jobId": job_id, "unitId": PROPERTY_UNIT_IDS[kind]}}
+    if kind == 0:
+        data = {"name": "total_energy", "value": -260.0 - index, "units": "eV"}
+    elif kind == 1:
+        data = {"name": "band_gaps", "values": [{"type": "direct", "value": 2.5, "units": "eV"},
+                                                {"type": "indirect", "value": 0.6, "units": "eV"}]}
+    else:
+        data = {"name": "pressure", "value": 1.0 * index, "units": "kbar"}
+    return {"source": source, "data": data, "description": description}
+
+
+class FakeTransport(Transport):
+    """
+    Transport answering requests of synchronous clients and connections with a fake API, in-process.
+
+    Args:
+        api (FakeMat3raAPI): fake API. A new one is created if not passed.
+    """
+
+    def __init__(self, api=None):
+        self.api = api or FakeMat3raAPI()
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None, stream=False):
+        request = requests.Request(method.upper(), url, params=params, headers=headers).prepare()
+        try:
+            status, response_headers, body = self.api.serve(method, request.url, body=data, headers=headers)
+        except FakeConnectionError as error:
+            raise requests.ConnectionError(str(error), request=request) from None
+        response = requests.Response()
+        response.status_code = status
+        response.reason = http.HTTPStatus(status).phrase
+        response.headers = CaseInsensitiveDict(response_headers)
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        response._content = body
+        response._content_consumed = True
+        return response
+
+
+def create_async_transport(api=None):
+    """
+    Creates a transport answering requests of asynchronous clients with a fake API, in-process. Requires httpx.
+
+    Args:
+        api (FakeMat3raAPI): fake API. A new one is created if not passed.
+
+    Returns:
+        httpx.MockTransport
+    """
+    if httpx is None:
+        raise ImportError("httpx is required for asyncio support: pip install 'mat3ra-api-client[async]'")
+    api = api or FakeMat3raAPI()
+
+    async def handler(request):
+        body = await request.aread()
+        try:
+            status, headers, body = await api.serve_async(request.method, str(request.url), body=body,
+                                                          headers=dict(request.headers))
+        except FakeConnectionError as error:
+            raise httpx.ConnectError(str(error), request=request) from None
+        return httpx.Response(status, headers=headers, content=body)
+
+    return httpx.MockTransport(handler)
+
+
+SERVER_BACKLOG = 1024
+
+
+class FakeMat3raServer(object):
+    """
+    Local HTTP/1.1 server answering requests with a fake API, to exercise the whole client stack including sockets and
+    connection pools without network. Connections are kept alive and served by an event loop in a background thread,
+    so that hundreds of concurrent connections waiting for the injected latency cost no threads.
+
+    Args:
+        api (FakeMat3raAPI): fake API. A new one is created if not passed.
+        host (str): interface to listen on.
+        port (int): port to listen on. A free port is picked if 0.
+
+    Attributes:
+        connection_count (int): number of TCP connections accepted.
+    """
+
+    def __init__(self, api=None, host="127.0.0.1", port=0):
+        self.api = api or FakeMat3raAPI()
+        self.connection_count = 0
+        self._socket = socket.create_server((host, port), backlog=SERVER_BACKLOG)
+        self._loop = None
+        self._thread = None
+
+    @property
+    def host(self):
+        return self._socket.getsockname()[0]
+
+    @property
+    def port(self):
+        return self._socket.getsockname()[1]
+
+    async def _serve_connection(self, reader, writer):
+        self.connection_count += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+                method, target = request_line.split(" ")[:2]
+                headers = CaseInsensitiveDict(line.split(":", 1) for line in header_lines)
+                headers = CaseInsensitiveDict({name: value.strip() for name, value in headers.items()})
+                length = int(headers.get("Content-Length") or 0)
+                body = await reader.readexactly(length) if length else b""
+                try:
+                    status, response_headers, body = await self.api.serve_async(method, target, body=body,
+                                                                                headers=headers)
+                except FakeConnectionError:
+                    return
+                response_headers = dict(response_headers, **{"Content-Length": str(len(body))})
+                lines = [f"HTTP/1.1 {status} {http.HTTPStatus(status).phrase}"]
+                lines.extend(f"{name}: {value}" for name, value in response_headers.items())
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                if headers.get("Connection", "").lower() == "close":
+                    return
+        except asyncio.CancelledError:
+            # connections still open when the server stops
+            return
+        finally:
+            writer.close()
+
+    def _run(self, ready):
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(asyncio.start_server(self._serve_connection, sock=self._socket))
+        ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            server.close()
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.close()
+
+    def start(self):
+        """
+        Starts serving requests in a background thread.
+
+        Returns:
+            FakeMat3raServer
+        """
+        if self._thread is None:
+            ready = threading.Event()
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run, args=(ready,), daemon=True)
+            self._thread.start()
+            ready.wait()
+        return self
+
+    def stop(self):
+        """
+        Stops serving requests and closes the listening socket and open connections.
+        """
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+        self._socket.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,166 @@
+import copy
+import operator
+
+_COMPARISONS = {"$gt": operator.gt, "$gte": operator.ge, "$lt": operator.lt, "$lte": operator.le}
+
+
+def get_path_values(document, path):
+    """
+    Returns values found at a dotted path, descending into lists of subdocuments as Mongo does, e.g. "data.values.type"
+    yields the type of every element of `data.values`.
+
+    Args:
+        document (dict): document to look into.
+        path (str): dotted field path.
+
+    Returns:
+        list
+    """
+    values = [document]
+    for key in path.split("."):
+        found = []
+        for value in values:
+            for item in value if isinstance(value, list) else (value,):
+                if isinstance(item, dict) and key in item:
+                    found.append(item[key])
+        values = found
+    return values
+
+
+def _compare(candidates, compare, argument):
+    for candidate in candidates:
+        try:
+            if compare(candidate, argument):
+                return True
+        except TypeError:
+            continue
+    return False
+
+
+def _match_operator(candidates, name, argument):
+    if name == "$in":
+        return any(candidate in argument for candidate in candidates)
+    if name == "$nin":
+        return not any(candidate in argument for candidate in candidates)
+    if name == "$ne":
+        return argument not in candidates
+    if name == "$exists":
+        return bool(candidates) == bool(argument)
+    if name in _COMPARISONS:
+        return _compare(candidates, _COMPARISONS[name], argument)
+    raise ValueError(f"Unsupported query operator {name}")
+
+
+def _match_condition(values, condition):
+    # array fields match conditions on any of their elements
+    candidates = values + [item for value in values if isinstance(value, list) for item in value]
+    if isinstance(condition, dict) and condition and all(key.startswith("$") for key in condition):
+        return all(_match_operator(candidates, name, argument) for name, argument in condition.items())
+    return condition in candidates
+
+
+def match_query(document, query):
+    """
+    Checks whether a document matches a Mongo query. Supports equality on dotted paths, $and, $or, $in, $nin, $ne,
+    $exists, $gt, $gte, $lt and $lte.
+
+    Args:
+        document (dict): document to check.
+        query (dict): Mongo query.
+
+    Returns:
+        bool
+    """
+    for key, condition in query.items():
+        if key == "$and":
+            matched = all(match_query(document, item) for item in condition)
+        elif key == "$or":
+            matched = any(match_query(document, item) for item in condition)
+        else:
+            matched = _match_condition(get_path_values(document, key), condition)
+        if not matched:
+            return False
+    return True
+
+
+def _copy_path(source, target, keys):
+    key, rest = keys[0], keys[1:]
+    if key not in source:
+        return
+    value = source[key]
+    if not rest:
+        target[key] = copy.deepcopy(value)
+    elif isinstance(value, dict):
+        if isinstance(target.setdefault(key, {}), dict):
+            _copy_path(value, target[key], rest)
+    elif isinstance(value, list):
+        items = [item for item in value if isinstance(item, dict)]
+        projected = target.setdefault(key, [{} for _ in items])
+        for item, projected_item in zip(items, projected):
+            if isinstance(projected_item, dict):
+                _copy_path(item, projected_item, rest)
+
+
+def _drop_path(document, keys):
+    key, rest = keys[0], keys[1:]
+    if key not in document:
+        return
+    if not rest:
+        del document[key]
+        return
+    for item in document[key] if isinstance(document[key], list) else (document[key],):
+        if isinstance(item, dict):
+            _drop_path(item, rest)
+
+
+def project(document, fields=None):
+    """
+    Applies Mongo projection fields to a document, either inclusive, e.g. {"name": 1}, or exclusive, e.g.
+    {"basis": 0}. `_id` is included unless excluded explicitly.
+
+    Args:
+        document (dict): document to project.
+        fields (dict): dotted field path to 1 or 0. The whole document is returned if not set.
+
+    Returns:
+        dict: projected copy of the document.
+    """
+    fields = fields or {}
+    included = [path for path, flag in fields.items() if flag]
+    if not included:
+        result = copy.deepcopy(document)
+        for path in fields:
+            _drop_path(result, path.split("."))
+        return result
+    if fields.get("_id", 1):
+        included.insert(0, "_id")
+    result = {}
+    for path in included:
+        _copy_path(document, result, path.split("."))
+    return result
+
+
+def _sort_key(document, path):
+    values = get_path_values(document, path)
+    # documents missing the field come first, as in Mongo
+    return (0, None) if not values else (1, values[0])
+
+
+def apply_options(documents, options):
+    """
+    Sorts, pages and projects documents with Meteor-style projection options.
+
+    Args:
+        documents (list[dict]): matching documents.
+        options (dict): options with optional `fields`, `sort`, `skip` and `limit` keys.
+
+    Returns:
+        list[dict]
+    """
+    documents = list(documents)
+    for path, direction in reversed(list((options.get("sort") or {}).items())):
+        documents.sort(key=lambda document: _sort_key(document, path), reverse=direction == -1)
+    skip = options.get("skip") or 0
+    limit = options.get("limit")
+    documents = documents[skip:skip + limit if limit else None]
+    return [project(document, options.get("fields")) for document in documents]
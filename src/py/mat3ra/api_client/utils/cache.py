@@ -0,0 +1,110 @@
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class ResponseCache(object):
+    """
+    Thread-safe in-memory LRU cache of response data with per-entry time to live.
+
+    Entries are keyed by HTTP method, endpoint path and URL parameters. Cached data is copied on the way in and out,
+    so that callers mutating results do not alter the cache.
+
+    Args:
+        maxsize (int): maximum number of entries. Least recently used entries are evicted first.
+
+    Attributes:
+        hits (int): number of lookups served from the cache.
+        misses (int): number of lookups not found in the cache or expired.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _reset_after_fork(self):
+        if self._pid != os.getpid():
+            # the lock may have been held by another thread of the parent process when it forked
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(method, endpoint_path, params=None):
+        """
+        Returns the cache key of a request.
+
+        Args:
+            method (str): HTTP method.
+            endpoint_path (str): endpoint path.
+            params (dict): URL parameters.
+
+        Returns:
+            tuple
+        """
+        return method.upper(), endpoint_path, tuple(sorted((params or {}).items()))
+
+    def get(self, key):
+        """
+        Returns cached data for the given key.
+
+        Args:
+            key (tuple): cache key.
+
+        Returns:
+            tuple: (found, data).
+        """
+        self._reset_after_fork()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            data = entry[1]
+        return True, copy.deepcopy(data)
+
+    def set(self, key, data, ttl):
+        """
+        Caches data for the given key.
+
+        Args:
+            key (tuple): cache key.
+            data: data to cache.
+            ttl (float): time to live in seconds.
+        """
+        data = copy.deepcopy(data)
+        self._reset_after_fork()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, collection=None):
+        """
+        Drops cached entries.
+
+        Args:
+            collection (str): first endpoint path segment, e.g. "materials", to drop entries of. All entries are
+                dropped if not set.
+        """
+        self._reset_after_fork()
+        with self._lock:
+            if collection is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[1].split("/")[0] == collection]:
+                del self._entries[key]
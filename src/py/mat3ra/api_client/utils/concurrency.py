@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DEFAULT_WORKERS = 8
+
+
+def chunked(items, size):
+    """
+    Splits items into consecutive chunks.
+
+    Args:
+        items (list): items to split.
+        size (int): maximum chunk size.
+
+    Returns:
+        list[list]
+    """
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def map_concurrently(func, items, workers=DEFAULT_WORKERS):
+    """
+    Applies a function to items in a pool of threads. Runs inline when there is at most one item or worker.
+
+    Args:
+        func (callable): function to apply.
+        items (list): function arguments.
+        workers (int): maximum number of threads.
+
+    Returns:
+        list: results in the order of items.
+    """
+    if len(items) <= 1 or workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+class BatchResult(object):
+    """
+    Per-item outcome of a batch operation.
+
+    Attributes:
+        results (dict): results of succeeded items by item key.
+        errors (dict): exceptions raised by failed items by item key.
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.errors = {}
+
+    @property
+    def ok(self):
+        """
+        Whether all items succeeded.
+
+        Returns:
+            bool
+        """
+        return not self.errors
+
+    def __repr__(self):
+        return f"BatchResult(succeeded={len(self.results)}, failed={len(self.errors)})"
+
+
+def run_batch(func, items, key, workers=DEFAULT_WORKERS, on_success=None):
+    """
+    Applies a function to items in a pool of threads, collecting results and errors per item instead of stopping
+    at the first failure.
+
+    Args:
+        func (callable): function to apply.
+        items (list): function arguments.
+        key (callable): returns the key identifying an item in the result.
+        workers (int): maximum number of threads.
+        on_success (callable): called with item key and result after each success, e.g. to save progress.
+
+    Returns:
+        BatchResult
+    """
+    batch = BatchResult()
+    if not items:
+        return batch
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as executor:
+        futures = {executor.submit(func, item): key(item) for item in items}
+        for future in as_completed(futures):
+            item_key = futures[future]
+            try:
+                batch.results[item_key] = future.result()
+            except Exception as e:
+                batch.errors[item_key] = e
+                continue
+            if on_success:
+                on_success(item_key, batch.results[item_key])
+    return batch
+
+
+class Checkpoint(object):
+    """
+    JSON lines file recording completed items of a batch operation, so an interrupted batch can be resumed.
+
+    Each completed item appends one {key: value} line, so that saving takes the same time however many items were
+    recorded before. Later lines override earlier ones, and a last line cut short by an interruption is ignored.
+
+    Args:
+        path (str): checkpoint file path. The file is created on first save.
+
+    Attributes:
+        data (dict): recorded values by item key.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {}
+        self._lock = threading.Lock()
+        content = ""
+        if os.path.exists(path):
+            with open(path) as f:
+                content = f.read()
+        for line in content.splitlines():
+            try:
+                self.data.update(json.loads(line))
+            except ValueError:
+                continue
+        # a line cut short is ended before appending, so that it does not swallow the next one
+        self._separator = "\n" if content and not content.endswith("\n") else ""
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def save(self, key, value):
+        """
+        Records a completed item and appends it to the checkpoint file.
+
+        Args:
+            key (str): item key.
+            value: JSON-serializable value.
+        """
+        line = json.dumps({key: value}) + "\n"
+        with self._lock:
+            self.data[key] = value
+            with open(self.path, "a") as f:
+                f.write(self._separator + line)
+            self._separator = ""
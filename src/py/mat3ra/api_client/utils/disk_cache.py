@@ -0,0 +1,111 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DISK_CACHE_FILENAME = "responses.sqlite"
+
+
+class DiskCache(object):
+    """
+    Persistent cache of response data stored in a SQLite database, surviving process restarts.
+
+    Entries are stored together with their ETag, if any, so that they can be revalidated with conditional requests.
+    The database is opened again in a forked child process, as SQLite connections must not be shared across processes.
+
+    Args:
+        cache_dir (str): directory of the cache database, "~" is expanded. Created if missing.
+
+    Attributes:
+        path (str): cache database path.
+    """
+
+    def __init__(self, cache_dir):
+        cache_dir = os.path.expanduser(cache_dir)
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, DISK_CACHE_FILENAME)
+        self._open()
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, collection TEXT, etag TEXT, body TEXT, stored_at REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_collection ON responses (collection)")
+
+    def _open(self):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._pid = os.getpid()
+
+    def _reset_after_fork(self):
+        if self._pid != os.getpid():
+            self._open()
+
+    @staticmethod
+    def make_key(scope, endpoint_path, params=None):
+        """
+        Returns the cache key of a GET request.
+
+        Args:
+            scope (tuple): values isolating entries of different servers and accounts.
+            endpoint_path (str): endpoint path.
+            params (dict): URL parameters.
+
+        Returns:
+            str
+        """
+        return json.dumps([list(scope), endpoint_path, sorted((params or {}).items())])
+
+    def get(self, key):
+        """
+        Returns the stored entry for the given key.
+
+        Args:
+            key (str): cache key.
+
+        Returns:
+            tuple: (etag, data), or None if not stored.
+        """
+        self._reset_after_fork()
+        with self._lock:
+            row = self._db.execute("SELECT etag, body FROM responses WHERE key = ?", (key,)).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def set(self, key, collection, data, etag=None):
+        """
+        Stores data for the given key.
+
+        Args:
+            key (str): cache key.
+            collection (str): first endpoint path segment, e.g. "materials".
+            data: JSON-serializable data.
+            etag (str): ETag of the response.
+        """
+        self._reset_after_fork()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, collection, etag, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (key, collection, etag, json.dumps(data), time.time()),
+            )
+
+    def invalidate(self, collection=None):
+        """
+        Drops stored entries.
+
+        Args:
+            collection (str): first endpoint path segment to drop entries of. All entries are dropped if not set.
+        """
+        self._reset_after_fork()
+        with self._lock, self._db:
+            if collection is None:
+                self._db.execute("DELETE FROM responses")
+            else:
+                self._db.execute("DELETE FROM responses WHERE collection = ?", (collection,))
+
+    def close(self):
+        """
+        Closes the cache database.
+        """
+        self._reset_after_fork()
+        self._db.close()
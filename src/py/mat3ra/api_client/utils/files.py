@@ -0,0 +1,123 @@
+import os
+import time
+
+import requests
+
+DEFAULT_TRANSFER_CHUNK_SIZE = 1024 * 1024
+MANIFEST_FILENAME = ".mat3ra-manifest.json"
+PARTIAL_FILE_SUFFIX = ".part"
+HTTP_STATUS_PARTIAL_CONTENT = 206
+HTTP_STATUS_RANGE_NOT_SATISFIABLE = 416
+# files are transferred as stored, so that sizes match and storage does not compress them on the fly
+TRANSFER_HEADERS = {"Accept-Encoding": "identity"}
+DEFAULT_UPLOAD_RETRIES = 3
+
+
+def resolve_local_path(root, name):
+    """
+    Returns the local path of a remote file under the given root directory.
+
+    Args:
+        root (str): local root directory.
+        name (str): remote file path relative to the job working directory.
+
+    Returns:
+        str
+    """
+    root = os.path.abspath(root)
+    path = os.path.abspath(os.path.join(root, name))
+    if os.path.commonpath((root, path)) != root:
+        raise ValueError(f"File {name} is outside of {root}")
+    return path
+
+
+def is_transient_error(error):
+    """
+    Returns whether a failed transfer may succeed if retried, i.e. it failed to connect, timed out or got a server
+    error. Client errors, e.g. 403 for an expired presigned URL, fail again.
+
+    Args:
+        error (requests.RequestException): transfer error.
+
+    Returns:
+        bool
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = getattr(error, "response", None)
+    return isinstance(error, requests.HTTPError) and response is not None and response.status_code >= 500
+
+
+def download_file(session, url, path, size=None, chunk_size=DEFAULT_TRANSFER_CHUNK_SIZE, timeout=None, resume=True):
+    """
+    Streams a file to disk chunk by chunk.
+
+    Data is written to a partial file next to the destination, which is renamed once complete. An existing partial
+    file is resumed with an HTTP Range request; it is rewritten from the start if the server ignores or rejects the
+    range. A partial file that already has the expected size is renamed without a request, so callers should only
+    resume partial files known to belong to the same version of the remote file.
+
+    Args:
+        session (requests.sessions.Session): session to download with.
+        url (str): file URL, e.g. a signed URL.
+        path (str): destination path.
+        size (int): expected file size in bytes. Not verified if not passed.
+        chunk_size (int): number of bytes read and written at once.
+        timeout (float|tuple): request timeout in seconds.
+        resume (bool): whether to resume an existing partial file. It is discarded otherwise.
+
+    Returns:
+        str: destination path.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial_path = path + PARTIAL_FILE_SUFFIX
+    offset = os.path.getsize(partial_path) if resume and os.path.exists(partial_path) else 0
+    if size is not None and offset > size:
+        offset = 0
+    if size is not None and offset == size and os.path.exists(partial_path):
+        os.replace(partial_path, path)
+        return path
+    headers = dict(TRANSFER_HEADERS, Range=f"bytes={offset}-") if offset else TRANSFER_HEADERS
+    response = session.request(method="GET", url=url, headers=headers, stream=True, timeout=timeout)
+    if offset and response.status_code == HTTP_STATUS_RANGE_NOT_SATISFIABLE:
+        # the partial file does not belong to the remote one, e.g. the file was replaced since
+        response.close()
+        offset = 0
+        response = session.request(method="GET", url=url, headers=TRANSFER_HEADERS, stream=True, timeout=timeout)
+    with response:
+        response.raise_for_status()
+        mode = "ab" if offset and response.status_code == HTTP_STATUS_PARTIAL_CONTENT else "wb"
+        with open(partial_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+    if size is not None and os.path.getsize(partial_path) != size:
+        raise IOError(f"Incomplete download of {url}: expected {size} bytes, got {os.path.getsize(partial_path)}")
+    os.replace(partial_path, path)
+    return path
+
+
+def upload_file(session, url, path, retries=DEFAULT_UPLOAD_RETRIES, timeout=None):
+    """
+    Uploads a file to a presigned URL, streaming it from disk instead of loading it into memory.
+
+    Args:
+        session (requests.sessions.Session): session to upload with.
+        url (str): presigned upload URL.
+        path (str): local file path.
+        retries (int): number of times an upload failing with a connection error, a timeout or a server error is
+            retried, waiting 1, 2, 4... seconds in between.
+        timeout (float|tuple): request timeout in seconds.
+
+    Returns:
+        str: local file path.
+    """
+    for attempt in range(retries + 1):
+        try:
+            with open(path, "rb") as f:
+                response = session.request(method="PUT", url=url, data=f, headers=TRANSFER_HEADERS, timeout=timeout)
+            response.raise_for_status()
+            return path
+        except requests.RequestException as error:
+            if attempt == retries or not is_transient_error(error):
+                raise
+            time.sleep(2 ** attempt)
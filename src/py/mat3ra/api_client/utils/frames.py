@@ -0,0 +1,131 @@
+import csv
+import importlib
+import numbers
+
+JOB_ID_COLUMN = "job_id"
+
+
+def _import_optional(name):
+    # imported on first use, as numpy and pyarrow would noticeably slow down importing the client
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError(f"{name} is required for tabular data: pip install 'mat3ra-api-client[tabular]'") from None
+
+
+def require_numpy():
+    """
+    Returns the numpy module, raising a helpful error if it is not installed.
+
+    Returns:
+        module
+    """
+    return _import_optional("numpy")
+
+
+def require_pyarrow():
+    """
+    Returns the pyarrow module, raising a helpful error if it is not installed.
+
+    Returns:
+        module
+    """
+    return _import_optional("pyarrow")
+
+
+def iter_scalar_values(data):
+    """
+    Yields scalar values of a property, e.g. ("total_energy", -260.7) or ("band_gaps.direct", 0.5) for properties
+    holding a list of typed values. Non-scalar properties, e.g. band structures, yield nothing.
+
+    Args:
+        data (dict): property data.
+
+    Yields:
+        tuple: (column name, value).
+    """
+    value = data.get("value")
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        yield data["name"], value
+    for item in data.get("values") or ():
+        if isinstance(item, dict) and "type" in item and isinstance(item.get("value"), numbers.Real):
+            yield f"{data['name']}.{item['type']}", item["value"]
+
+
+def build_property_columns(job_ids, properties):
+    """
+    Builds columns of scalar property values, one row per job. Values are written in place into preallocated float
+    arrays, NaN marking missing values. The first value found for a job is kept.
+
+    Args:
+        job_ids (list[str]): job IDs, in row order. Duplicates are dropped.
+        properties (iterable[dict]): properties with `source.info.jobId` and `data` fields.
+
+    Returns:
+        dict: column name to numpy array, starting with the "job_id" column.
+    """
+    np = require_numpy()
+    rows = {job_id: row for row, job_id in enumerate(dict.fromkeys(job_ids))}
+    columns = {JOB_ID_COLUMN: np.array(list(rows), dtype=object)}
+    for prop in properties:
+        row = rows.get(prop["source"]["info"]["jobId"])
+        if row is None:
+            continue
+        for name, value in iter_scalar_values(prop["data"]):
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = np.full(len(rows), np.nan)
+            if np.isnan(column[row]):
+                column[row] = value
+    return columns
+
+
+def to_arrow_table(columns):
+    """
+    Converts columns into an Arrow table. Numeric columns are converted without copying.
+
+    Args:
+        columns (dict): column name to array.
+
+    Returns:
+        pyarrow.Table
+    """
+    pa = require_pyarrow()
+    return pa.table({name: pa.array(column) for name, column in columns.items()})
+
+
+def write_csv(columns, path):
+    """
+    Writes columns into a CSV file with a header row.
+
+    Args:
+        columns (dict): column name to array.
+        path (str): destination file path.
+    """
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        values = [column.tolist() if hasattr(column, "tolist") else list(column) for column in columns.values()]
+        writer.writerows(zip(*values))
+
+
+def write_parquet(columns, path):
+    """
+    Writes columns into a Parquet file.
+
+    Args:
+        columns (dict): column name to array.
+        path (str): destination file path.
+    """
+    _import_optional("pyarrow.parquet").write_table(to_arrow_table(columns), path)
+
+
+def write_arrow(columns, path):
+    """
+    Writes columns into an Arrow IPC (Feather v2) file.
+
+    Args:
+        columns (dict): column name to array.
+        path (str): destination file path.
+    """
+    _import_optional("pyarrow.feather").write_feather(to_arrow_table(columns), path)
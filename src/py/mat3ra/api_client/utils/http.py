@@ -1,6 +1,24 @@
-import requests
+import email.utils
+import gzip
+import os
+import random
+import threading
+import time
 import urllib.parse
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+# responses telling that the request was not processed, so that it is safe to replay any method
+RETRY_ANY_METHOD_STATUS_CODES = (429, 503)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "DELETE")
+DEFAULT_TIMEOUT = 60
+GZIP_COMPRESS_LEVEL = 6
+
 
 def _extract_server_message(response: requests.Response) -> str:
     """Extract human-readable message from a JSEND-formatted error response body."""
@@ -11,25 +29,326 @@ def _extract_server_message(response: requests.Response) -> str:
         return ""
 
 
+def create_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE):
+    """
+    Creates an HTTP session advertising every response encoding supported by the installed packages, e.g.
+    "gzip,deflate,br,zstd" if brotli and zstandard are installed.
+
+    Args:
+        pool_connections (int): number of per-host connection pools to keep.
+        pool_maxsize (int): maximum number of keep-alive connections per host.
+
+    Returns:
+        requests.sessions.Session
+    """
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def compress_body(data, headers=None, min_size=None):
+    """
+    Gzip-compresses a request body if it is at least `min_size` bytes long.
+
+    Args:
+        data (dict|str|bytes): request body. Only str and bytes bodies are compressed.
+        headers (dict): request headers.
+        min_size (int): minimum body size in bytes to compress. Bodies are not compressed if not set.
+
+    Returns:
+        tuple: (data, headers), with Content-Encoding set if the body was compressed.
+    """
+    if min_size is None or not isinstance(data, (str, bytes)):
+        return data, headers
+    body = data.encode() if isinstance(data, str) else data
+    if len(body) < min_size:
+        return data, headers
+    return gzip.compress(body, GZIP_COMPRESS_LEVEL), dict(headers or {}, **{"Content-Encoding": "gzip"})
+
+
+class Transport(object):
+    """
+    Interface of objects sending the requests of connections in place of a `requests` session, e.g. to answer them
+    in-process without network. Transports take the arguments of `requests.Session.request` and return
+    `requests.Response` objects, so that a session is a transport too.
+    """
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None, stream=False):
+        """
+        Sends an HTTP request.
+
+        Args:
+            method (str): HTTP method to use.
+            url (str): URL to send.
+            params (dict): URL parameters to append to the URL.
+            data (dict|str|bytes): the body to attach to the request.
+            headers (dict): headers to send.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+            stream (bool): whether to defer downloading the response body until it is iterated over.
+
+        Returns:
+            requests.models.Response
+        """
+        raise NotImplementedError
+
+    def get(self, url, **kwargs):
+        """
+        Sends a GET request.
+
+        Returns:
+            requests.models.Response
+        """
+        return self.request("GET", url, **kwargs)
+
+    def close(self):
+        """
+        Releases resources held by the transport.
+        """
+
+
+class RetryPolicy(object):
+    """
+    Policy for retrying failed requests with exponential backoff.
+
+    Requests failing with a connection error or a retryable status are retried if their method is idempotent.
+    Non-idempotent requests, e.g. PUT to create an entity, are only retried on statuses telling that the request was
+    not processed (429, 503), so that entities are not created twice.
+
+    Args:
+        max_attempts (int): maximum number of attempts, including the first one.
+        backoff_base (float): delay before the first retry in seconds, doubled on each subsequent retry.
+        backoff_cap (float): maximum delay between attempts in seconds.
+        jitter (bool): whether to pick a random delay between zero and the backoff ("full jitter").
+        status_codes (tuple[int]): HTTP statuses to retry.
+        idempotent_methods (tuple[str]): HTTP methods safe to replay after any failure.
+    """
+
+    def __init__(self, max_attempts=4, backoff_base=0.5, backoff_cap=30, jitter=True, status_codes=RETRY_STATUS_CODES,
+                 idempotent_methods=IDEMPOTENT_METHODS):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.status_codes = status_codes
+        self.idempotent_methods = idempotent_methods
+
+    def should_retry(self, method, attempt, status_code=None):
+        """
+        Returns whether a failed attempt should be retried.
+
+        Args:
+            method (str): HTTP method.
+            attempt (int): number of the failed attempt, starting from 1.
+            status_code (int): HTTP status of the response. None for connection errors.
+
+        Returns:
+            bool
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if status_code is not None and status_code not in self.status_codes:
+            return False
+        return method.upper() in self.idempotent_methods or status_code in RETRY_ANY_METHOD_STATUS_CODES
+
+    def get_delay(self, attempt, retry_after=None):
+        """
+        Returns the delay before the next attempt, honoring the Retry-After header if present.
+
+        Args:
+            attempt (int): number of the failed attempt, starting from 1.
+            retry_after (str): value of the Retry-After response header, in seconds or as an HTTP date.
+
+        Returns:
+            float: delay in seconds.
+        """
+        delay = self._parse_retry_after(retry_after)
+        if delay is not None:
+            return min(delay, self.backoff_cap)
+        backoff = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    @staticmethod
+    def _parse_retry_after(retry_after):
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class Deadline(object):
+    """
+    Overall time budget shared by the requests of a long multi-request operation.
+
+    Args:
+        seconds (float): time budget in seconds.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        """
+        Returns the remaining time, raising TimeoutError once the deadline has passed.
+
+        Returns:
+            float: remaining time in seconds.
+        """
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Operation did not complete within {self.seconds} seconds")
+        return remaining
+
+    def clip(self, timeout):
+        """
+        Caps a request timeout by the remaining time.
+
+        Args:
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+
+        Returns:
+            float|tuple
+        """
+        remaining = self.remaining()
+        if isinstance(timeout, tuple):
+            return tuple(min(t, remaining) if t is not None else remaining for t in timeout)
+        return min(timeout, remaining) if timeout is not None else remaining
+
+
+class SessionPool(object):
+    """
+    Keep-alive HTTP session shared between connections.
+
+    Connections borrowing the session from the pool do not close it on exit, so TCP/TLS connections are reused
+    across requests and endpoints until the pool itself is closed. The session is created on first use, and created
+    again in a forked child process, so that connections of the parent are never shared.
+
+    Args:
+        pool_connections (int): number of per-host connection pools to keep.
+        pool_maxsize (int): maximum number of keep-alive connections per host.
+        idle_timeout (float): seconds of inactivity after which kept-alive connections are dropped.
+            Idle connections are never evicted if not set.
+
+    Attributes:
+        session (requests.sessions.Session): shared session instance.
+    """
+
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 idle_timeout=None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        self._session = None
+        self._lock = threading.Lock()
+        self._last_used = time.monotonic()
+        self._pid = os.getpid()
+
+    def _reset_after_fork(self):
+        if self._pid != os.getpid():
+            # connections inherited from the parent process are dropped without closing them, as they are still used
+            # by the parent
+            self._session = None
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+
+    @property
+    def session(self):
+        self._reset_after_fork()
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self):
+        return create_session(self.pool_connections, self.pool_maxsize)
+
+    def evict_idle(self):
+        """
+        Drops kept-alive connections if the pool has been idle for longer than `idle_timeout`.
+        The session stays usable and reconnects on the next request.
+        """
+        self._reset_after_fork()
+        now = time.monotonic()
+        with self._lock:
+            idle = self.idle_timeout is not None and now - self._last_used > self.idle_timeout
+            if idle and self._session is not None:
+                self._session.close()
+            self._last_used = now
+
+    def close(self):
+        """
+        Closes all pooled connections.
+        """
+        self._reset_after_fork()
+        if self._session is not None:
+            self._session.close()
+
+
 class BaseConnection(object):
     """
     Base connection class to inherit from. This class should not be instantiated directly.
 
+    A connection may be used by many threads at once. Each thread sees the last response it received itself, and a
+    private session is closed only when the last thread using the connection exits its "with" block.
+
     Args:
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple. Defaults to 60.
+            pool (SessionPool): shared session pool. A private session, created on first use and closed on exit, is
+                used if not passed.
+            retry_policy (RetryPolicy): policy for retrying failed requests. Requests are not retried if not passed.
+            compress_min_size (int): minimum size in bytes of request bodies sent gzip-compressed. Bodies are not
+                compressed if not set.
+            transport (Transport): transport sending requests instead of the session, e.g. a fake API server.
 
     Attributes:
         session (requests.sessions.Session): session instance.
-        response (requests.models.Response): response instance.
+        response (requests.models.Response): last response received by the calling thread.
     """
 
     def __init__(self, **kwargs):
-        self.response = None
-        self.session = requests.Session()
-        self.session.timeout = kwargs.get("timeout", 60)
+        self.pool = kwargs.get("pool")
+        self.retry_policy = kwargs.get("retry_policy")
+        self.timeout = kwargs.get("timeout", DEFAULT_TIMEOUT)
+        self.compress_min_size = kwargs.get("compress_min_size")
+        self.transport = kwargs.get("transport")
+        self._session = None
+        self._lock = threading.Lock()
+        self._users = 0
+        self._local = threading.local()
+        self._pid = os.getpid()
 
-    def request(self, method, url, params=None, data=None, headers=None):
+    @property
+    def response(self):
+        return getattr(self._local, "response", None)
+
+    @response.setter
+    def response(self, response):
+        self._local.response = response
+
+    @property
+    def session(self):
+        if self.pool:
+            return self.pool.session
+        if self._pid != os.getpid():
+            self._session, self._lock, self._users, self._pid = None, threading.Lock(), 0, os.getpid()
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = create_session()
+        return self._session
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None, stream=False, deadline=None):
         """
         Sends an HTTP request with given params, headers and data to the given url.
 
@@ -39,16 +358,55 @@ class BaseConnection(object):
             headers (dict): headers to send.
             data (dict): the body to attach to the request.
             params (dict): URL parameters to append to the URL.
+            timeout (float|tuple): request timeout overriding the connection one.
+            stream (bool): whether to defer downloading the response body until it is iterated over.
+            deadline (Deadline): overall time budget. Each attempt's timeout and each wait between retries are capped
+                by the remaining time, and TimeoutError is raised once it has run out.
+
+        Returns:
+            requests.models.Response
         """
-        self.response = self.session.request(method=method.lower(), url=url, params=params, data=data, headers=headers)
+        data, headers = compress_body(data, headers, self.compress_min_size)
+        attempt = 1
+        while True:
+            if self.pool:
+                self.pool.evict_idle()
+            attempt_timeout = timeout or self.timeout
+            if deadline is not None:
+                attempt_timeout = deadline.clip(attempt_timeout)
+            try:
+                sender = self.transport or self.session
+                response = sender.request(method=method.lower(), url=url, params=params, data=data, headers=headers,
+                                          timeout=attempt_timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout):
+                if not (self.retry_policy and self.retry_policy.should_retry(method, attempt)):
+                    raise
+                self._wait_before_retry(self.retry_policy.get_delay(attempt), deadline)
+                attempt += 1
+                continue
+            if self.retry_policy and self.retry_policy.should_retry(method, attempt, response.status_code):
+                if stream:
+                    response.close()
+                self._wait_before_retry(self.retry_policy.get_delay(attempt, response.headers.get("Retry-After")),
+                                        deadline)
+                attempt += 1
+                continue
+            break
+        self.response = response
         try:
-            self.response.raise_for_status()
+            response.raise_for_status()
         except requests.HTTPError:
-            status_code = self.response.status_code
-            server_message = _extract_server_message(self.response)
+            status_code = response.status_code
+            server_message = _extract_server_message(response)
             detail = server_message or "HTTP Error"
             message = f"Error {status_code}: {detail}."
-            raise requests.HTTPError(message, response=self.response) from None
+            raise requests.HTTPError(message, response=response) from None
+        return response
+
+    @staticmethod
+    def _wait_before_retry(delay, deadline=None):
+        # waiting past the deadline is pointless, the next attempt raises TimeoutError instead
+        time.sleep(min(delay, deadline.remaining()) if deadline is not None else delay)
 
     def get_response(self):
         """
@@ -119,13 +477,19 @@ class BaseConnection(object):
         """
         Support for "with" context.
         """
+        with self._lock:
+            self._users += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Support for "with" context.
+        Support for "with" context. Sessions borrowed from a pool are kept open, private sessions are closed once no
+        thread uses the connection anymore.
         """
-        self.session.close()
+        with self._lock:
+            self._users -= 1
+            if not self.pool and not self._users and self._session is not None:
+                self._session.close()
 
 
 class Connection(BaseConnection):
@@ -138,7 +502,7 @@ class Connection(BaseConnection):
         version (str): API version.
         secure (bool): whether to use secure http protocol (https vs http).
         kwargs (dict): a dictionary of HTTP session options.
-            timeout (int): session timeout in seconds.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
 
     Attributes:
         preamble (str): common part of URL endpoints, e.g. https://platform.mat3ra.com:4000/api/v1/.
@@ -148,7 +512,8 @@ class Connection(BaseConnection):
         self.preamble = "{}://{}:{}/api/{}/".format("https" if secure else "http", host, port, version)
         super(Connection, self).__init__(**kwargs)
 
-    def request(self, method, endpoint_path, params=None, data=None, headers=None):
+    def request(self, method, endpoint_path, params=None, data=None, headers=None, timeout=None, stream=False,
+                deadline=None):
         """
         Sends an HTTP request with given params, headers and data to the given endpoint.
 
@@ -158,6 +523,12 @@ class Connection(BaseConnection):
             headers (dict): headers to send.
             data (dict): the body to attach to the request.
             params (dict): URL parameters to append to the URL.
+            timeout (float|tuple): request timeout overriding the connection one.
+            stream (bool): whether to defer downloading the response body until it is iterated over.
+            deadline (Deadline): overall time budget of the request, including retries.
+
+        Returns:
+            requests.models.Response
         """
         url = urllib.parse.urljoin(self.preamble, endpoint_path)
-        super(Connection, self).request(method, url, params, data, headers)
+        return super(Connection, self).request(method, url, params, data, headers, timeout, stream, deadline)
@@ -0,0 +1,137 @@
+import asyncio
+import urllib.parse
+
+import requests
+
+from .http import DEFAULT_POOL_MAXSIZE, DEFAULT_TIMEOUT, _extract_server_message, compress_body
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+DEFAULT_MAX_CONCURRENCY = 100
+
+
+def to_httpx_timeout(timeout):
+    """
+    Converts a requests-style timeout into an httpx one.
+
+    Args:
+        timeout (float|tuple): timeout in seconds, or a (connect, read) tuple.
+
+    Returns:
+        httpx.Timeout
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def create_async_http_client(max_connections=DEFAULT_POOL_MAXSIZE, keepalive_expiry=None, timeout=DEFAULT_TIMEOUT,
+                             **kwargs):
+    """
+    Creates a non-blocking HTTP client with a bounded keep-alive connection pool.
+
+    Args:
+        max_connections (int): maximum number of open connections.
+        keepalive_expiry (float): seconds after which idle connections are closed.
+        timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+        kwargs (dict): additional `httpx.AsyncClient` options, e.g. transport.
+
+    Returns:
+        httpx.AsyncClient
+    """
+    if httpx is None:
+        raise ImportError("httpx is required for asyncio support: pip install 'mat3ra-api-client[async]'")
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                          keepalive_expiry=keepalive_expiry)
+    return httpx.AsyncClient(limits=limits, timeout=to_httpx_timeout(timeout), **kwargs)
+
+
+class AsyncConnection(object):
+    """
+    Non-blocking Exabyte connection class.
+
+    Args:
+        host (str): API hostname.
+        port (int): API port number.
+        version (str): API version.
+        secure (bool): whether to use secure http protocol (https vs http).
+        kwargs (dict): a dictionary of HTTP session options.
+            timeout (float|tuple): request timeout in seconds, or a (connect, read) tuple.
+            http_client (httpx.AsyncClient): shared HTTP client. A private client is created if not passed.
+            semaphore (asyncio.Semaphore): shared semaphore bounding the number of requests in flight.
+            max_concurrency (int): size of the private semaphore if a shared one is not passed.
+            retry_policy (RetryPolicy): policy for retrying failed requests. Requests are not retried if not passed.
+            compress_min_size (int): minimum size in bytes of request bodies sent gzip-compressed. Bodies are not
+                compressed if not set.
+
+    Attributes:
+        preamble (str): common part of URL endpoints, e.g. https://platform.mat3ra.com:4000/api/v1/.
+        client (httpx.AsyncClient): HTTP client instance.
+        semaphore (asyncio.Semaphore): semaphore bounding concurrent requests.
+    """
+
+    def __init__(self, host, port, version, secure, **kwargs):
+        self.preamble = "{}://{}:{}/api/{}/".format("https" if secure else "http", host, port, version)
+        timeout = kwargs.get("timeout", DEFAULT_TIMEOUT)
+        self.client = kwargs.get("http_client") or create_async_http_client(timeout=timeout)
+        self.semaphore = kwargs.get("semaphore") or asyncio.Semaphore(
+            kwargs.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        )
+        self.retry_policy = kwargs.get("retry_policy")
+        self.compress_min_size = kwargs.get("compress_min_size")
+
+    async def request(self, method, endpoint_path, params=None, data=None, headers=None, timeout=None, stream=False):
+        """
+        Sends an HTTP request with given params, headers and data to the given endpoint.
+
+        Args:
+            method (str): HTTP method to use.
+            endpoint_path (str): endpoint path.
+            headers (dict): headers to send.
+            data (dict|str|bytes): the body to attach to the request. Dicts are form-encoded, strings and bytes are
+                sent as is.
+            params (dict): URL parameters to append to the URL.
+            timeout (float|tuple): request timeout overriding the client one.
+            stream (bool): whether to defer reading the response body. Streamed responses must be closed.
+
+        Returns:
+            httpx.Response
+        """
+        url = urllib.parse.urljoin(self.preamble, endpoint_path)
+        data, headers = compress_body(data, headers, self.compress_min_size)
+        body = {"data": data} if isinstance(data, dict) else {"content": data}
+        if timeout is not None:
+            body["timeout"] = to_httpx_timeout(timeout)
+        attempt = 1
+        while True:
+            try:
+                async with self.semaphore:
+                    request = self.client.build_request(method.upper(), url, params=params, headers=headers, **body)
+                    response = await self.client.send(request, stream=stream)
+            except httpx.TransportError:
+                if not (self.retry_policy and self.retry_policy.should_retry(method, attempt)):
+                    raise
+                await asyncio.sleep(self.retry_policy.get_delay(attempt))
+                attempt += 1
+                continue
+            if self.retry_policy and self.retry_policy.should_retry(method, attempt, response.status_code):
+                await response.aclose()
+                await asyncio.sleep(self.retry_policy.get_delay(attempt, response.headers.get("Retry-After")))
+                attempt += 1
+                continue
+            break
+        if response.is_error:
+            await response.aread()
+            detail = _extract_server_message(response) or "HTTP Error"
+            raise requests.HTTPError(f"Error {response.status_code}: {detail}.", response=response)
+        return response
+
+    async def close(self):
+        """
+        Closes the underlying HTTP client.
+        """
+        await self.client.aclose()
@@ -0,0 +1,28 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+DEFAULT_JSON_BACKEND = "json"
+JSON_BACKENDS = ("json", "orjson")
+
+
+def get_json_loads(backend=DEFAULT_JSON_BACKEND):
+    """
+    Returns the function decoding JSON response bodies with the given backend.
+
+    Args:
+        backend (str): backend name, either "json" (standard library) or "orjson".
+
+    Returns:
+        callable: function decoding bytes or str into Python objects.
+    """
+    if backend == "json":
+        return json.loads
+    if backend == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is required for the orjson backend: pip install 'mat3ra-api-client[speedups]'")
+        return orjson.loads
+    raise ValueError(f"Unknown JSON backend '{backend}', expected one of {JSON_BACKENDS}")
@@ -1,7 +1,12 @@
+import array
 import urllib.parse
 
+from .frames import require_numpy
 from ..endpoints.enums import MATERIALSPROJECT_HOST, MATERIALSPROJECT_PORT, MATERIALSPROJECT_VERSION
 
+LATTICE_PARAMETERS = ("a", "b", "c", "alpha", "beta", "gamma")
+MATERIAL_COLUMNS = ("_id", "name", "tags", "atoms") + LATTICE_PARAMETERS
+
 
 def get_materialsproject_url(material_id):
     """
@@ -40,3 +45,36 @@ def flatten_material(material):
         lattice["beta"],
         lattice["gamma"],
     ]
+
+
+def flatten_materials(materials):
+    """
+    Flattens many materials into columns in a single pass. Numeric values are appended to compact typed buffers and
+    handed to numpy without copying, so materials can be consumed straight from `MaterialEndpoints.stream_list`, e.g.
+    with the "flat" projection preset, without holding them in memory. Requires numpy.
+
+    Args:
+        materials (iterable[dict]): material configs.
+
+    Returns:
+        dict: column name to numpy array, with the columns of `flatten_material` named as in `MATERIAL_COLUMNS`.
+    """
+    np = require_numpy()
+    ids, names, tags = [], [], []
+    atoms = array.array("q")
+    lattice = {key: array.array("d") for key in LATTICE_PARAMETERS}
+    for material in materials:
+        ids.append(material["_id"])
+        names.append(material["name"])
+        tags.append(", ".join(material["tags"]))
+        atoms.append(len(material["basis"]["coordinates"]))
+        for key, column in lattice.items():
+            column.append(material["lattice"][key])
+    columns = {
+        "_id": np.array(ids, dtype=object),
+        "name": np.array(names, dtype=object),
+        "tags": np.array(tags, dtype=object),
+        "atoms": np.frombuffer(atoms, dtype=np.int64),
+    }
+    columns.update((key, np.frombuffer(column, dtype=np.float64)) for key, column in lattice.items())
+    return columns
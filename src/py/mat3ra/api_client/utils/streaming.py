@@ -0,0 +1,168 @@
+import codecs
+import json
+import re
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+STREAMED_KEY = "data"
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# characters that may follow a complete value, and the tail of a number that the next chunk may continue
+_VALUE_END = re.compile(r"[ \t\n\r,:\]}]")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+_DECODER = json.JSONDecoder()
+
+_OBJECT_START, _FIRST_KEY, _KEY, _COLON, _VALUE, _FIRST_ITEM, _ITEM, _AFTER_ITEM, _AFTER_VALUE, _DONE = range(10)
+
+
+class JSENDStreamParser(object):
+    """
+    Incremental parser of JSEND responses, e.g. {"status": "success", "data": [...]}, yielding elements of the `data`
+    array as soon as they are received.
+
+    Chunks are fed in as they arrive from the socket. Only the unparsed tail of the body is buffered, so memory use is
+    bounded by the size of the largest element rather than the size of the response. Other top-level keys and a
+    `data` value that is not an array are collected in `envelope`.
+
+    Attributes:
+        envelope (dict): top-level keys other than a streamed `data` array.
+    """
+
+    def __init__(self):
+        self.envelope = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _OBJECT_START
+        self._key = None
+        self._retry_at = 0
+
+    def feed(self, chunk):
+        """
+        Parses a chunk of the response body.
+
+        Args:
+            chunk (bytes|str): next chunk of the body.
+
+        Returns:
+            list: elements of the `data` array completed by this chunk.
+        """
+        self._buffer = self._buffer[self._pos:] + (self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+        self._retry_at -= self._pos
+        self._pos = 0
+        if len(self._buffer) < self._retry_at:
+            return []
+        return self._parse(final=False)
+
+    def close(self):
+        """
+        Parses the rest of the body and checks that it is complete.
+
+        Returns:
+            list: remaining elements of the `data` array.
+        """
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != _DONE or self._buffer[self._pos:].strip():
+            raise ValueError("Incomplete or malformed JSEND response")
+        return items
+
+    def _skip_whitespace(self):
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else None
+
+    def _expect(self, char, *expected):
+        if char not in expected:
+            raise ValueError(f"Malformed JSEND response: expected {' or '.join(expected)} at {char!r}")
+        self._pos += 1
+
+    def _decode_value(self, final):
+        """
+        Decodes the JSON value at the current position. A value is decoded only when the character following it has
+        been received and ends it, so that e.g. numbers split between chunks, as in `1.` and `5`, are not cut short.
+
+        Returns:
+            tuple: (complete, value).
+        """
+        try:
+            value, end = _DECODER.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            end = None
+        if end is not None and end < len(self._buffer) and not _VALUE_END.match(self._buffer, end):
+            if final or not _NUMBER_TAIL.match(self._buffer, end):
+                raise ValueError(f"Malformed JSEND response: unexpected {self._buffer[end]!r} after value")
+            end = None
+        if end is None or (end == len(self._buffer) and not final):
+            # retry once the unparsed tail has doubled, to keep parsing of large values linear
+            self._retry_at = len(self._buffer) + (len(self._buffer) - self._pos)
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _parse(self, final):
+        items = []
+        while self._state != _DONE:
+            char = self._skip_whitespace()
+            if char is None:
+                break
+            if self._state == _OBJECT_START:
+                self._expect(char, "{")
+                self._state = _FIRST_KEY
+            elif self._state in (_FIRST_KEY, _KEY):
+                if char == "}" and self._state == _FIRST_KEY:
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                complete, self._key = self._decode_value(final)
+                if not complete:
+                    break
+                self._state = _COLON
+            elif self._state == _COLON:
+                self._expect(char, ":")
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                if self._key == STREAMED_KEY and char == "[":
+                    self._pos += 1
+                    self._state = _FIRST_ITEM
+                    continue
+                complete, value = self._decode_value(final)
+                if not complete:
+                    break
+                self.envelope[self._key] = value
+                self._state = _AFTER_VALUE
+            elif self._state in (_FIRST_ITEM, _ITEM):
+                if char == "]" and self._state == _FIRST_ITEM:
+                    self._pos += 1
+                    self._state = _AFTER_VALUE
+                    continue
+                complete, value = self._decode_value(final)
+                if not complete:
+                    break
+                items.append(value)
+                self._state = _AFTER_ITEM
+            elif self._state == _AFTER_ITEM:
+                self._expect(char, ",", "]")
+                self._state = _ITEM if char == "," else _AFTER_VALUE
+            elif self._state == _AFTER_VALUE:
+                self._expect(char, ",", "}")
+                self._state = _KEY if char == "," else _DONE
+        return items
+
+
+def iter_jsend_data(chunks, parser=None):
+    """
+    Yields elements of the `data` array of a JSEND response body received in chunks.
+
+    Args:
+        chunks (iterable[bytes]): chunks of the response body.
+        parser (JSENDStreamParser): parser to use, e.g. to inspect its envelope afterwards.
+
+    Yields:
+        json: element of the `data` array.
+    """
+    parser = parser or JSENDStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
@@ -0,0 +1,72 @@
+"""
+Benchmark of decoding and transferring realistic properties payloads.
+
+Run with `python tests/py/benchmarks/bench_json.py` after `pip install -e ".[speedups]"`. Reports the decode time
+of each available JSON backend and the size of the payload with each available content encoding.
+"""
+import gzip
+import json
+import random
+import timeit
+
+from mat3ra.api_client.utils.json_backends import JSON_BACKENDS, get_json_loads
+
+N_KPOINTS = 400
+N_BANDS = 64
+N_DOS_POINTS = 5000
+DECODE_NUMBER = 20
+
+
+def build_properties_response():
+    """Returns a JSEND response with a band structure and a density of states, as listed for a job."""
+    band_structure = {
+        "name": "band_structure",
+        "xDataArray": [[random.random() for _ in range(3)] for _ in range(N_KPOINTS)],
+        "yDataSeries": [[random.uniform(-10, 10) for _ in range(N_KPOINTS)] for _ in range(N_BANDS)],
+    }
+    density_of_states = {
+        "name": "density_of_states",
+        "xDataArray": [i * 0.01 for i in range(N_DOS_POINTS)],
+        "yDataSeries": [[random.random() for _ in range(N_DOS_POINTS)] for _ in range(2)],
+    }
+    properties = [
+        {"_id": str(i), "data": data, "source": {"info": {"jobId": "job", "unitId": "pw-bands"}}}
+        for i, data in enumerate((band_structure, density_of_states))
+    ]
+    return json.dumps({"status": "success", "data": properties}).encode()
+
+
+def encoded_sizes(body):
+    """Returns the payload size in bytes with each available content encoding."""
+    sizes = {"identity": len(body), "gzip": len(gzip.compress(body, 6))}
+    try:
+        import brotli
+
+        sizes["br"] = len(brotli.compress(body, quality=5))
+    except ImportError:
+        pass
+    try:
+        import zstandard
+
+        sizes["zstd"] = len(zstandard.ZstdCompressor(level=3).compress(body))
+    except ImportError:
+        pass
+    return sizes
+
+
+def main():
+    body = build_properties_response()
+    for encoding, size in encoded_sizes(body).items():
+        print(f"size {encoding:<18} {size / 1024:10.1f} KiB")
+    for backend in JSON_BACKENDS:
+        try:
+            loads = get_json_loads(backend)
+        except ImportError:
+            print(f"decode {backend:<16} not installed")
+            continue
+        seconds = timeit.timeit(lambda: loads(body), number=DECODE_NUMBER) / DECODE_NUMBER
+        print(f"decode {backend:<16} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
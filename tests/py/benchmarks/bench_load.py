@@ -0,0 +1,240 @@
+"""
+Load-testing harness measuring client throughput and latency against the number of concurrent workers.
+
+Run with `python tests/py/benchmarks/bench_load.py` after `pip install -e ".[async]"`. Workers share one client,
+either `APIClient` used from threads or `AsyncAPIClient` used from tasks, and send requests of a scenario for a fixed
+duration against a local fake Mat3ra server with injected latency. For every number of workers, the requests per
+second received by the server, p50 and p99 latencies of scenario operations, errors, TCP connections opened by the
+client and scaling efficiency relative to the first number of workers are reported, e.g.
+
+    python tests/py/benchmarks/bench_load.py --scenario harvest --mode async --workers 1 16 256 --csv harvest.csv
+
+The server runs in a separate process so that it does not compete with the client for the GIL. Being written in
+Python, it answers at most about a thousand requests per second per core, so for results to reflect the client, the
+host should have a core to spare for it and injected latencies should keep the load below that rate.
+"""
+import argparse
+import asyncio
+import csv
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mat3ra.api_client import APIClient, AsyncAPIClient
+from mat3ra.api_client.endpoints.properties import PropertiesEndpoints
+from mat3ra.api_client.testing import FakeMat3raAPI, FakeMat3raServer, make_material
+
+ACCESS_TOKEN = "oidc-access-token"
+N_JOBS = 1000
+PROPERTIES_PER_JOB = 3
+WATCHED_JOBS = 10
+# submitted jobs stay active for this long, so that watching them takes several polls
+JOB_DURATION = 0.2
+WATCH_POLL_INTERVAL = 0.05
+DEFAULT_WORKERS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+DEFAULT_DURATION = 2
+DEFAULT_LATENCY = 0.02
+MODES = ("threads", "async")
+
+
+def import_material(client, index, job_ids):
+    client.materials.create(make_material(index))
+
+
+def fan_out_job(client, index, job_ids):
+    job = client.jobs.create({"name": f"job {index}", "status": "pre-submission"})
+    client.jobs.submit(job["_id"])
+
+
+def watch_jobs(client, index, job_ids):
+    start = index * WATCHED_JOBS % len(job_ids)
+    ids = job_ids[start:start + WATCHED_JOBS]
+    client.jobs.submit_many(ids)
+    list(client.jobs.watch(ids, poll_interval=WATCH_POLL_INTERVAL, chunk_size=WATCHED_JOBS))
+
+
+def harvest_properties(client, index, job_ids):
+    client.properties.list(PropertiesEndpoints.build_job_query(job_ids[index % len(job_ids)]), "scalars")
+
+
+async def import_material_async(client, index, job_ids):
+    await client.materials.create(make_material(index))
+
+
+async def fan_out_job_async(client, index, job_ids):
+    job = await client.jobs.create({"name": f"job {index}", "status": "pre-submission"})
+    await client.jobs.submit(job["_id"])
+
+
+async def watch_jobs_async(client, index, job_ids):
+    start = index * WATCHED_JOBS % len(job_ids)
+    ids = job_ids[start:start + WATCHED_JOBS]
+    await asyncio.gather(*(client.jobs.submit(id_) for id_ in ids))
+    async for _ in client.jobs.watch(ids, poll_interval=WATCH_POLL_INTERVAL, chunk_size=WATCHED_JOBS):
+        pass
+
+
+async def harvest_properties_async(client, index, job_ids):
+    await client.properties.list(PropertiesEndpoints.build_job_query(job_ids[index % len(job_ids)]), "scalars")
+
+
+# scenario name to (threaded operation, asynchronous operation)
+SCENARIOS = {
+    "import": (import_material, import_material_async),
+    "fanout": (fan_out_job, fan_out_job_async),
+    # jobs are submitted again and watched until they finish after JOB_DURATION
+    "watch": (watch_jobs, watch_jobs_async),
+    "harvest": (harvest_properties, harvest_properties_async),
+}
+
+
+def serve(latency, pipe):
+    """Serves a populated fake API until told to stop, answering connection and request count queries meanwhile."""
+    api = FakeMat3raAPI(latency=latency, job_duration=JOB_DURATION)
+    jobs = api.populate(jobs=N_JOBS, properties_per_job=PROPERTIES_PER_JOB)["jobs"]
+    with FakeMat3raServer(api) as server:
+        pipe.send((server.host, server.port, [job["_id"] for job in jobs]))
+        while pipe.recv() != "stop":
+            pipe.send((server.connection_count, api.request_count))
+
+
+class ServerProcess(object):
+    """Fake Mat3ra server running in a child process."""
+
+    def __init__(self, latency):
+        self._pipe, child_pipe = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=serve, args=(latency, child_pipe), daemon=True)
+        self._process.start()
+        self.host, self.port, self.job_ids = self._pipe.recv()
+
+    def get_counts(self):
+        """Returns the numbers of TCP connections accepted and requests received so far."""
+        self._pipe.send("count")
+        return self._pipe.recv()
+
+    def stop(self):
+        self._pipe.send("stop")
+        self._process.join()
+
+
+def summarize(results, elapsed, requests):
+    latencies = sorted(latency for worker_latencies, _ in results for latency in worker_latencies)
+    count = len(latencies)
+
+    def percentile(fraction):
+        return latencies[int(fraction * (count - 1))] * 1000 if count else float("nan")
+
+    return {
+        "operations": count,
+        "requests_per_second": requests / elapsed,
+        "p50_ms": percentile(0.5),
+        "p99_ms": percentile(0.99),
+        "errors": sum(errors for _, errors in results),
+    }
+
+
+def run_threads(server, operation, workers, duration):
+    """Runs an operation from threads sharing one client, returning per-worker latencies and error counts."""
+    client = APIClient.authenticate(host=server.host, port=server.port, secure=False, access_token=ACCESS_TOKEN,
+                                    pool_maxsize=workers)
+    deadline = time.perf_counter() + duration
+
+    def worker(worker_id):
+        latencies, errors, index = [], 0, worker_id
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                operation(client, index, server.job_ids)
+            except Exception:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+            index += workers
+        return latencies, errors
+
+    with client, ThreadPoolExecutor(workers) as executor:
+        return list(executor.map(worker, range(workers)))
+
+
+def run_tasks(server, operation, workers, duration):
+    """Runs an operation from tasks sharing one asynchronous client, returning per-worker latencies and errors."""
+
+    async def run():
+        async with AsyncAPIClient.authenticate(host=server.host, port=server.port, secure=False,
+                                               access_token=ACCESS_TOKEN, pool_maxsize=workers,
+                                               max_concurrency=workers) as client:
+            deadline = time.perf_counter() + duration
+
+            async def worker(worker_id):
+                latencies, errors, index = [], 0, worker_id
+                while time.perf_counter() < deadline:
+                    start = time.perf_counter()
+                    try:
+                        await operation(client, index, server.job_ids)
+                    except Exception:
+                        errors += 1
+                    else:
+                        latencies.append(time.perf_counter() - start)
+                    index += workers
+                return latencies, errors
+
+            return await asyncio.gather(*(worker(worker_id) for worker_id in range(workers)))
+
+    return asyncio.run(run())
+
+
+def measure(server, scenario, mode, workers, duration):
+    threaded_operation, async_operation = SCENARIOS[scenario]
+    connections, requests = server.get_counts()
+    start = time.perf_counter()
+    if mode == "threads":
+        results = run_threads(server, threaded_operation, workers, duration)
+    else:
+        results = run_tasks(server, async_operation, workers, duration)
+    elapsed = time.perf_counter() - start
+    connection_count, request_count = server.get_counts()
+    summary = summarize(results, elapsed, request_count - requests)
+    summary["connections"] = connection_count - connections
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenario", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--mode", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--workers", nargs="+", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="seconds per number of workers")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="server latency in seconds")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    args = parser.parse_args()
+    server = ServerProcess(args.latency)
+    rows = []
+    try:
+        for scenario in args.scenario:
+            for mode in args.mode:
+                print(f"\n{scenario} ({mode}, {args.latency * 1000:g} ms server latency)")
+                print(f"{'workers':>8} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7} {'conns':>6} "
+                      f"{'efficiency':>10}")
+                baseline = None
+                for workers in args.workers:
+                    row = dict(scenario=scenario, mode=mode, workers=workers,
+                               **measure(server, scenario, mode, workers, args.duration))
+                    baseline = baseline or row
+                    baseline_rate = baseline["requests_per_second"] / baseline["workers"]
+                    row["efficiency"] = (row["requests_per_second"] / row["workers"] / baseline_rate
+                                         if baseline_rate else float("nan"))
+                    rows.append(row)
+                    print(f"{workers:8d} {row['requests_per_second']:10,.0f} {row['p50_ms']:9.1f} "
+                          f"{row['p99_ms']:9.1f} {row['errors']:7d} {row['connections']:6d} "
+                          f"{row['efficiency']:10.2f}")
+    finally:
+        server.stop()
+    if args.csv and rows:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Micro-benchmarks of the client-side overhead of requests, excluding network and server time.
+
+Run with `python tests/py/benchmarks/bench_request.py`. Requests are answered in-process by a transport returning a
+prebuilt response, so that only client code is timed. Reports operations per second, the peak memory allocated by one
+operation and the memory retained per operation, as traced by tracemalloc. Results can be saved with
+`--save results.json` and compared with a previous run with `--compare results.json`, to track regressions of the
+client itself separately from server latency.
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+import urllib.parse
+
+import requests
+from mat3ra.api_client import APIClient
+from mat3ra.api_client.endpoints.materials import MaterialEndpoints
+from mat3ra.api_client.models import AuthContext
+from mat3ra.api_client.testing import make_material
+from mat3ra.api_client.utils.http import Transport
+
+HOST = "platform.mat3ra.com"
+PORT = 443
+ACCOUNT_ID = "ubxMkAyx37Rjn8qK9"
+AUTH_TOKEN = "XihOnUA8EqytSui1icz6fYhsJ2tUsJGGTlV03upYPSF"
+ACCESS_TOKEN = "oidc-access-token"
+N_LISTED = 20
+N_QUERIED_IDS = 50
+MIN_TIME = 0.2
+REPEAT = 5
+RETAINED_NUMBER = 1000
+
+
+class StaticTransport(Transport):
+    """Transport answering every request with the same prebuilt response."""
+
+    def __init__(self, body):
+        self.response = requests.Response()
+        self.response.status_code = 200
+        self.response.reason = "OK"
+        self.response.headers["Content-Type"] = "application/json"
+        self.response._content = body
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None, stream=False):
+        return self.response
+
+
+def jsend(data):
+    return json.dumps({"status": "success", "data": data}).encode()
+
+
+def build_benchmarks():
+    """Returns (name, function) pairs of the operations to time."""
+    materials = [dict(make_material(i), _id=f"{i:024x}") for i in range(N_LISTED)]
+    list_body, get_body = jsend(materials), jsend(materials[0])
+    auth = AuthContext(access_token=ACCESS_TOKEN)
+    endpoint_options = dict(auth=auth, version="2018-10-01")
+    endpoint = MaterialEndpoints(HOST, PORT, ACCOUNT_ID, AUTH_TOKEN, transport=StaticTransport(get_body),
+                                 **endpoint_options)
+    list_endpoint = MaterialEndpoints(HOST, PORT, ACCOUNT_ID, AUTH_TOKEN, transport=StaticTransport(list_body),
+                                      **endpoint_options)
+    query = {"_id": {"$in": [f"{i:024x}" for i in range(N_QUERIED_IDS)]}}
+    path = "/".join(("materials", materials[0]["_id"]))
+
+    def encode_list_params():
+        projection = endpoint.resolve_projection("summary")
+        return {"query": json.dumps(query), "projection": json.dumps(projection)}
+
+    def construct_client(*endpoints):
+        client = APIClient.authenticate(host=HOST, port=PORT, secure=True, access_token=ACCESS_TOKEN)
+        for name in endpoints:
+            getattr(client, name)
+
+    return [
+        ("headers: build + bearer merge", lambda: endpoint._build_request_headers(endpoint.headers)),
+        ("url: urljoin", lambda: urllib.parse.urljoin(endpoint.conn.preamble, path)),
+        ("list: encode query + projection", encode_list_params),
+        (f"jsend: decode + unwrap {N_LISTED}", lambda: endpoint._unwrap_response(endpoint.json_loads(list_body))),
+        ("BaseEndpoint.request GET", lambda: endpoint.request("GET", path, headers=endpoint.headers)),
+        (f"EntityEndpoint.list {N_LISTED}", lambda: list_endpoint.list(query, "summary")),
+        ("APIClient()", construct_client),
+        ("APIClient() + materials", lambda: construct_client("materials")),
+    ]
+
+
+def time_operation(function, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return time.perf_counter() - start
+
+
+def measure(function):
+    """
+    Returns the best rate of an operation in operations per second, the peak memory in bytes allocated by one
+    operation and the memory in bytes retained per operation over many runs.
+    """
+    number = 1
+    while time_operation(function, number) < MIN_TIME / REPEAT:
+        number *= 2
+    ops = number / min(time_operation(function, number) for _ in range(REPEAT))
+    tracemalloc.start()
+    try:
+        function()
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        function()
+        peak = tracemalloc.get_traced_memory()[1] - current
+        # cyclic garbage, e.g. of clients referencing their accounts, is not counted as retained
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        time_operation(function, RETAINED_NUMBER)
+        gc.collect()
+        retained = (tracemalloc.get_traced_memory()[0] - current) / RETAINED_NUMBER
+    finally:
+        tracemalloc.stop()
+    return {"ops": ops, "peak": peak, "retained": retained}
+
+
+def format_change(result, baseline):
+    if not baseline:
+        return ""
+    return f"{(result['ops'] / baseline['ops'] - 1) * 100:+8.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare rates with results saved in this JSON file")
+    args = parser.parse_args()
+    baselines = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baselines = json.load(f)
+    print(f"{'benchmark':<36} {'ops/s':>12} {'peak KiB/op':>12} {'retained B/op':>14}")
+    results = {}
+    for name, function in build_benchmarks():
+        if args.filter not in name:
+            continue
+        result = results[name] = measure(function)
+        print(f"{name:<36} {result['ops']:12,.0f} {result['peak'] / 1024:12.1f} {result['retained']:14.1f}"
+              f"{format_change(result, baselines.get(name))}")
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark of package import and client construction time.
+
+Run with `python tests/py/benchmarks/bench_startup.py`. Every statement runs in a fresh interpreter, so that import
+time is included, e.g. of `from mat3ra.api_client import APIClient; APIClient.authenticate()`, the usual start of a
+script. Pass `--baseline` with the source directory of another revision to compare with it, e.g.
+
+    git worktree add /tmp/baseline <revision>
+    python tests/py/benchmarks/bench_startup.py --baseline /tmp/baseline/src/py
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+SRC_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src", "py")
+ENV = {"OIDC_ACCESS_TOKEN": "token", "API_HOST": "localhost", "API_PORT": "4000", "API_SECURE": "false"}
+ENDPOINTS = ("materials", "workflows", "jobs", "projects", "properties", "metaproperties", "bank_materials",
+             "bank_workflows", "clusters")
+REPEAT = 15
+
+CREATE_CLIENT = "from mat3ra.api_client import APIClient; client = APIClient.authenticate()"
+STATEMENTS = [
+    ("import mat3ra.api_client", "import mat3ra.api_client"),
+    ("import APIClient + APIClient()", CREATE_CLIENT),
+    ("... + one endpoint", f"{CREATE_CLIENT}; client.{ENDPOINTS[0]}"),
+    ("... + all endpoints", f"{CREATE_CLIENT}; " + "; ".join(f"client.{name}" for name in ENDPOINTS)),
+    ("import all names", "from mat3ra.api_client import *"),
+]
+
+
+def time_statement(statement, src_path):
+    """Returns the best wall time in seconds of running the statement in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=src_path, **ENV)
+    timings = []
+    for _ in range(REPEAT):
+        code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+        output = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True)
+        timings.append(float(output.stdout))
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--baseline", help="source directory of the revision to compare with")
+    args = parser.parse_args()
+    print(f"{'statement':<32} {'ms':>8}" + (f" {'baseline ms':>12} {'change':>8}" if args.baseline else ""))
+    for name, statement in STATEMENTS:
+        seconds = time_statement(statement, SRC_PATH)
+        line = f"{name:<32} {seconds * 1000:8.2f}"
+        if args.baseline:
+            baseline = time_statement(statement, args.baseline)
+            line += f" {baseline * 1000:12.2f} {(seconds / baseline - 1) * 100:+7.1f}%"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
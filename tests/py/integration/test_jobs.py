@@ -1,5 +1,4 @@
 import datetime
-import time
 
 from mat3ra.api_client.endpoints.jobs import JobEndpoints
 from tests.py.integration.entity import EntityIntegrationTest
@@ -18,7 +17,6 @@ JOB_STATUS_SUBMITTED = "submitted"
 JOB_STATUS_FINISHED = "finished"
 JOB_WAIT_TIMEOUT = 900
 JOB_WAIT_SLEEP_INTERVAL = 5
-JOB_TIMEOUT_ERROR = "job with ID {} did not finish within {} seconds"
 
 
 class JobEndpointsIntegrationTest(EntityIntegrationTest):
@@ -58,13 +56,8 @@ class JobEndpointsIntegrationTest(EntityIntegrationTest):
         self.update_entity_test()
 
     def _wait_for_job_to_finish(self, id_, timeout=JOB_WAIT_TIMEOUT):
-        end = time.time() + timeout
-        while time.time() < end:
-            job = self.endpoints.get(id_)
-            if job["status"] == JOB_STATUS_FINISHED:
-                return
-            time.sleep(JOB_WAIT_SLEEP_INTERVAL)
-        raise BaseException(JOB_TIMEOUT_ERROR.format(id_, timeout))
+        events = list(self.endpoints.watch([id_], poll_interval=JOB_WAIT_SLEEP_INTERVAL, timeout=timeout))
+        self.assertEqual(events[-1]["status"], JOB_STATUS_FINISHED)
 
     def test_submit_job_and_wait_to_finish(self):
         job = self.create_entity()
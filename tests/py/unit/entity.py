@@ -1,3 +1,5 @@
+import json
+
 from tests.py.unit import EndpointBaseUnitTest
 
 TEST_ENTITY_ID = "28FMvD5knJZZx452H"
@@ -6,6 +8,13 @@ MOCK_SUCCESS_RESPONSE_OBJECT = '{"status": "success", "data": {}}'
 HTTP_METHOD_GET = "get"
 HTTP_METHOD_DELETE = "delete"
 CONTENT_TYPE_JSON = "application/json"
+PAGE_SIZE = 2
+TEST_TIMEOUT = 5
+PAGED_ENTITY_IDS = ["a", "b", "c", "d", "e"]
+
+
+def mock_list_response(entities):
+    return json.dumps({"status": "success", "data": entities})
 
 
 class EntityEndpointsUnitTest(EndpointBaseUnitTest):
@@ -32,6 +41,8 @@ class EntityEndpointsUnitTest(EndpointBaseUnitTest):
         self.assertEqual(self.endpoints.get(TEST_ENTITY_ID), {})
         expected_url = f"{self.base_url}/{TEST_ENTITY_ID}"
         self.assertEqual(mock_request.call_args[1]["url"], expected_url)
+        self.endpoints.get(TEST_ENTITY_ID, timeout=TEST_TIMEOUT)
+        self.assertEqual(mock_request.call_args[1]["timeout"], TEST_TIMEOUT)
 
     def create(self, mock_request):
         mock_request.return_value = self.mock_response(MOCK_SUCCESS_RESPONSE_OBJECT)
@@ -42,3 +53,58 @@ class EntityEndpointsUnitTest(EndpointBaseUnitTest):
         mock_request.return_value = self.mock_response(MOCK_SUCCESS_RESPONSE_OBJECT)
         self.assertEqual(self.endpoints.delete(TEST_ENTITY_ID), {})
         self.assertEqual(mock_request.call_args[1]["method"], HTTP_METHOD_DELETE)
+
+    def iter_list(self, mock_request):
+        pages = [PAGED_ENTITY_IDS[i:i + PAGE_SIZE] for i in range(0, len(PAGED_ENTITY_IDS), PAGE_SIZE)]
+        mock_request.side_effect = [self.mock_response(mock_list_response([{"_id": i} for i in p])) for p in pages]
+        entities = self.endpoints.iter_list({"tags": "test"}, page_size=PAGE_SIZE)
+        self.assertEqual([e["_id"] for e in entities], PAGED_ENTITY_IDS)
+        self.assertEqual(mock_request.call_count, len(pages))
+        first_query = json.loads(mock_request.call_args_list[0][1]["params"]["query"])
+        last_params = mock_request.call_args_list[-1][1]["params"]
+        self.assertEqual(first_query, {"tags": "test"})
+        self.assertEqual(json.loads(last_params["query"]), {"$and": [{"tags": "test"}, {"_id": {"$gt": "d"}}]})
+        self.assertEqual(json.loads(last_params["projection"]), {"limit": PAGE_SIZE, "sort": {"_id": 1}})
+
+    def iter_list_sorted(self, mock_request):
+        mock_request.side_effect = [
+            self.mock_response(mock_list_response([{"_id": "b"}, {"_id": "a"}])),
+            self.mock_response(MOCK_SUCCESS_RESPONSE_LIST),
+        ]
+        entities = list(self.endpoints.iter_list(page_size=PAGE_SIZE, sort={"name": -1}, timeout=TEST_TIMEOUT))
+        self.assertEqual(len(entities), PAGE_SIZE)
+        self.assertEqual(mock_request.call_args[1]["timeout"], TEST_TIMEOUT)
+        projection = json.loads(mock_request.call_args[1]["params"]["projection"])
+        self.assertEqual(projection, {"limit": PAGE_SIZE, "sort": {"name": -1}, "skip": PAGE_SIZE})
+
+    def count(self, mock_request):
+        pages = [PAGED_ENTITY_IDS[i:i + PAGE_SIZE] for i in range(0, len(PAGED_ENTITY_IDS), PAGE_SIZE)]
+        mock_request.side_effect = [self.mock_response(mock_list_response([{"_id": i} for i in p])) for p in pages]
+        count = self.endpoints.count({"tags": "test"}, page_size=PAGE_SIZE, timeout=TEST_TIMEOUT)
+        self.assertEqual(count, len(PAGED_ENTITY_IDS))
+        self.assertEqual(mock_request.call_count, len(pages))
+        projection = json.loads(mock_request.call_args[1]["params"]["projection"])
+        self.assertEqual(projection, {"fields": {"_id": 1}, "limit": PAGE_SIZE, "sort": {"_id": 1}})
+        self.assertEqual(mock_request.call_args[1]["timeout"], TEST_TIMEOUT)
+
+    def list_with_preset(self, mock_request):
+        mock_request.return_value = self.mock_response(mock_list_response([{"_id": "id"}]))
+        self.endpoints.list(projection="summary")
+        projection = json.loads(mock_request.call_args[1]["params"]["projection"])
+        self.assertEqual(projection, self.endpoints.projections["summary"])
+        with self.assertRaises(ValueError):
+            self.endpoints.list(projection="unknown")
+
+    def get_many(self, mock_request):
+        def respond(**kwargs):
+            ids = json.loads(kwargs["params"]["query"])["_id"]["$in"]
+            return self.mock_response(mock_list_response([{"_id": i} for i in reversed(ids) if i != "c"]))
+
+        mock_request.side_effect = respond
+        ids = ["e", "a", "c", "b", "a"]
+        entities = self.endpoints.get_many(ids, chunk_size=PAGE_SIZE, timeout=TEST_TIMEOUT)
+        self.assertEqual([e and e["_id"] for e in entities], ["e", "a", None, "b", "a"])
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_request.call_args[1]["timeout"], TEST_TIMEOUT)
+        with self.assertRaises(ValueError):
+            self.endpoints.get_many(ids, chunk_size=PAGE_SIZE, raise_missing=True)
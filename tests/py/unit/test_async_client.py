@@ -0,0 +1,158 @@
+import asyncio
+import json
+from unittest import mock
+
+import httpx
+from mat3ra.api_client import AsyncAPIClient
+from mat3ra.api_client.endpoints.aio.jobs import AsyncJobEndpoints
+from mat3ra.api_client.endpoints.aio.properties import AsyncPropertiesEndpoints
+from mat3ra.api_client.utils.http_async import create_async_http_client
+from requests.exceptions import HTTPError
+from tests.py.unit import EndpointBaseUnitTest
+from tests.py.unit.entity import TEST_ENTITY_ID
+
+OIDC_ACCESS_TOKEN = "oidc-access-token"
+JOB_ID = "ukmnfWw9Q5ryXHK4X"
+MATERIALS = [{"_id": "m1", "formula": "Si"}, {"_id": "m2", "formula": "Ge"}]
+MAX_CONCURRENCY = 3
+CONCURRENT_REQUESTS = 20
+
+
+def success(data):
+    return httpx.Response(200, json={"status": "success", "data": data})
+
+
+class AsyncEndpointsUnitTest(EndpointBaseUnitTest):
+    """
+    Class for testing asynchronous endpoints.
+    """
+
+    def endpoint(self, cls, handler, **kwargs):
+        http_client = create_async_http_client(transport=httpx.MockTransport(handler))
+        return cls(self.host, self.port, self.account_id, self.auth_token, http_client=http_client, **kwargs)
+
+    def test_get(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return success({"_id": TEST_ENTITY_ID})
+
+        jobs = self.endpoint(AsyncJobEndpoints, handler)
+        self.assertEqual(asyncio.run(jobs.get(TEST_ENTITY_ID)), {"_id": TEST_ENTITY_ID})
+        self.assertEqual(requests[0].method, "GET")
+        self.assertEqual(str(requests[0].url),
+                         f"https://{self.host}:{self.port}/api/{self.version}/jobs/{TEST_ENTITY_ID}")
+        self.assertEqual(requests[0].headers["X-Account-Id"], self.account_id)
+
+    def test_get_timeout(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return success({"_id": TEST_ENTITY_ID})
+
+        jobs = self.endpoint(AsyncJobEndpoints, handler)
+        asyncio.run(jobs.get(TEST_ENTITY_ID, timeout=5))
+        self.assertEqual(requests[0].extensions["timeout"]["read"], 5)
+
+    def test_list_sends_query(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return success([])
+
+        jobs = self.endpoint(AsyncJobEndpoints, handler)
+        self.assertEqual(asyncio.run(jobs.list({"status": "finished"})), [])
+        self.assertEqual(json.loads(requests[0].url.params["query"]), {"status": "finished"})
+
+    def test_stream_list(self):
+        def handler(request):
+            return success(MATERIALS)
+
+        jobs = self.endpoint(AsyncJobEndpoints, handler)
+
+        async def collect():
+            return [job async for job in jobs.stream_list(chunk_size=8)]
+
+        self.assertEqual(asyncio.run(collect()), MATERIALS)
+
+    def test_create_by_ids_keeps_order(self):
+        def handler(request):
+            return success({"_id": json.loads(request.content)["_material"]["_id"]})
+
+        jobs = self.endpoint(AsyncJobEndpoints, handler)
+        created = asyncio.run(jobs.create_by_ids(MATERIALS, "workflow", "project", "prefix"))
+        self.assertEqual([job["_id"] for job in created], ["m1", "m2"])
+
+    def test_watch(self):
+        polls = iter([[("j1", "active")], [("j1", "finished")]])
+
+        def handler(request):
+            return success([{"_id": id_, "status": status} for id_, status in next(polls)])
+
+        async def watch():
+            jobs = self.endpoint(AsyncJobEndpoints, handler)
+            return [event async for event in jobs.watch(["j1"], poll_interval=0)]
+
+        events = asyncio.run(watch())
+        self.assertEqual([e["status"] for e in events], ["active", "finished"])
+
+    def test_watch_finished_at_timeout(self):
+        polls = iter([[("j1", "active")], [("j1", "finished")]])
+
+        def handler(request):
+            return success([{"_id": id_, "status": status} for id_, status in next(polls)])
+
+        async def watch():
+            jobs = self.endpoint(AsyncJobEndpoints, handler)
+            return [event async for event in jobs.watch(["j1"], poll_interval=10, timeout=0.05)]
+
+        events = asyncio.run(watch())
+        self.assertEqual([e["status"] for e in events], ["active", "finished"])
+
+    def test_get_for_job(self):
+        def handler(request):
+            return success([{"data": {"name": "total_energy"}, "source": {"info": {"unitId": "pw-relax"}}}])
+
+        properties = self.endpoint(AsyncPropertiesEndpoints, handler)
+        self.assertEqual(asyncio.run(properties.get_for_job(JOB_ID)), [{"name": "total_energy"}])
+        self.assertEqual(asyncio.run(properties.list_for_job(JOB_ID)),
+                         [{"unit_id": "pw-relax", "properties": ["total_energy"]}])
+
+    def test_raise_http_error(self):
+        def handler(request):
+            return httpx.Response(401, json={"message": "Unauthorized"})
+
+        jobs = self.endpoint(AsyncJobEndpoints, handler)
+        with self.assertRaises(HTTPError) as ctx:
+            asyncio.run(jobs.get(TEST_ENTITY_ID))
+        self.assertIn("Error 401: Unauthorized", str(ctx.exception))
+
+    def test_concurrency_is_bounded(self):
+        in_flight = {"current": 0, "max": 0}
+
+        async def handler(request):
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            await asyncio.sleep(0.01)
+            in_flight["current"] -= 1
+            return success({})
+
+        async def fan_out():
+            jobs = self.endpoint(AsyncJobEndpoints, handler, max_concurrency=MAX_CONCURRENCY)
+            return await asyncio.gather(*(jobs.get(str(i)) for i in range(CONCURRENT_REQUESTS)))
+
+        self.assertEqual(len(asyncio.run(fan_out())), CONCURRENT_REQUESTS)
+        self.assertEqual(in_flight["max"], MAX_CONCURRENCY)
+
+    def test_client_endpoints_share_transport(self):
+        env = {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            client = AsyncAPIClient.authenticate(max_concurrency=MAX_CONCURRENCY)
+        self.assertIsInstance(client.jobs, AsyncJobEndpoints)
+        for endpoint in (client.materials, client.properties, client.bank_workflows, client.clusters):
+            self.assertIs(endpoint.conn.client, client.jobs.conn.client)
+            self.assertIs(endpoint.conn.semaphore, client.jobs.conn.semaphore)
+        asyncio.run(client.aclose())
@@ -0,0 +1,84 @@
+import json
+from unittest import mock
+
+from mat3ra.api_client.endpoints.bank_materials import BankMaterialEndpoints
+from mat3ra.api_client.endpoints.materials import MaterialEndpoints
+from mat3ra.api_client.utils.cache import ResponseCache
+from tests.py.unit import EndpointBaseUnitTest
+
+CACHE_SIZE = 2
+MOCK_LIST_RESPONSE = json.dumps({"status": "success", "data": [{"_id": "id"}]})
+
+
+class ResponseCacheUnitTest(EndpointBaseUnitTest):
+    """
+    Class for testing the response cache.
+    """
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(maxsize=CACHE_SIZE)
+        keys = [cache.make_key("GET", f"materials/{i}") for i in range(3)]
+        cache.set(keys[0], 0, ttl=60)
+        cache.set(keys[1], 1, ttl=60)
+        cache.get(keys[0])
+        cache.set(keys[2], 2, ttl=60)
+        self.assertEqual(cache.get(keys[0]), (True, 0))
+        self.assertEqual(cache.get(keys[1]), (False, None))
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    @mock.patch("time.monotonic")
+    def test_ttl_expiry(self, mock_monotonic):
+        cache = ResponseCache()
+        key = cache.make_key("GET", "materials", {"query": "{}"})
+        mock_monotonic.return_value = 0
+        cache.set(key, [], ttl=10)
+        mock_monotonic.return_value = 11
+        self.assertEqual(cache.get(key), (False, None))
+
+    def test_returns_copies(self):
+        cache = ResponseCache()
+        key = cache.make_key("GET", "materials")
+        cache.set(key, {"tags": []}, ttl=60)
+        cache.get(key)[1]["tags"].append("mutated")
+        self.assertEqual(cache.get(key)[1], {"tags": []})
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_read_only_endpoint_cached(self, mock_request):
+        mock_request.return_value = self.mock_response(MOCK_LIST_RESPONSE)
+        cache = ResponseCache()
+        bank_materials = BankMaterialEndpoints(self.host, self.port, self.account_id, self.auth_token, cache=cache)
+        materials = MaterialEndpoints(self.host, self.port, self.account_id, self.auth_token, cache=cache)
+        self.assertEqual(bank_materials.list(), bank_materials.list())
+        materials.list()
+        materials.list()
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_write_invalidates_collection(self, mock_request):
+        mock_request.return_value = self.mock_response(MOCK_LIST_RESPONSE)
+        cache = ResponseCache()
+        materials = MaterialEndpoints(self.host, self.port, self.account_id, self.auth_token, cache=cache)
+        materials.cache_ttl = 60
+        materials.list()
+        materials.get("id")
+        self.assertEqual(len(cache), 2)
+        materials.update("id", {"name": "updated"})
+        self.assertEqual(len(cache), 0)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_write_invalidates_responses_cached_while_sent(self, mock_request):
+        cache = ResponseCache()
+        materials = MaterialEndpoints(self.host, self.port, self.account_id, self.auth_token, cache=cache)
+        materials.cache_ttl = 60
+
+        def respond(**kwargs):
+            if kwargs["method"] == "patch":
+                # a concurrent read caches the entity before the update is applied
+                materials.get("id")
+                self.assertEqual(len(cache), 1)
+            return self.mock_response(MOCK_LIST_RESPONSE)
+
+        mock_request.side_effect = respond
+        materials.update("id", {"name": "updated"})
+        self.assertEqual(len(cache), 0)
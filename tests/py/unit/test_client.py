@@ -1,7 +1,13 @@
+import json
+import multiprocessing
 import os
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
 from unittest import mock
 
 from mat3ra.api_client import APIClient
+from requests.exceptions import HTTPError
 
 from tests.py.unit import EndpointBaseUnitTest
 
@@ -40,6 +46,11 @@ ACCOUNTS_RESPONSE = {
 }
 
 
+def get_endpoint_config(client):
+    conn = client.materials.conn
+    return client.auth.access_token, conn.preamble, conn.pool is client._pool
+
+
 class APIClientUnitTest(EndpointBaseUnitTest):
     def _base_env(self):
         return {
@@ -49,11 +60,8 @@ class APIClientUnitTest(EndpointBaseUnitTest):
             "API_SECURE": API_SECURE_FALSE,
         }
 
-    def _mock_users_me(self, mock_get, response=None):
-        mock_resp = mock.Mock()
-        mock_resp.json.return_value = response or USERS_ME_RESPONSE
-        mock_resp.raise_for_status.return_value = None
-        mock_get.return_value = mock_resp
+    def _mock_users_me(self, mock_request, response=None):
+        mock_request.return_value = self.mock_response(json.dumps(response or USERS_ME_RESPONSE))
 
     def test_authenticate_requires_auth(self):
         env = self._base_env()
@@ -72,16 +80,63 @@ class APIClientUnitTest(EndpointBaseUnitTest):
         self.assertTrue(hasattr(client, "materials"))
         self.assertTrue(hasattr(client, "my_account"))
 
-    @mock.patch("requests.get")
-    def test_my_account_id_uses_existing_account_id(self, mock_get):
+    @mock.patch("requests.sessions.Session.close")
+    def test_endpoints_share_pooled_session(self, mock_close):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            with APIClient.authenticate(pool_maxsize=32) as client:
+                session = client.materials.conn.session
+                for endpoint in (client.workflows, client.jobs, client.properties, client.bank_materials):
+                    self.assertIs(endpoint.conn.session, session)
+                self.assertEqual(session.get_adapter(client.materials.conn.preamble)._pool_maxsize, 32)
+                mock_close.assert_not_called()
+        mock_close.assert_called_once()
+
+    def test_endpoints_created_lazily(self):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            client = APIClient.authenticate()
+        self.assertNotIn("materials", client.__dict__)
+        self.assertIsNone(client._pool._session)
+        self.assertIs(client.materials, client.materials)
+        self.assertNotIn("jobs", client.__dict__)
+
+    def test_endpoint_assignment(self):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            client = APIClient.authenticate()
+        endpoint = mock.Mock()
+        client.materials = endpoint
+        self.assertIs(client.materials, endpoint)
+        self.assertNotIn("materials", client.model_extra)
+        self.assertNotIn("materials", client.model_dump())
+        self.assertIsNot(APIClient.authenticate(access_token=OIDC_ACCESS_TOKEN, host=API_HOST).materials, endpoint)
+
+    def test_timeouts_passed_to_endpoints(self):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            client = APIClient.authenticate(timeout_seconds=30, connect_timeout_seconds=5)
+        self.assertEqual(client.materials.conn.timeout, (5, 30))
+        self.assertEqual(client.clusters.conn.timeout, (5, 30))
+
+    def test_response_cache_shared_by_endpoints(self):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            self.assertIsNone(APIClient.authenticate().bank_materials.cache)
+            client = APIClient.authenticate(response_cache_size=16)
+        self.assertIs(client.bank_materials.cache, client.response_cache)
+        self.assertIs(client.metaproperties.cache, client.response_cache)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_my_account_id_uses_existing_account_id(self, mock_request):
         env = self._base_env() | {"ACCOUNT_ID": ACCOUNT_ID, "AUTH_TOKEN": AUTH_TOKEN}
         with mock.patch.dict("os.environ", env, clear=True):
             client = APIClient.authenticate()
             self.assertEqual(client.my_account.id, ACCOUNT_ID)
-        mock_get.assert_not_called()
+        mock_request.assert_not_called()
 
-    @mock.patch("requests.get")
-    def test_my_account_id_fetches_and_caches(self, mock_get):
+    @mock.patch("requests.sessions.Session.request")
+    def test_my_account_id_fetches_and_caches(self, mock_request):
         env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
         response_with_account = {
             "data": {
@@ -92,21 +147,29 @@ class APIClientUnitTest(EndpointBaseUnitTest):
             }
         }
         with mock.patch.dict("os.environ", env, clear=True):
-            self._mock_users_me(mock_get, response_with_account)
+            self._mock_users_me(mock_request, response_with_account)
             client = APIClient.authenticate()
             self.assertEqual(client.my_account.id, ME_ACCOUNT_ID)
             self.assertEqual(client.my_account.id, ME_ACCOUNT_ID)
-            self.assertEqual(mock_get.call_count, 1)
-            self.assertTrue(mock_get.call_args[0][0].endswith("/api/v1/users/me"))
-            self.assertEqual(mock_get.call_args[1]["headers"]["Authorization"], f"Bearer {OIDC_ACCESS_TOKEN}")
-            self.assertEqual(mock_get.call_args[1]["timeout"], 30)
+            self.assertEqual(mock_request.call_count, 1)
+            self.assertTrue(mock_request.call_args[1]["url"].endswith("/api/v1/users/me"))
+            self.assertEqual(mock_request.call_args[1]["headers"]["Authorization"], f"Bearer {OIDC_ACCESS_TOKEN}")
+            self.assertEqual(mock_request.call_args[1]["timeout"], 30)
             self.assertEqual(os.environ.get("ACCOUNT_ID"), ME_ACCOUNT_ID)
 
-    @mock.patch("requests.get")
-    def test_list_accounts(self, mock_get):
+    @mock.patch("requests.sessions.Session.request")
+    def test_user_profile_follows_client_timeout(self, mock_request):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            self._mock_users_me(mock_request, USERS_ME_RESPONSE)
+            APIClient.authenticate(timeout_seconds=5, connect_timeout_seconds=2).list_accounts()
+            self.assertEqual(mock_request.call_args[1]["timeout"], (2, 5))
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_list_accounts(self, mock_request):
         env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
         with mock.patch.dict("os.environ", env, clear=True):
-            self._mock_users_me(mock_get, ACCOUNTS_RESPONSE)
+            self._mock_users_me(mock_request, ACCOUNTS_RESPONSE)
             client = APIClient.authenticate()
             accounts = client.list_accounts()
 
@@ -119,11 +182,11 @@ class APIClientUnitTest(EndpointBaseUnitTest):
             self.assertEqual(accounts[1]["name"], "Acme Corp")
             self.assertEqual(accounts[1]["type"], "enterprise")
 
-    @mock.patch("requests.get")
-    def test_get_account(self, mock_get):
+    @mock.patch("requests.sessions.Session.request")
+    def test_get_account(self, mock_request):
         env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
         with mock.patch.dict("os.environ", env, clear=True):
-            self._mock_users_me(mock_get, ACCOUNTS_RESPONSE)
+            self._mock_users_me(mock_request, ACCOUNTS_RESPONSE)
             client = APIClient.authenticate()
             
             account = client.get_account(index=1)
@@ -133,12 +196,113 @@ class APIClientUnitTest(EndpointBaseUnitTest):
             self.assertEqual(client.get_account(name="Acme").id, "org-acc-1")
             self.assertEqual(client.get_account(name="Beta.*").id, "org-acc-2")
 
-    @mock.patch("requests.get")
-    def test_my_organization(self, mock_get):
+    @mock.patch("requests.sessions.Session.request")
+    def test_my_organization(self, mock_request):
         env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
         with mock.patch.dict("os.environ", env, clear=True):
-            self._mock_users_me(mock_get, ACCOUNTS_RESPONSE)
+            self._mock_users_me(mock_request, ACCOUNTS_RESPONSE)
             client = APIClient.authenticate()
             org = client.my_organization
             self.assertEqual(org.id, "org-acc-1")
             self.assertEqual(org.name, "Acme Corp")
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_user_profile_fetched_once(self, mock_request):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            self._mock_users_me(mock_request, ACCOUNTS_RESPONSE)
+            client = APIClient.authenticate()
+            client.list_accounts()
+            client.get_account(name="Acme")
+            self.assertEqual(client.my_organization.id, "org-acc-1")
+            self.assertEqual(client.my_account.id, ME_ACCOUNT_ID)
+            self.assertEqual(mock_request.call_count, 1)
+            client.refresh()
+            self.assertEqual(mock_request.call_count, 2)
+
+    @mock.patch("time.monotonic")
+    @mock.patch("requests.sessions.Session.request")
+    def test_user_profile_expires(self, mock_request, mock_monotonic):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            self._mock_users_me(mock_request, ACCOUNTS_RESPONSE)
+            client = APIClient.authenticate(profile_ttl_seconds=10)
+            mock_monotonic.return_value = 0
+            client.list_accounts()
+            mock_monotonic.return_value = 5
+            client.list_accounts()
+            self.assertEqual(mock_request.call_count, 1)
+            mock_monotonic.return_value = 11
+            client.list_accounts()
+            self.assertEqual(mock_request.call_count, 2)
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_user_profile_retried(self, mock_request, mock_sleep):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        unavailable = self.mock_response("", 503)
+        with mock.patch.dict("os.environ", env, clear=True):
+            mock_request.side_effect = [unavailable, self.mock_response(json.dumps(ACCOUNTS_RESPONSE))]
+            self.assertEqual(APIClient.authenticate().my_organization.id, "org-acc-1")
+            self.assertEqual(mock_request.call_count, 2)
+
+            mock_request.reset_mock(side_effect=True)
+            mock_request.return_value = unavailable
+            client = APIClient.authenticate(retry_policy=None)
+            self.assertIsNone(client.retry_policy)
+            with self.assertRaises(HTTPError):
+                client.list_accounts()
+            self.assertEqual(mock_request.call_count, 1)
+
+    def test_pickle_keeps_configuration_only(self):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            client = APIClient.authenticate(timeout_seconds=5, response_cache_size=10)
+            endpoint = client.materials
+            restored = pickle.loads(pickle.dumps(client))
+        self.assertEqual(restored.auth, client.auth)
+        self.assertEqual(restored.timeout_seconds, 5)
+        self.assertIsNot(restored._pool, client._pool)
+        self.assertIsNot(restored.response_cache, client.response_cache)
+        self.assertIsNot(restored.materials, endpoint)
+        self.assertIs(restored.materials.conn.pool, restored._pool)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork start method is not available")
+    def test_client_in_process_pool(self):
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            client = APIClient.authenticate()
+        self.assertIsNotNone(client._pool.session)
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork")) as executor:
+            results = list(executor.map(get_endpoint_config, [client] * 2))
+        expected = (OIDC_ACCESS_TOKEN, client.materials.conn.preamble, True)
+        self.assertEqual(results, [expected] * 2)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork start method is not available")
+    @mock.patch("requests.sessions.Session.request")
+    def test_client_inherited_by_forked_process(self, mock_request):
+        def respond(**kwargs):
+            if kwargs["url"].endswith("/users/me"):
+                return self.mock_response(json.dumps(ACCOUNTS_RESPONSE))
+            return self.mock_response(json.dumps({"status": "success", "data": [{"_id": "id"}]}))
+
+        mock_request.side_effect = respond
+        env = self._base_env() | {"OIDC_ACCESS_TOKEN": OIDC_ACCESS_TOKEN}
+        with mock.patch.dict("os.environ", env, clear=True):
+            client = APIClient.authenticate(response_cache_size=10)
+        client.materials.cache_ttl = 60
+        client.materials.list()
+        parent_pipe, child_pipe = multiprocessing.Pipe()
+
+        def use_client():
+            child_pipe.send((client.list_accounts()[1]["_id"], client.materials.list(), client.workflows.list()))
+
+        # locks held by other threads of the parent when it forks stay held in the child
+        with client._profile_lock, client._endpoint_lock, client.response_cache._lock:
+            process = multiprocessing.get_context("fork").Process(target=use_client)
+            process.start()
+            process.join(10)
+        if process.is_alive():
+            process.kill()
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual(parent_pipe.recv(), ("org-acc-1", [{"_id": "id"}], [{"_id": "id"}]))
@@ -0,0 +1,135 @@
+import json
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+
+from mat3ra.api_client.endpoints.jobs import JobEndpoints
+from mat3ra.api_client.endpoints.materials import MaterialEndpoints
+from mat3ra.api_client.utils.disk_cache import DiskCache
+from tests.py.unit import EndpointBaseUnitTest
+
+MATERIAL = {"_id": "id", "name": "Si", "updatedAt": "2024-01-01T00:00:00Z"}
+UPDATED_MATERIAL = dict(MATERIAL, name="Ge", updatedAt="2024-01-02T00:00:00Z")
+ETAG = '"abc"'
+
+
+def jsend(data):
+    return json.dumps({"status": "success", "data": data})
+
+
+class DiskCacheUnitTest(EndpointBaseUnitTest):
+    """
+    Class for testing the persistent response cache.
+    """
+
+    def setUp(self):
+        super(DiskCacheUnitTest, self).setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def get_endpoint(self, endpoint_class=MaterialEndpoints, **kwargs):
+        disk_cache = DiskCache(self.cache_dir.name)
+        self.addCleanup(disk_cache.close)
+        return endpoint_class(self.host, self.port, self.account_id, self.auth_token, disk_cache=disk_cache, **kwargs)
+
+    def get_oidc_endpoint(self, access_token):
+        return self.get_endpoint(auth=SimpleNamespace(access_token=access_token, account_id=None))
+
+    def mock_response(self, content, status_code=200, reason="OK", etag=None):
+        response = super(DiskCacheUnitTest, self).mock_response(content, status_code, reason)
+        if etag:
+            response.headers["ETag"] = etag
+        return response
+
+    def test_persists_across_instances(self):
+        cache = DiskCache(self.cache_dir.name)
+        key = cache.make_key(("host", "account"), "materials", {"query": "{}"})
+        cache.set(key, "materials", [MATERIAL], ETAG)
+        cache.close()
+        cache = DiskCache(self.cache_dir.name)
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.get(key), (ETAG, [MATERIAL]))
+        cache.invalidate("materials")
+        self.assertIsNone(cache.get(key))
+
+    @mock.patch("os.getpid")
+    def test_reopens_database_after_fork(self, mock_getpid):
+        mock_getpid.return_value = 1
+        cache = DiskCache(self.cache_dir.name)
+        self.addCleanup(cache.close)
+        key = cache.make_key(("host", "account"), "materials", {})
+        cache.set(key, "materials", [MATERIAL])
+        parent_db = cache._db
+        mock_getpid.return_value = 2
+        self.assertEqual(cache.get(key), (None, [MATERIAL]))
+        self.assertIsNot(cache._db, parent_db)
+        parent_db.close()
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_get_not_modified(self, mock_request):
+        mock_request.return_value = self.mock_response(jsend(MATERIAL), etag=ETAG)
+        self.get_endpoint().get("id")
+        mock_request.return_value = self.mock_response("", status_code=304, reason="Not Modified")
+        self.assertEqual(self.get_endpoint().get("id"), MATERIAL)
+        self.assertEqual(mock_request.call_args[1]["headers"]["If-None-Match"], ETAG)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_get_revalidated_by_updated_at(self, mock_request):
+        mock_request.return_value = self.mock_response(jsend(MATERIAL))
+        self.get_endpoint().get("id")
+        mock_request.return_value = self.mock_response(jsend([{"_id": "id", "updatedAt": MATERIAL["updatedAt"]}]))
+        self.assertEqual(self.get_endpoint().get("id"), MATERIAL)
+        self.assertEqual(mock_request.call_count, 2)
+        params = mock_request.call_args[1]["params"]
+        self.assertEqual(json.loads(params["query"]), {"_id": "id"})
+        self.assertEqual(json.loads(params["projection"]), {"fields": {"_id": 1, "updatedAt": 1}})
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_list_refetched_when_stale(self, mock_request):
+        mock_request.return_value = self.mock_response(jsend([MATERIAL]))
+        self.get_endpoint().list({"name": "Si"}, {"limit": 10})
+        mock_request.side_effect = [
+            self.mock_response(jsend([{"_id": "id", "updatedAt": UPDATED_MATERIAL["updatedAt"]}])),
+            self.mock_response(jsend([UPDATED_MATERIAL])),
+        ]
+        self.assertEqual(self.get_endpoint().list({"name": "Si"}, {"limit": 10}), [UPDATED_MATERIAL])
+        self.assertEqual(mock_request.call_count, 3)
+        probe_params = mock_request.call_args_list[1][1]["params"]
+        self.assertEqual(json.loads(probe_params["projection"]), {"limit": 10, "fields": {"_id": 1, "updatedAt": 1}})
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_write_invalidates_collection(self, mock_request):
+        endpoint = self.get_endpoint()
+        mock_request.return_value = self.mock_response(jsend(MATERIAL), etag=ETAG)
+        endpoint.get("id")
+        endpoint.update("id", {"name": "Ge"})
+        endpoint.get("id")
+        self.assertNotIn("If-None-Match", mock_request.call_args[1]["headers"])
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_stored_per_access_token(self, mock_request):
+        mock_request.return_value = self.mock_response(jsend(MATERIAL), etag=ETAG)
+        self.get_oidc_endpoint("token-a").get("id")
+        self.get_oidc_endpoint("token-b").get("id")
+        self.assertNotIn("If-None-Match", mock_request.call_args[1]["headers"])
+        self.get_oidc_endpoint("token-a").get("id")
+        self.assertEqual(mock_request.call_args[1]["headers"]["If-None-Match"], ETAG)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_not_stored_without_credentials(self, mock_request):
+        mock_request.return_value = self.mock_response(jsend(MATERIAL), etag=ETAG)
+        disk_cache = DiskCache(self.cache_dir.name)
+        self.addCleanup(disk_cache.close)
+        endpoint = MaterialEndpoints(self.host, self.port, None, None, disk_cache=disk_cache)
+        endpoint.get("id")
+        endpoint.get("id")
+        self.assertNotIn("If-None-Match", mock_request.call_args[1]["headers"])
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_job_statuses_and_files_not_stored(self, mock_request):
+        endpoint = self.get_endpoint(JobEndpoints)
+        mock_request.return_value = self.mock_response(jsend([{"_id": "id", "status": "finished"}]), etag=ETAG)
+        list(endpoint.watch(["id"]))
+        mock_request.return_value = self.mock_response(jsend([{"name": "out", "signedURL": "url"}]), etag=ETAG)
+        endpoint.list_files("id")
+        self.assertEqual(endpoint.disk_cache._db.execute("SELECT COUNT(*) FROM responses").fetchone(), (0,))
@@ -0,0 +1,127 @@
+import asyncio
+from unittest import mock
+
+from mat3ra.api_client import APIClient, AsyncAPIClient
+from mat3ra.api_client.endpoints.materials import MaterialEndpoints
+from mat3ra.api_client.testing import (
+    FakeMat3raAPI,
+    FakeMat3raServer,
+    FakeTransport,
+    create_async_transport,
+    match_query,
+    project,
+)
+from mat3ra.api_client.utils.http import RetryPolicy, Transport
+from requests.exceptions import ConnectionError, HTTPError
+from tests.py.unit import EndpointBaseUnitTest
+
+OIDC_ACCESS_TOKEN = "oidc-access-token"
+PROPERTY = {
+    "source": {"info": {"jobId": "job-1"}},
+    "data": {"name": "band_gaps", "values": [{"type": "direct", "value": 2.5}, {"type": "indirect", "value": 0.6}]},
+}
+
+
+class RecordingTransport(Transport):
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        return self.response
+
+
+class FakeAPIUnitTest(EndpointBaseUnitTest):
+    """
+    Class for testing the pluggable transport and the fake API.
+    """
+
+    def setUp(self):
+        super(FakeAPIUnitTest, self).setUp()
+        self.api = FakeMat3raAPI(access_token=OIDC_ACCESS_TOKEN)
+        self.stored = self.api.populate(materials=5, jobs=2, properties_per_job=3)
+
+    def client(self, **kwargs):
+        options = dict(host=self.host, port=self.port, secure=True, access_token=OIDC_ACCESS_TOKEN,
+                       transport=FakeTransport(self.api), retry_policy=RetryPolicy(jitter=False))
+        return APIClient.authenticate(**dict(options, **kwargs))
+
+    def test_connection_delegates_to_transport(self):
+        transport = RecordingTransport(self.mock_response('{"status": "success", "data": []}'))
+        endpoint = MaterialEndpoints(self.host, self.port, self.account_id, self.auth_token, transport=transport)
+        self.assertEqual(endpoint.list(), [])
+        self.assertEqual(transport.calls, [("get", f"https://{self.host}:{self.port}/api/{self.version}/materials")])
+
+    def test_entity_lifecycle(self):
+        client = self.client()
+        self.assertEqual(client.my_account.id, self.api.account_id)
+        material = client.materials.create({"name": "Ge"})
+        self.assertEqual(client.materials.get(material["_id"])["name"], "Ge")
+        client.materials.update(material["_id"], {"$set": {"name": "GaAs"}})
+        self.assertEqual(client.materials.list({"name": "GaAs"}, "ids"), [{"_id": material["_id"]}])
+        client.materials.delete(material["_id"])
+        with self.assertRaises(HTTPError):
+            client.materials.get(material["_id"])
+
+    def test_list_paging_and_projection(self):
+        client = self.client()
+        ids = [material["_id"] for material in self.stored["materials"]]
+        self.assertEqual([material["_id"] for material in client.materials.iter_list(page_size=2)], ids)
+        self.assertEqual([material["_id"] for material in client.materials.stream_list(chunk_size=16)], ids)
+        self.assertEqual(client.materials.list(projection={"sort": {"name": -1}, "limit": 1})[0]["name"], "Si 4")
+        self.assertEqual(client.materials.list(projection="ids"), [{"_id": id_} for id_ in ids])
+
+    def test_properties_and_jobs(self):
+        client = self.client()
+        job_ids = [job["_id"] for job in self.stored["jobs"]]
+        band_gaps = client.properties.get_band_gaps(job_ids, "pw-nscf")
+        self.assertEqual(band_gaps, {job_id: {"direct": 2.5, "indirect": 0.6} for job_id in job_ids})
+        job = client.jobs.create({"name": "job", "status": "pre-submission"})
+        client.jobs.submit(job["_id"])
+        events = list(client.jobs.watch([job["_id"]], poll_interval=0))
+        self.assertEqual(events[-1]["status"], "finished")
+
+    def test_unauthorized(self):
+        with self.assertRaises(HTTPError) as context:
+            self.client(access_token="invalid").materials.list()
+        self.assertEqual(context.exception.response.status_code, 401)
+
+    @mock.patch("time.sleep")
+    def test_injected_failures_are_retried(self, mock_sleep):
+        client = self.client()
+        self.api.fail_next(2)
+        self.assertEqual(len(client.materials.list()), 5)
+        self.api.fail_next(1, status=None)
+        self.assertEqual(len(client.materials.list()), 5)
+        self.api.fail_next(1, status=None)
+        with self.assertRaises(ConnectionError):
+            client.materials.create({"name": "Ge"})
+
+    def test_query_matching(self):
+        self.assertTrue(match_query(PROPERTY, {"data.values.type": "direct"}))
+        self.assertTrue(match_query(PROPERTY, {"$and": [{"data.name": {"$in": ["band_gaps"]}},
+                                                        {"data.values.value": {"$gt": 2}}]}))
+        self.assertFalse(match_query(PROPERTY, {"source.info.jobId": {"$ne": "job-1"}}))
+        self.assertEqual(project(PROPERTY, {"data.values.type": 1}),
+                         {"data": {"values": [{"type": "direct"}, {"type": "indirect"}]}})
+
+    def test_server_reuses_connections(self):
+        with FakeMat3raServer(self.api) as server:
+            with self.client(host=server.host, port=server.port, secure=False, transport=None) as client:
+                for material in self.stored["materials"]:
+                    self.assertEqual(client.materials.get(material["_id"]), material)
+        self.assertEqual(server.connection_count, 1)
+        self.assertEqual(self.api.requests[("GET", "materials/:id")], 5)
+
+    def test_async_transport(self):
+        async def get_all(ids):
+            async with AsyncAPIClient.authenticate(host=self.host, port=self.port, secure=True,
+                                                   access_token=OIDC_ACCESS_TOKEN,
+                                                   transport=create_async_transport(self.api)) as client:
+                return await asyncio.gather(*(client.materials.get(id_) for id_ in ids))
+
+        self.api.latency = 0.01
+        materials = asyncio.run(get_all([material["_id"] for material in self.stored["materials"]]))
+        self.assertEqual(materials, self.stored["materials"])
+        self.assertEqual(self.api.max_in_flight, 5)
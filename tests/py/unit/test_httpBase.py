@@ -1,17 +1,22 @@
+import gzip
 import json
 from unittest import mock
 
-from mat3ra.api_client.utils.http import Connection
-from requests.exceptions import HTTPError
+from mat3ra.api_client.utils.http import Connection, Deadline, RetryPolicy, SessionPool
+from requests.exceptions import ConnectionError, HTTPError
 from tests.py.unit import EndpointBaseUnitTest
 
 API_VERSION_1 = "2018-10-1"
 API_VERSION_2 = "2018-10-2"
 HTTP_STATUS_UNAUTHORIZED = 401
 HTTP_STATUS_UNKNOWN = 418
+HTTP_STATUS_TOO_MANY_REQUESTS = 429
+HTTP_STATUS_BAD_GATEWAY = 502
+HTTP_STATUS_SERVICE_UNAVAILABLE = 503
 EMPTY_CONTENT = ""
 SERVER_MESSAGE = "Custom server error message"
 SERVER_ERROR_RESPONSE = json.dumps({"message": SERVER_MESSAGE})
+SUCCESS_RESPONSE = json.dumps({"status": "success", "data": {}})
 
 
 class HTTPBaseUnitTest(EndpointBaseUnitTest):
@@ -59,3 +64,155 @@ class HTTPBaseUnitTest(EndpointBaseUnitTest):
         self.assertIn("Error 418", str(ctx.exception))
         self.assertIn("HTTP Error", str(ctx.exception))
 
+
+    @mock.patch("requests.sessions.Session.close")
+    @mock.patch("requests.sessions.Session.request")
+    def test_pooled_session_kept_open(self, mock_request, mock_close):
+        mock_request.return_value = self.mock_response(SUCCESS_RESPONSE)
+        pool = SessionPool()
+        conn = Connection(self.host, self.port, version=API_VERSION_1, secure=True, pool=pool)
+        with conn:
+            conn.request("GET", "materials")
+        self.assertIs(conn.session, pool.session)
+        mock_close.assert_not_called()
+        pool.close()
+        mock_close.assert_called_once()
+
+    @mock.patch("requests.sessions.Session.close")
+    @mock.patch("requests.sessions.Session.request")
+    def test_private_session_closed_on_exit(self, mock_request, mock_close):
+        mock_request.return_value = self.mock_response(SUCCESS_RESPONSE)
+        conn = Connection(self.host, self.port, version=API_VERSION_1, secure=True)
+        with conn:
+            conn.request("GET", "materials")
+        mock_close.assert_called_once()
+
+    @mock.patch("requests.sessions.Session.close")
+    def test_pool_evicts_idle_connections(self, mock_close):
+        pool = SessionPool(idle_timeout=0)
+        pool._last_used -= 1
+        pool.evict_idle()
+        mock_close.assert_not_called()
+        self.assertIsNotNone(pool.session)
+        pool._last_used -= 1
+        pool.evict_idle()
+        mock_close.assert_called_once()
+
+    @mock.patch("requests.sessions.Session.close")
+    @mock.patch("os.getpid")
+    def test_pool_recreates_session_after_fork(self, mock_getpid, mock_close):
+        mock_getpid.return_value = 1
+        pool = SessionPool()
+        parent_session = pool.session
+        self.assertIs(pool.session, parent_session)
+        mock_getpid.return_value = 2
+        self.assertIsNot(pool.session, parent_session)
+        mock_close.assert_not_called()
+
+    def test_pool_adapter_size(self):
+        pool = SessionPool(pool_connections=2, pool_maxsize=32)
+        adapter = pool.session.get_adapter(f"https://{self.host}")
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_session_accepts_compressed_responses(self):
+        self.assertIn("gzip", SessionPool().session.headers["Accept-Encoding"])
+        conn = Connection(self.host, self.port, version=API_VERSION_1, secure=True)
+        self.assertEqual(conn.session.headers["Accept-Encoding"], SessionPool().session.headers["Accept-Encoding"])
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_large_body_compressed(self, mock_request):
+        mock_request.return_value = self.mock_response(SUCCESS_RESPONSE)
+        conn = Connection(self.host, self.port, version=API_VERSION_1, secure=True, compress_min_size=100)
+        body = json.dumps({"name": "x" * 100})
+        conn.request("PUT", "materials/create", data=body, headers={"Content-Type": "application/json"})
+        self.assertEqual(gzip.decompress(mock_request.call_args[1]["data"]).decode(), body)
+        self.assertEqual(mock_request.call_args[1]["headers"]["Content-Encoding"], "gzip")
+        conn.request("PUT", "materials/create", data="{}", headers={})
+        self.assertEqual(mock_request.call_args[1]["data"], "{}")
+        self.assertNotIn("Content-Encoding", mock_request.call_args[1]["headers"])
+
+    def retrying_connection(self, **kwargs):
+        retry_policy = RetryPolicy(jitter=False, **kwargs)
+        return Connection(self.host, self.port, version=API_VERSION_1, secure=True, retry_policy=retry_policy)
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_retry_with_backoff(self, mock_request, mock_sleep):
+        mock_request.side_effect = [
+            self.mock_response(EMPTY_CONTENT, HTTP_STATUS_BAD_GATEWAY),
+            ConnectionError(),
+            self.mock_response(SUCCESS_RESPONSE),
+        ]
+        response = self.retrying_connection(backoff_base=1).request("GET", "materials")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [1, 2])
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_retry_gives_up_after_max_attempts(self, mock_request, mock_sleep):
+        mock_request.return_value = self.mock_response(EMPTY_CONTENT, HTTP_STATUS_SERVICE_UNAVAILABLE)
+        with self.assertRaises(HTTPError):
+            self.retrying_connection(max_attempts=3).request("GET", "materials")
+        self.assertEqual(mock_request.call_count, 3)
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_retry_honors_retry_after(self, mock_request, mock_sleep):
+        too_many_requests = self.mock_response(EMPTY_CONTENT, HTTP_STATUS_TOO_MANY_REQUESTS)
+        too_many_requests.headers["Retry-After"] = "7"
+        mock_request.side_effect = [too_many_requests, self.mock_response(SUCCESS_RESPONSE)]
+        self.retrying_connection().request("PUT", "materials/create")
+        mock_sleep.assert_called_once_with(7.0)
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_non_idempotent_request_not_replayed(self, mock_request, mock_sleep):
+        mock_request.return_value = self.mock_response(EMPTY_CONTENT, HTTP_STATUS_BAD_GATEWAY)
+        with self.assertRaises(HTTPError):
+            self.retrying_connection().request("PUT", "materials/create")
+        mock_request.side_effect = ConnectionError()
+        with self.assertRaises(ConnectionError):
+            self.retrying_connection().request("POST", "jobs/id/submit")
+        self.assertEqual(mock_request.call_count, 2)
+        mock_sleep.assert_not_called()
+
+    def test_retry_delay_is_capped(self):
+        policy = RetryPolicy(backoff_base=1, backoff_cap=5)
+        self.assertLessEqual(policy.get_delay(10), 5)
+        self.assertEqual(policy.get_delay(1, "120"), 5)
+        self.assertIsNone(policy._parse_retry_after("invalid"))
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_timeout_sent_with_request(self, mock_request):
+        mock_request.return_value = self.mock_response(SUCCESS_RESPONSE)
+        conn = Connection(self.host, self.port, version=API_VERSION_1, secure=True, timeout=(3, 30))
+        conn.request("GET", "materials")
+        self.assertEqual(mock_request.call_args[1]["timeout"], (3, 30))
+        conn.request("GET", "materials", timeout=5)
+        self.assertEqual(mock_request.call_args[1]["timeout"], 5)
+
+    def test_deadline(self):
+        deadline = Deadline(10)
+        self.assertLessEqual(deadline.clip(60), 10)
+        self.assertEqual(deadline.clip(1), 1)
+        self.assertEqual(deadline.clip((1, 60))[0], 1)
+        self.assertLessEqual(deadline.clip((1, 60))[1], 10)
+        with self.assertRaises(TimeoutError):
+            Deadline(0).remaining()
+
+    @mock.patch("time.monotonic")
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_deadline_bounds_retries(self, mock_request, mock_sleep, mock_monotonic):
+        clock = [0.0]
+        mock_monotonic.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        too_many_requests = self.mock_response(EMPTY_CONTENT, HTTP_STATUS_TOO_MANY_REQUESTS)
+        too_many_requests.headers["Retry-After"] = "4"
+        mock_request.return_value = too_many_requests
+        deadline = Deadline(10)
+        with self.assertRaises(TimeoutError):
+            self.retrying_connection(max_attempts=10).request("GET", "materials", deadline=deadline)
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [4.0, 4.0, 2.0])
+        self.assertEqual([call[1]["timeout"] for call in mock_request.call_args_list], [10, 6, 2])
@@ -1,9 +1,37 @@
+import io
+import json
+import os
+import tempfile
 from unittest import mock
 
+import requests
 from mat3ra.api_client.endpoints.jobs import JobEndpoints
+from mat3ra.api_client.utils.concurrency import Checkpoint
+from mat3ra.api_client.utils.files import MANIFEST_FILENAME, download_file
 from tests.py.unit.entity import EntityEndpointsUnitTest
 
 ENDPOINT_NAME = "jobs"
+MATERIALS = [{"_id": "m1", "formula": "Si"}, {"_id": "m2", "formula": "Ge"}, {"_id": "m3", "formula": "C"}]
+FAILING_MATERIAL_ID = "m2"
+HTTP_STATUS_FORBIDDEN = 403
+HTTP_STATUS_SERVICE_UNAVAILABLE = 503
+WATCHED_JOB_STATUSES = [
+    [("j1", "submitted"), ("j2", "active")],
+    [("j1", "submitted"), ("j2", "active")],
+    [("j1", "active"), ("j2", "finished")],
+    [("j1", "error")],
+]
+
+
+JOB_FILES = [
+    {"name": "pw.in", "size": 6, "lastModified": 1, "signedURL": "https://storage/pw.in"},
+    {"name": "outdir/pw.out", "size": 10, "lastModified": 2, "signedURL": "https://storage/pw.out"},
+]
+JOB_FILE_CONTENTS = {"https://storage/pw.in": b"input\n", "https://storage/pw.out": b"0123456789"}
+
+
+def mock_jobs_response(statuses):
+    return json.dumps({"status": "success", "data": [{"_id": id_, "status": status} for id_, status in statuses]})
 
 
 class EndpointJobsUnitTest(EntityEndpointsUnitTest):
@@ -20,6 +48,22 @@ class EndpointJobsUnitTest(EntityEndpointsUnitTest):
     def test_list(self, mock_request):
         self.list(mock_request)
 
+    @mock.patch("requests.sessions.Session.request")
+    def test_iter_list(self, mock_request):
+        self.iter_list(mock_request)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_iter_list_sorted(self, mock_request):
+        self.iter_list_sorted(mock_request)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_count(self, mock_request):
+        self.count(mock_request)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_get_many(self, mock_request):
+        self.get_many(mock_request)
+
     @mock.patch("requests.sessions.Session.request")
     def test_get(self, mock_request):
         self.get(mock_request)
@@ -31,3 +75,248 @@ class EndpointJobsUnitTest(EntityEndpointsUnitTest):
     @mock.patch("requests.sessions.Session.request")
     def test_delete(self, mock_request):
         self.create(mock_request)
+
+    def mock_create(self, **kwargs):
+        material_id = json.loads(kwargs["data"])["_material"]["_id"]
+        if material_id == FAILING_MATERIAL_ID:
+            return self.mock_response("", HTTP_STATUS_SERVICE_UNAVAILABLE)
+        return self.mock_response(json.dumps({"status": "success", "data": {"_id": f"job-{material_id}"}}))
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_create_many_collects_errors(self, mock_request):
+        mock_request.side_effect = self.mock_create
+        batch = self.endpoints.create_many(MATERIALS, "workflow", "project", "prefix", workers=2)
+        self.assertFalse(batch.ok)
+        self.assertEqual(batch.results, {"m1": {"_id": "job-m1"}, "m3": {"_id": "job-m3"}})
+        self.assertEqual(list(batch.errors), [FAILING_MATERIAL_ID])
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_create_many_resumes_from_checkpoint(self, mock_request):
+        mock_request.side_effect = self.mock_create
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, "checkpoint.jsonl")
+            self.endpoints.create_many(MATERIALS, "workflow", "project", "prefix", checkpoint=checkpoint)
+            with open(checkpoint) as f:
+                self.assertEqual(sorted(f.read().splitlines()), ['{"m1": "job-m1"}', '{"m3": "job-m3"}'])
+
+            mock_request.reset_mock()
+            batch = self.endpoints.create_many(MATERIALS, "workflow", "project", "prefix", checkpoint=checkpoint)
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(batch.results["m1"], {"_id": "job-m1"})
+        self.assertIn(FAILING_MATERIAL_ID, batch.errors)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_create_many_rejects_duplicate_materials(self, mock_request):
+        with self.assertRaises(ValueError):
+            self.endpoints.create_many(MATERIALS + MATERIALS[:1], "workflow", "project", "prefix")
+        mock_request.assert_not_called()
+
+    def test_checkpoint_appends_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "checkpoint.jsonl")
+            with open(path, "w") as f:
+                f.write('{"m1": "job-old", "m2": "job-m2"}\n')
+            checkpoint = Checkpoint(path)
+            checkpoint.save("m1", "job-m1")
+            checkpoint.save("m3", "job-m3")
+            with open(path, "a") as f:
+                f.write('{"m4": "jo')
+            checkpoint = Checkpoint(path)
+            self.assertEqual(checkpoint.data, {"m1": "job-m1", "m2": "job-m2", "m3": "job-m3"})
+            checkpoint.save("m4", "job-m4")
+            self.assertEqual(Checkpoint(path).data["m4"], "job-m4")
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_submit_many(self, mock_request):
+        mock_request.return_value = self.mock_response(json.dumps({"status": "success", "data": {}}))
+        batch = self.endpoints.submit_many(["j1", "j2"])
+        self.assertTrue(batch.ok)
+        self.assertEqual(sorted(batch.results), ["j1", "j2"])
+        urls = sorted(call[1]["url"] for call in mock_request.call_args_list)
+        self.assertEqual(urls, [f"{self.base_url}/j1/submit", f"{self.base_url}/j2/submit"])
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_watch(self, mock_request, mock_sleep):
+        mock_request.side_effect = [self.mock_response(mock_jobs_response(s)) for s in WATCHED_JOB_STATUSES]
+        events = list(self.endpoints.watch(["j1", "j2"], poll_interval=1, backoff=2))
+        self.assertEqual([(e["_id"], e["previousStatus"], e["status"]) for e in events], [
+            ("j1", None, "submitted"),
+            ("j2", None, "active"),
+            ("j1", "submitted", "active"),
+            ("j2", "active", "finished"),
+            ("j1", "active", "error"),
+        ])
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [1, 2, 1])
+        last_params = mock_request.call_args[1]["params"]
+        self.assertEqual(json.loads(last_params["query"]), {"_id": {"$in": ["j1"]}})
+        self.assertEqual(json.loads(last_params["projection"]), {"fields": {"_id": 1, "status": 1}})
+
+    def mock_clock(self, mock_monotonic, mock_sleep):
+        clock = [0.0]
+        mock_monotonic.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
+    @mock.patch("time.monotonic")
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_watch_timeout(self, mock_request, mock_sleep, mock_monotonic):
+        self.mock_clock(mock_monotonic, mock_sleep)
+        mock_request.return_value = self.mock_response(mock_jobs_response([("j1", "active")]))
+        with self.assertRaises(TimeoutError):
+            list(self.endpoints.watch(["j1"], poll_interval=1, timeout=0.5))
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [0.5])
+        self.assertEqual(mock_request.call_count, 2)
+
+    @mock.patch("time.monotonic")
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_watch_finished_at_timeout(self, mock_request, mock_sleep, mock_monotonic):
+        self.mock_clock(mock_monotonic, mock_sleep)
+        mock_request.side_effect = [
+            self.mock_response(mock_jobs_response([("j1", "active")])),
+            self.mock_response(mock_jobs_response([("j1", "finished")])),
+        ]
+        events = list(self.endpoints.watch(["j1"], poll_interval=1, timeout=0.5))
+        self.assertEqual(events[-1]["status"], "finished")
+
+    def mock_storage(self, **kwargs):
+        if kwargs["url"].endswith("/files"):
+            return self.mock_response(json.dumps({"status": "success", "data": JOB_FILES}))
+        content = JOB_FILE_CONTENTS[kwargs["url"]]
+        range_ = (kwargs.get("headers") or {}).get("Range")
+        offset = int(range_[len("bytes="):-1]) if range_ else 0
+        if range_ and offset >= len(content):
+            response = self.mock_response("", 416)
+            response.raw = io.BytesIO(b"")
+            return response
+        response = self.mock_response("", 206 if range_ else 200)
+        response.raw = io.BytesIO(content[offset:])
+        return response
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_download_files(self, mock_request):
+        mock_request.side_effect = self.mock_storage
+        with tempfile.TemporaryDirectory() as tmp:
+            batch = self.endpoints.download_files("job", tmp, patterns=["*.out"])
+            self.assertEqual(batch.results, {"outdir/pw.out": os.path.join(tmp, "outdir", "pw.out")})
+            with open(batch.results["outdir/pw.out"], "rb") as f:
+                self.assertEqual(f.read(), b"0123456789")
+
+            mock_request.reset_mock()
+            batch = self.endpoints.download_files("job", tmp)
+            self.assertTrue(batch.ok)
+            self.assertEqual(sorted(batch.results), ["outdir/pw.out", "pw.in"])
+            downloaded = [call[1]["url"] for call in mock_request.call_args_list if call[1].get("stream")]
+            self.assertEqual(downloaded, ["https://storage/pw.in"])
+
+    def write_partial_file(self, dest, content, last_modified=2):
+        """Leaves behind an interrupted download of outdir/pw.out of the given remote version."""
+        os.makedirs(os.path.join(dest, "outdir"))
+        with open(os.path.join(dest, "outdir", "pw.out.part"), "wb") as f:
+            f.write(content)
+        Checkpoint(os.path.join(dest, MANIFEST_FILENAME)).save(
+            "outdir/pw.out", {"size": 10, "lastModified": last_modified, "complete": False})
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_download_files_resumes_partial_file(self, mock_request):
+        mock_request.side_effect = self.mock_storage
+        with tempfile.TemporaryDirectory() as tmp:
+            self.write_partial_file(tmp, b"0123")
+            batch = self.endpoints.download_files("job", tmp, patterns=["*.out"])
+            with open(batch.results["outdir/pw.out"], "rb") as f:
+                self.assertEqual(f.read(), b"0123456789")
+        self.assertEqual(mock_request.call_args[1]["headers"], {"Accept-Encoding": "identity", "Range": "bytes=4-"})
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_download_files_completes_or_restarts_partial_file(self, mock_request):
+        mock_request.side_effect = self.mock_storage
+        with tempfile.TemporaryDirectory() as tmp:
+            self.write_partial_file(tmp, b"0123456789")
+            batch = self.endpoints.download_files("job", tmp, patterns=["*.out"])
+            self.assertTrue(batch.ok)
+            self.assertFalse([call for call in mock_request.call_args_list if call[1].get("stream")])
+
+            path = os.path.join(tmp, "pw.in")
+            with open(path + ".part", "wb") as f:
+                f.write(b"stale input")
+            download_file(requests.Session(), "https://storage/pw.in", path)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"input\n")
+        self.assertEqual([call[1]["headers"] for call in mock_request.call_args_list[-2:]],
+                         [{"Accept-Encoding": "identity", "Range": "bytes=11-"}, {"Accept-Encoding": "identity"}])
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_download_files_discards_partial_file_of_changed_file(self, mock_request):
+        mock_request.side_effect = self.mock_storage
+        with tempfile.TemporaryDirectory() as tmp:
+            self.write_partial_file(tmp, b"abcdefghij", last_modified=1)
+            batch = self.endpoints.download_files("job", tmp, patterns=["*.out"])
+            with open(batch.results["outdir/pw.out"], "rb") as f:
+                self.assertEqual(f.read(), b"0123456789")
+        self.assertEqual(mock_request.call_args[1]["headers"], {"Accept-Encoding": "identity"})
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_upload_files(self, mock_request, mock_sleep):
+        uploads = []
+
+        def respond(**kwargs):
+            if kwargs["url"].endswith("/presigned-urls"):
+                files = json.loads(kwargs["data"])["files"]
+                urls = [{"file": name, "URL": f"https://storage/{name}"} for name in files]
+                return self.mock_response(json.dumps({"status": "success", "data": {"presignedURLs": urls}}))
+            if kwargs["method"] == "PUT":
+                uploads.append((kwargs["url"], kwargs["data"].read()))
+                return self.mock_response("", HTTP_STATUS_SERVICE_UNAVAILABLE if len(uploads) == 1 else 200)
+            return self.mock_response(json.dumps({"status": "success", "data": {}}))
+
+        mock_request.side_effect = respond
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "pseudo"))
+            paths = [os.path.join(tmp, "pw.in"), os.path.join(tmp, "pseudo", "Si.upf")]
+            for path in paths:
+                with open(path, "w") as f:
+                    f.write(os.path.basename(path))
+            batch = self.endpoints.upload_files("job", paths, root=tmp, workers=1, batch_size=1)
+
+        self.assertTrue(batch.ok)
+        self.assertEqual(sorted(batch.results), ["pseudo/Si.upf", "pw.in"])
+        self.assertEqual(sorted(set(uploads)), [("https://storage/pseudo/Si.upf", b"Si.upf"),
+                                                ("https://storage/pw.in", b"pw.in")])
+        mock_sleep.assert_called_once_with(1)
+        self.assertTrue(mock_request.call_args[1]["url"].endswith("/jobs/job/output-files"))
+        self.assertEqual(sorted(json.loads(mock_request.call_args[1]["data"])["files"]), ["pseudo/Si.upf", "pw.in"])
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.sessions.Session.request")
+    def test_upload_files_keeps_directories_and_fails_on_client_errors(self, mock_request, mock_sleep):
+        def respond(**kwargs):
+            if kwargs["url"].endswith("/presigned-urls"):
+                files = json.loads(kwargs["data"])["files"]
+                urls = [{"file": name, "URL": f"https://storage/{name}"} for name in files]
+                return self.mock_response(json.dumps({"status": "success", "data": {"presignedURLs": urls}}))
+            return self.mock_response("", HTTP_STATUS_FORBIDDEN)
+
+        mock_request.side_effect = respond
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, "a", "INCAR"), os.path.join(tmp, "b", "INCAR")]
+            for path in paths:
+                os.makedirs(os.path.dirname(path))
+                with open(path, "w") as f:
+                    f.write("ENCUT = 400")
+            batch = self.endpoints.upload_files("job", paths, workers=1)
+
+        self.assertEqual(sorted(batch.errors), ["a/INCAR", "b/INCAR"])
+        self.assertEqual(len([call for call in mock_request.call_args_list if call[1]["method"] == "PUT"]), 2)
+        mock_sleep.assert_not_called()
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_create_by_ids_deadline(self, mock_request):
+        mock_request.side_effect = self.mock_create
+        materials = [material for material in MATERIALS if material["_id"] != FAILING_MATERIAL_ID]
+        jobs = self.endpoints.create_by_ids(materials, "workflow", "project", "prefix", deadline=30)
+        self.assertEqual(len(jobs), len(materials))
+        self.assertLessEqual(mock_request.call_args[1]["timeout"], 30)
+        with self.assertRaises(TimeoutError):
+            self.endpoints.create_by_ids(materials, "workflow", "project", "prefix", deadline=0)
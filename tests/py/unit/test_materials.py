@@ -1,7 +1,7 @@
 from unittest import mock
 
 from mat3ra.api_client.endpoints.materials import MaterialEndpoints
-from tests.py.unit.entity import EntityEndpointsUnitTest
+from tests.py.unit.entity import EntityEndpointsUnitTest, mock_list_response
 
 ENDPOINT_NAME = "materials"
 
@@ -20,6 +20,26 @@ class EndpointMaterialsUnitTest(EntityEndpointsUnitTest):
     def test_list(self, mock_request):
         self.list(mock_request)
 
+    @mock.patch("requests.sessions.Session.request")
+    def test_iter_list(self, mock_request):
+        self.iter_list(mock_request)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_iter_list_sorted(self, mock_request):
+        self.iter_list_sorted(mock_request)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_count(self, mock_request):
+        self.count(mock_request)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_list_with_preset(self, mock_request):
+        self.list_with_preset(mock_request)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_get_many(self, mock_request):
+        self.get_many(mock_request)
+
     @mock.patch("requests.sessions.Session.request")
     def test_get(self, mock_request):
         self.get(mock_request)
@@ -31,3 +51,11 @@ class EndpointMaterialsUnitTest(EntityEndpointsUnitTest):
     @mock.patch("requests.sessions.Session.request")
     def test_delete(self, mock_request):
         self.create(mock_request)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_orjson_backend(self, mock_request):
+        endpoints = MaterialEndpoints(self.host, self.port, self.account_id, self.auth_token, json_backend="orjson")
+        mock_request.return_value = self.mock_response(mock_list_response([{"_id": "id", "name": "Si"}]))
+        self.assertEqual(endpoints.list(), [{"_id": "id", "name": "Si"}])
+        with self.assertRaises(ValueError):
+            MaterialEndpoints(self.host, self.port, self.account_id, self.auth_token, json_backend="yaml")
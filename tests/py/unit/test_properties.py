@@ -1,6 +1,7 @@
 import json
 from unittest import mock
 
+import pytest
 from mat3ra.api_client.endpoints.properties import PropertiesEndpoints
 from tests.py.unit.entity import EntityEndpointsUnitTest
 
@@ -21,6 +22,13 @@ MOCK_PROPERTY_1 = {
     "source": {"info": {"jobId": JOB_ID, "unitId": UNIT_ID_1}},
 }
 
+JOB_ID_2 = "ukmnfWw9Q5ryXHK4Y"
+MOCK_PROPERTY_2 = {
+    "data": {"name": PROPERTY_NAME_1, "values": [{"type": "indirect", "value": 1.1, "units": "eV"}]},
+    "source": {"info": {"jobId": JOB_ID_2, "unitId": UNIT_ID_1}},
+}
+MISSING_JOB_ID = "missing"
+
 MOCK_PROPERTIES_RESPONSE = json.dumps({"status": "success", "data": [MOCK_PROPERTY_0, MOCK_PROPERTY_1]})
 MOCK_SINGLE_PROPERTY_RESPONSE = json.dumps({"status": "success", "data": [MOCK_PROPERTY_1]})
 
@@ -54,6 +62,8 @@ class EndpointCharacteristicUnitTest(EntityEndpointsUnitTest):
         ])
         sent_query = json.loads(mock_request.call_args[1]["params"]["query"])
         self.assertEqual(sent_query["source.info.jobId"], JOB_ID)
+        sent_projection = json.loads(mock_request.call_args[1]["params"]["projection"])
+        self.assertEqual(sent_projection, {"fields": {"_id": 1, "data.name": 1, "source.info": 1}})
 
     @mock.patch("requests.sessions.Session.request")
     def test_get_for_job(self, mock_request):
@@ -64,6 +74,8 @@ class EndpointCharacteristicUnitTest(EntityEndpointsUnitTest):
         self.assertEqual(sent_query["source.info.jobId"], JOB_ID)
         self.assertNotIn("data.name", sent_query)
         self.assertNotIn("source.info.unitId", sent_query)
+        sent_projection = json.loads(mock_request.call_args[1]["params"]["projection"])
+        self.assertEqual(sent_projection, {"fields": {"data": 1}})
 
     @mock.patch("requests.sessions.Session.request")
     def test_get_for_job_filtered_by_name(self, mock_request):
@@ -84,3 +96,41 @@ class EndpointCharacteristicUnitTest(EntityEndpointsUnitTest):
         sent_query = json.loads(mock_request.call_args[1]["params"]["query"])
         self.assertEqual(sent_query["source.info.unitId"], UNIT_ID_1)
         self.assertEqual(sent_query["data.name"], PROPERTY_NAME_1)
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_to_frame(self, mock_request):
+        np = pytest.importorskip("numpy")
+
+        def respond(**kwargs):
+            job_ids = json.loads(kwargs["params"]["query"])["source.info.jobId"]["$in"]
+            properties = [p for p in (MOCK_PROPERTY_0, MOCK_PROPERTY_1, MOCK_PROPERTY_2)
+                          if p["source"]["info"]["jobId"] in job_ids]
+            return self.mock_response(json.dumps({"status": "success", "data": properties}))
+
+        mock_request.side_effect = respond
+        frame = self.endpoints.to_frame([JOB_ID, MISSING_JOB_ID, JOB_ID_2], [PROPERTY_NAME_0, PROPERTY_NAME_1],
+                                        chunk_size=2)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(list(frame["job_id"]), [JOB_ID, MISSING_JOB_ID, JOB_ID_2])
+        np.testing.assert_array_equal(frame[PROPERTY_NAME_0], [-260.698, np.nan, np.nan])
+        np.testing.assert_array_equal(frame["band_gaps.direct"], [0.5, np.nan, np.nan])
+        np.testing.assert_array_equal(frame["band_gaps.indirect"], [np.nan, np.nan, 1.1])
+        sent_query = json.loads(mock_request.call_args[1]["params"]["query"])
+        self.assertEqual(sent_query["data.name"], {"$in": [PROPERTY_NAME_0, PROPERTY_NAME_1]})
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_get_band_gaps(self, mock_request):
+        band_gaps = [MOCK_PROPERTY_1, MOCK_PROPERTY_2]
+        mock_request.return_value = self.mock_response(json.dumps({"status": "success", "data": band_gaps}))
+        result = self.endpoints.get_band_gaps([JOB_ID, JOB_ID_2, MISSING_JOB_ID], UNIT_ID_1)
+        self.assertEqual(result, {
+            JOB_ID: {"direct": 0.5, "indirect": None},
+            JOB_ID_2: {"direct": None, "indirect": 1.1},
+            MISSING_JOB_ID: None,
+        })
+        self.assertEqual(mock_request.call_count, 1)
+        sent_query = json.loads(mock_request.call_args[1]["params"]["query"])
+        self.assertEqual(sent_query["source.info.unitId"], UNIT_ID_1)
+        self.assertEqual(sent_query["data.name"], {"$in": [PROPERTY_NAME_1]})
+        with self.assertRaises(ValueError):
+            self.endpoints.get_band_gaps([JOB_ID, MISSING_JOB_ID], UNIT_ID_1, raise_missing=True)
@@ -0,0 +1,79 @@
+import io
+import json
+from unittest import mock
+
+from mat3ra.api_client.endpoints.materials import MaterialEndpoints
+from mat3ra.api_client.utils.streaming import JSENDStreamParser, iter_jsend_data
+from tests.py.unit import EndpointBaseUnitTest
+
+ENTITIES = [{"_id": str(i), "name": "Si", "tags": ["é", "\"quoted\""], "energy": -1.5e3 * i} for i in range(50)]
+SUCCESS_RESPONSE = json.dumps({"status": "success", "data": ENTITIES}, indent=2).encode()
+ERROR_RESPONSE = json.dumps({"status": "error", "data": {"message": "Forbidden"}}).encode()
+CHUNK_SIZES = (1, 3, 64, len(SUCCESS_RESPONSE))
+
+
+def split(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class StreamingUnitTest(EndpointBaseUnitTest):
+    """
+    Class for testing incremental parsing of list responses.
+    """
+
+    def test_chunk_boundaries(self):
+        for size in CHUNK_SIZES:
+            parser = JSENDStreamParser()
+            self.assertEqual(list(iter_jsend_data(split(SUCCESS_RESPONSE, size), parser)), ENTITIES)
+            self.assertEqual(parser.envelope, {"status": "success"})
+
+    def test_items_yielded_before_end_of_body(self):
+        parser = JSENDStreamParser()
+        items = parser.feed(SUCCESS_RESPONSE[:len(SUCCESS_RESPONSE) // 2])
+        self.assertGreater(len(items), 0)
+        self.assertEqual(items, ENTITIES[:len(items)])
+
+    def test_number_split_between_chunks(self):
+        self.assertEqual(list(iter_jsend_data([b'{"data": [12', b'34, 5', b"6]}"])), [1234, 56])
+        self.assertEqual(list(iter_jsend_data([b'{"status":"success","data":[1.', b"5]}"])), [1.5])
+        self.assertEqual(list(iter_jsend_data([b'{"status":"success","data":[1.5e', b"-3]}"])), [1.5e-3])
+
+    def test_numbers_split_at_every_position(self):
+        numbers = [1.5, -0.25, 1.5e-3, -2e10, 0, 42, 3.0e+5]
+        body = b'{"status": "success", "data": [1.5, -0.25, 1.5e-3, -2E10, 0, 42,3.0e+5], "total": -7.5}'
+        for position in range(1, len(body)):
+            parser = JSENDStreamParser()
+            self.assertEqual(list(iter_jsend_data([body[:position], body[position:]], parser)), numbers)
+            self.assertEqual(parser.envelope, {"status": "success", "total": -7.5})
+
+    def test_error_envelope(self):
+        parser = JSENDStreamParser()
+        self.assertEqual(list(iter_jsend_data(split(ERROR_RESPONSE, 5), parser)), [])
+        self.assertEqual(parser.envelope["data"], {"message": "Forbidden"})
+
+    def test_malformed_body(self):
+        for body in (SUCCESS_RESPONSE[:-5], b'{"data": [1 2]}', b"[]", b'{"data": [1,]}', b'{"data": [1.]}',
+                     b'{"data": [1.5x]}', b'{"data": [], }', b'{"data": [1]'):
+            with self.assertRaises(ValueError):
+                list(iter_jsend_data(split(body, 4)))
+
+    def stream_response(self, body):
+        response = self.mock_response("")
+        response._content = False
+        response.raw = io.BytesIO(body)
+        return response
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_stream_list(self, mock_request):
+        mock_request.return_value = self.stream_response(SUCCESS_RESPONSE)
+        endpoints = MaterialEndpoints(self.host, self.port, self.account_id, self.auth_token)
+        self.assertEqual(list(endpoints.stream_list({"name": "Si"}, "ids", chunk_size=16)), ENTITIES)
+        self.assertTrue(mock_request.call_args[1]["stream"])
+        self.assertEqual(json.loads(mock_request.call_args[1]["params"]["projection"]), {"fields": {"_id": 1}})
+
+    @mock.patch("requests.sessions.Session.request")
+    def test_stream_list_error(self, mock_request):
+        mock_request.return_value = self.stream_response(ERROR_RESPONSE)
+        endpoints = MaterialEndpoints(self.host, self.port, self.account_id, self.auth_token)
+        with self.assertRaisesRegex(BaseException, "Forbidden"):
+            list(endpoints.stream_list())
@@ -0,0 +1,55 @@
+import csv
+import os
+import tempfile
+
+import numpy as np
+import pyarrow.feather
+import pyarrow.parquet
+from mat3ra.api_client.utils.frames import write_arrow, write_csv, write_parquet
+from mat3ra.api_client.utils.materials import MATERIAL_COLUMNS, flatten_material, flatten_materials
+from tests.py.unit import EndpointBaseUnitTest
+
+LATTICE = {"a": 3.87, "b": 3.87, "c": 3.87, "alpha": 60.0, "beta": 60.0, "gamma": 60.0}
+MATERIALS = [
+    {"_id": "m1", "name": "Si", "tags": ["semiconductor", "cubic"], "basis": {"coordinates": [{}, {}]},
+     "lattice": LATTICE},
+    {"_id": "m2", "name": "Ge", "tags": [], "basis": {"coordinates": [{}]}, "lattice": dict(LATTICE, a=4.0)},
+]
+
+
+class TabularUnitTest(EndpointBaseUnitTest):
+    """
+    Class for testing flattening of materials into columns and their export.
+    """
+
+    def setUp(self):
+        super(TabularUnitTest, self).setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_flatten_materials_matches_flatten_material(self):
+        columns = flatten_materials(iter(MATERIALS))
+        self.assertEqual(tuple(columns), MATERIAL_COLUMNS)
+        rows = [list(row) for row in zip(*(column.tolist() for column in columns.values()))]
+        self.assertEqual(rows, [flatten_material(material) for material in MATERIALS])
+        self.assertEqual(columns["atoms"].dtype, np.int64)
+        self.assertEqual(columns["a"].dtype, np.float64)
+
+    def test_flatten_no_materials(self):
+        columns = flatten_materials([])
+        self.assertEqual(len(columns["_id"]), 0)
+        self.assertEqual(len(columns["gamma"]), 0)
+
+    def test_export(self):
+        columns = flatten_materials(MATERIALS)
+        csv_path, parquet_path, arrow_path = (os.path.join(self.tmp_dir.name, f"materials.{extension}")
+                                              for extension in ("csv", "parquet", "arrow"))
+        write_csv(columns, csv_path)
+        with open(csv_path, newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], list(MATERIAL_COLUMNS))
+        self.assertEqual(rows[1][:4], ["m1", "Si", "semiconductor, cubic", "2"])
+        write_parquet(columns, parquet_path)
+        self.assertEqual(pyarrow.parquet.read_table(parquet_path).column("a").to_pylist(), [3.87, 4.0])
+        write_arrow(columns, arrow_path)
+        self.assertEqual(pyarrow.feather.read_table(arrow_path).column("_id").to_pylist(), ["m1", "m2"])
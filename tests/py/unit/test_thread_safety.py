@@ -0,0 +1,76 @@
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from mat3ra.api_client import APIClient
+from mat3ra.api_client.endpoints.materials import MaterialEndpoints
+from tests.py.unit import EndpointBaseUnitTest
+
+API_VERSION = "2018-10-01"
+THREADS = 32
+REQUESTS_PER_THREAD = 10
+MAX_DELAY = 0.002
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET /api/<version>/materials/<id> with the requested material after a random delay, so that responses
+    of concurrent requests interleave.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(random.uniform(0, MAX_DELAY))
+        body = json.dumps({"status": "success", "data": {"_id": self.path.rsplit("/", 1)[-1]}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ThreadSafetyUnitTest(EndpointBaseUnitTest):
+    """
+    Class for testing that a single endpoint instance can be shared by many threads.
+    """
+
+    def setUp(self):
+        super(ThreadSafetyUnitTest, self).setUp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def hammer(self, endpoint):
+        def worker(thread_id):
+            mismatches = []
+            for i in range(REQUESTS_PER_THREAD):
+                id_ = f"{thread_id}-{i}"
+                result = endpoint.get(id_)
+                if result["_id"] != id_ or endpoint.conn.response.json()["data"]["_id"] != id_:
+                    mismatches.append(id_)
+            return mismatches
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            mismatches = [id_ for result in executor.map(worker, range(THREADS)) for id_ in result]
+        self.assertEqual(mismatches, [])
+
+    def test_shared_endpoint_with_private_session(self):
+        port = self.server.server_address[1]
+        self.hammer(MaterialEndpoints("127.0.0.1", port, self.account_id, self.auth_token, API_VERSION, secure=False))
+
+    def test_shared_client(self):
+        env = {"OIDC_ACCESS_TOKEN": "token", "API_HOST": "127.0.0.1", "API_PORT": str(self.server.server_address[1]),
+               "API_VERSION": API_VERSION, "API_SECURE": "false"}
+        with mock.patch.dict("os.environ", env, clear=True):
+            with APIClient.authenticate(pool_maxsize=THREADS) as client:
+                self.hammer(client.materials)